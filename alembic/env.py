@@ -2,19 +2,26 @@ import os
 import sys
 from logging.config import fileConfig
 
+from dotenv import load_dotenv
 from sqlalchemy import engine_from_config, pool
 
 from alembic import context
 
 # ensure app package is importable
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+# DATABASE_URL from .env when run from the alembic CLI
+load_dotenv()
 
 # this is the Alembic Config object, which provides
 # access to the values within the .ini file in use.
 config = context.config
 
-# Interpret the config file for Python logging.
-if config.config_file_name is not None:
+# Connection passed in by the in-process readiness routine, if any
+shared_connection = config.attributes.get('connection')
+
+# Interpret the config file for Python logging (not when embedded in the app,
+# whose logging is already configured)
+if config.config_file_name is not None and shared_connection is None:
     fileConfig(config.config_file_name)
 
 from app.infrastructure.database.base import Base
@@ -34,6 +41,7 @@ def run_migrations_offline():
         target_metadata=target_metadata,
         literal_binds=True,
         dialect_opts={"paramstyle": "named"},
+        transaction_per_migration=True,
     )
 
     with context.begin_transaction():
@@ -41,6 +49,19 @@ def run_migrations_offline():
 
 
 def run_migrations_online():
+    # Una transacción por migración: las que crean índices con CONCURRENTLY
+    # confirman la transacción en curso al entrar en su autocommit_block
+    if shared_connection is not None:
+        context.configure(
+            connection=shared_connection,
+            target_metadata=target_metadata,
+            transaction_per_migration=True,
+        )
+
+        with context.begin_transaction():
+            context.run_migrations()
+        return
+
     configuration = config.get_section(config.config_ini_section)
     configuration['sqlalchemy.url'] = get_url()
 
@@ -51,7 +72,11 @@ def run_migrations_online():
     )
 
     with connectable.connect() as connection:
-        context.configure(connection=connection, target_metadata=target_metadata)
+        context.configure(
+            connection=connection,
+            target_metadata=target_metadata,
+            transaction_per_migration=True,
+        )
 
         with context.begin_transaction():
             context.run_migrations()
@@ -0,0 +1,35 @@
+"""add composite index for keyset pagination on items
+
+Revision ID: 0004_add_items_keyset_index
+Revises: 0003_create_users_table
+Create Date: 2026-10-18
+
+En PostgreSQL el índice se crea con CREATE INDEX CONCURRENTLY, fuera de la
+transacción de la migración, para no bloquear las escrituras en items
+mientras se construye. Si la construcción falla queda un índice INVALID:
+hay que borrarlo (DROP INDEX CONCURRENTLY) antes de reintentar.
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '0004_add_items_keyset_index'
+down_revision = '0003_create_users_table'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Index para paginación por cursor ordenada por (creation_date, id)
+    if op.get_context().dialect.name == 'postgresql':
+        with op.get_context().autocommit_block():
+            op.create_index('ix_items_creation_date_id', 'items', ['creation_date', 'id'], postgresql_concurrently=True)
+    else:
+        op.create_index('ix_items_creation_date_id', 'items', ['creation_date', 'id'])
+
+
+def downgrade() -> None:
+    if op.get_context().dialect.name == 'postgresql':
+        with op.get_context().autocommit_block():
+            op.drop_index('ix_items_creation_date_id', table_name='items', postgresql_concurrently=True)
+    else:
+        op.drop_index('ix_items_creation_date_id', table_name='items')
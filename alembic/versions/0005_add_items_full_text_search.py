@@ -0,0 +1,72 @@
+"""add full-text search GIN index to items
+
+Revision ID: 0005_add_items_full_text_search
+Revises: 0004_add_items_keyset_index
+Create Date: 2026-10-18
+
+Índice GIN de expresión sobre el tsvector de name y description, en lugar
+de una columna generada STORED: añadir esa columna reescribe la tabla
+entera bajo un bloqueo ACCESS EXCLUSIVE. El índice se crea con CREATE INDEX
+CONCURRENTLY, fuera de la transacción de la migración, sin bloquear las
+escrituras. Si la construcción falla queda un índice INVALID: hay que
+borrarlo (DROP INDEX CONCURRENTLY) antes de reintentar.
+
+Las consultas deben usar exactamente la misma expresión para que el
+planificador use el índice (``SEARCH_VECTOR_SQL`` en el repositorio).
+
+En SQLite se crea la tabla FTS5 ``items_fts`` con los triggers que la
+sincronizan con ``items`` (la misma DDL que ``create_all`` en el modelo) y
+se indexan los items existentes.
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '0005_add_items_full_text_search'
+down_revision = '0004_add_items_keyset_index'
+branch_labels = None
+depends_on = None
+
+SEARCH_VECTOR = "to_tsvector('simple', coalesce(name, '') || ' ' || coalesce(description, ''))"
+
+SQLITE_FTS_DDL = [
+    "CREATE VIRTUAL TABLE items_fts USING fts5("
+    "name, description, content='items', content_rowid='id')",
+    "CREATE TRIGGER items_fts_ai AFTER INSERT ON items BEGIN "
+    "INSERT INTO items_fts(rowid, name, description) VALUES (new.id, new.name, new.description); END",
+    "CREATE TRIGGER items_fts_ad AFTER DELETE ON items BEGIN "
+    "INSERT INTO items_fts(items_fts, rowid, name, description) "
+    "VALUES ('delete', old.id, old.name, old.description); END",
+    "CREATE TRIGGER items_fts_au AFTER UPDATE ON items BEGIN "
+    "INSERT INTO items_fts(items_fts, rowid, name, description) "
+    "VALUES ('delete', old.id, old.name, old.description); "
+    "INSERT INTO items_fts(rowid, name, description) VALUES (new.id, new.name, new.description); END",
+    # Indexa las filas que ya había en items
+    "INSERT INTO items_fts(items_fts) VALUES ('rebuild')",
+]
+
+
+def upgrade() -> None:
+    dialect = op.get_context().dialect.name
+    if dialect == 'sqlite':
+        for statement in SQLITE_FTS_DDL:
+            op.execute(statement)
+        return
+    if dialect != 'postgresql':
+        return
+    with op.get_context().autocommit_block():
+        op.execute(
+            f"CREATE INDEX CONCURRENTLY ix_items_search_vector ON items USING GIN (({SEARCH_VECTOR}))"
+        )
+
+
+def downgrade() -> None:
+    dialect = op.get_context().dialect.name
+    if dialect == 'sqlite':
+        for trigger in ('items_fts_au', 'items_fts_ad', 'items_fts_ai'):
+            op.execute(f"DROP TRIGGER IF EXISTS {trigger}")
+        op.execute("DROP TABLE IF EXISTS items_fts")
+        return
+    if dialect != 'postgresql':
+        return
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_items_search_vector")
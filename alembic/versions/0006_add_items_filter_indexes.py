@@ -0,0 +1,47 @@
+"""add indexes for filtered and sorted item listings
+
+Revision ID: 0006_add_items_filter_indexes
+Revises: 0005_add_items_full_text_search
+Create Date: 2026-10-18
+
+En PostgreSQL los índices se crean con CREATE INDEX CONCURRENTLY, fuera de
+la transacción de la migración, para no bloquear las escrituras en items
+mientras se construyen. Si una construcción falla queda un índice INVALID:
+hay que borrarlo (DROP INDEX CONCURRENTLY) antes de reintentar.
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '0006_add_items_filter_indexes'
+down_revision = '0005_add_items_full_text_search'
+branch_labels = None
+depends_on = None
+
+
+INDEXES = [
+    # Índice que el modelo declara en items.name y 0001 no llegó a crear
+    ('ix_items_name', ['name']),
+    # "Tickets de un estado / de un usuario, más recientes primero"
+    ('ix_items_status_id_creation_date', ['status_id', 'creation_date']),
+    ('ix_items_reported_user_creation_date', ['reported_user', 'creation_date']),
+]
+
+
+def upgrade() -> None:
+    if op.get_context().dialect.name == 'postgresql':
+        with op.get_context().autocommit_block():
+            for name, columns in INDEXES:
+                op.create_index(name, 'items', columns, postgresql_concurrently=True)
+    else:
+        for name, columns in INDEXES:
+            op.create_index(name, 'items', columns)
+
+
+def downgrade() -> None:
+    if op.get_context().dialect.name == 'postgresql':
+        with op.get_context().autocommit_block():
+            for name, _ in reversed(INDEXES):
+                op.drop_index(name, table_name='items', postgresql_concurrently=True)
+    else:
+        for name, _ in reversed(INDEXES):
+            op.drop_index(name, table_name='items')
@@ -0,0 +1,37 @@
+"""create item_counters table for incremental item statistics
+
+Revision ID: 0007_create_item_counters
+Revises: 0006_add_items_filter_indexes
+Create Date: 2026-10-18
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '0007_create_item_counters'
+down_revision = '0006_add_items_filter_indexes'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'item_counters',
+        sa.Column('dimension', sa.String(length=16), primary_key=True),
+        sa.Column('label', sa.String(length=128), primary_key=True),
+        sa.Column('item_count', sa.Integer, nullable=False, server_default='0'),
+    )
+    # Contadores iniciales a partir de los items existentes
+    op.execute(
+        "INSERT INTO item_counters (dimension, label, item_count) "
+        "SELECT 'status', CAST(status_id AS VARCHAR(128)), COUNT(*) FROM items GROUP BY status_id"
+    )
+    op.execute(
+        "INSERT INTO item_counters (dimension, label, item_count) "
+        "SELECT 'reporter', COALESCE(reported_user, ''), COUNT(*) FROM items "
+        "GROUP BY COALESCE(reported_user, '')"
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('item_counters')
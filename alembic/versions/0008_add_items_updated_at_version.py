@@ -0,0 +1,47 @@
+"""add updated_at and version to items for conditional requests
+
+Revision ID: 0008_add_items_updated_at_version
+Revises: 0007_create_item_counters
+Create Date: 2026-10-18
+
+Las columnas se añaden con un valor por defecto no volátil, sin reescribir
+la tabla. En PostgreSQL el relleno de ``updated_at`` se hace por tramos de
+``BACKFILL_BATCH_SIZE`` ids, cada uno en su propia transacción, para no
+mantener bloqueadas todas las filas de items (ni generar toda la tabla de
+versiones muertas) en una sola transacción.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '0008_add_items_updated_at_version'
+down_revision = '0007_create_item_counters'
+branch_labels = None
+depends_on = None
+
+BACKFILL_BATCH_SIZE = 10000
+
+# Los items existentes no han cambiado desde su creación
+BACKFILL = "UPDATE items SET updated_at = creation_date"
+
+
+def upgrade() -> None:
+    op.add_column('items', sa.Column('updated_at', sa.DateTime, nullable=False, server_default=sa.func.now()))
+    op.add_column('items', sa.Column('version', sa.Integer, nullable=False, server_default='1'))
+    context = op.get_context()
+    if context.dialect.name != 'postgresql' or context.as_sql:
+        op.execute(BACKFILL)
+        return
+    with context.autocommit_block():
+        connection = op.get_bind()
+        max_id = connection.execute(sa.text("SELECT coalesce(max(id), 0) FROM items")).scalar()
+        for start in range(0, max_id, BACKFILL_BATCH_SIZE):
+            connection.execute(
+                sa.text(f"{BACKFILL} WHERE id > :start AND id <= :end"),
+                {"start": start, "end": start + BACKFILL_BATCH_SIZE},
+            )
+
+
+def downgrade() -> None:
+    op.drop_column('items', 'version')
+    op.drop_column('items', 'updated_at')
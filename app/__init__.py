@@ -1,5 +1 @@
 """Aplicación de sistema de tickets."""
-from .interfaces.api.main import app
-
-__all__ = ["app"]
-
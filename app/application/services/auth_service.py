@@ -2,8 +2,14 @@
 from typing import Optional
 from datetime import timedelta
 from app.domain.repositories.user_repository import UserRepository
+from app.domain.repositories.async_user_repository import AsyncUserRepository
 from app.domain.entities.user import User
-from app.infrastructure.security.password_handler import verify_password, get_password_hash
+from app.infrastructure.security.password_handler import (
+    verify_and_update_password,
+    verify_and_update_password_async,
+    get_password_hash,
+    get_password_hash_async,
+)
 from app.infrastructure.security.jwt_handler import create_access_token, ACCESS_TOKEN_EXPIRE_MINUTES
 
 
@@ -21,22 +27,78 @@ class AuthService:
         """
         Autentica un usuario por email y contraseña.
         
+        Si el hash almacenado usa un coste de bcrypt distinto al configurado
+        se sustituye por uno nuevo aprovechando la contraseña en claro.
+        
         Returns:
             Usuario si las credenciales son válidas, None en caso contrario
+        
+        Raises:
+            HashingPoolSaturated: Si el pool de hashing está lleno
         """
         user = self.user_repository.get_by_email(email)
-        if not user or not verify_password(password, user.hashed_password):
+        if not user:
+            return None
+        valid, new_hash = verify_and_update_password(password, user.hashed_password)
+        if not valid:
             return None
+        if new_hash:
+            user.hashed_password = new_hash
+            user = self.user_repository.update(user)
         return user
     
     def create_access_token_for_user(self, user: User) -> str:
         """Crea un token de acceso para un usuario."""
-        return create_access_token(
-            data={"sub": user.email, "role": user.role},
-            expires_delta=timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
-        )
+        return _access_token_for(user)
     
     def hash_password(self, password: str) -> str:
         """Genera hash de contraseña."""
         return get_password_hash(password)
 
+
+def _access_token_for(user: User) -> str:
+    """Token de acceso con el email y el rol del usuario."""
+    return create_access_token(
+        data={"sub": user.email, "role": user.role},
+        expires_delta=timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
+    )
+
+
+class AsyncAuthService:
+    """
+    Variante asíncrona de ``AuthService``: usa un repositorio asíncrono y
+    bcrypt se espera en el bucle de eventos, de modo que ningún hilo queda
+    bloqueado por el hash.
+    """
+    
+    def __init__(self, user_repository: AsyncUserRepository):
+        self.user_repository = user_repository
+    
+    async def authenticate_user(self, email: str, password: str) -> Optional[User]:
+        """
+        Autentica un usuario por email y contraseña (ver ``AuthService.authenticate_user``).
+        
+        Returns:
+            Usuario si las credenciales son válidas, None en caso contrario
+        
+        Raises:
+            HashingPoolSaturated: Si el pool de hashing está lleno
+        """
+        user = await self.user_repository.get_by_email(email)
+        if not user:
+            return None
+        valid, new_hash = await verify_and_update_password_async(password, user.hashed_password)
+        if not valid:
+            return None
+        if new_hash:
+            user.hashed_password = new_hash
+            user = await self.user_repository.update(user)
+        return user
+    
+    def create_access_token_for_user(self, user: User) -> str:
+        """Crea un token de acceso para un usuario."""
+        return _access_token_for(user)
+    
+    async def hash_password(self, password: str) -> str:
+        """Genera hash de contraseña."""
+        return await get_password_hash_async(password)
@@ -1,6 +1,6 @@
 """Caso de uso: Login de usuario."""
 from app.domain.repositories.user_repository import UserRepository
-from app.application.services.auth_service import AuthService
+from app.application.services.auth_service import AuthService, AsyncAuthService
 from app.interfaces.schemas.user_schemas import Token
 
 
@@ -25,3 +25,23 @@ class LoginUserUseCase:
         access_token = self.auth_service.create_access_token_for_user(user)
         return Token(access_token=access_token, token_type="bearer")
 
+
+class AsyncLoginUserUseCase:
+    """Variante asíncrona de ``LoginUserUseCase``."""
+    
+    def __init__(self, auth_service: AsyncAuthService):
+        self.auth_service = auth_service
+    
+    async def execute(self, email: str, password: str) -> Token:
+        """
+        Autentica un usuario y retorna un token.
+        
+        Raises:
+            ValueError: Si las credenciales son inválidas
+        """
+        user = await self.auth_service.authenticate_user(email, password)
+        if not user:
+            raise ValueError("Email o contraseña incorrectos")
+        
+        access_token = self.auth_service.create_access_token_for_user(user)
+        return Token(access_token=access_token, token_type="bearer")
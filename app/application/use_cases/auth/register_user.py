@@ -1,8 +1,9 @@
 """Caso de uso: Registrar usuario."""
 from datetime import datetime
 from app.domain.repositories.user_repository import UserRepository
+from app.domain.repositories.async_user_repository import AsyncUserRepository
 from app.domain.entities.user import User
-from app.application.services.auth_service import AuthService
+from app.application.services.auth_service import AuthService, AsyncAuthService
 from app.interfaces.schemas.user_schemas import UserCreate
 
 
@@ -36,3 +37,31 @@ class RegisterUserUseCase:
         
         return self.user_repository.create(db_user)
 
+
+class AsyncRegisterUserUseCase:
+    """Variante asíncrona de ``RegisterUserUseCase``."""
+    
+    def __init__(self, user_repository: AsyncUserRepository, auth_service: AsyncAuthService):
+        self.user_repository = user_repository
+        self.auth_service = auth_service
+    
+    async def execute(self, user_data: UserCreate) -> User:
+        """
+        Registra un nuevo usuario.
+        
+        Raises:
+            ValueError: Si el email ya está registrado o la contraseña es inválida
+        """
+        if await self.user_repository.get_by_email(user_data.email):
+            raise ValueError("El email ya está registrado")
+        
+        db_user = User(
+            email=user_data.email,
+            hashed_password=await self.auth_service.hash_password(user_data.password),
+            full_name=user_data.full_name,
+            role="user",
+            is_active=True,
+            created_at=datetime.utcnow()
+        )
+        
+        return await self.user_repository.create(db_user)
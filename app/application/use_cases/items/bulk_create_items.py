@@ -0,0 +1,42 @@
+"""Caso de uso: Crear items en lote."""
+from datetime import datetime
+from typing import List, Optional
+from app.domain.repositories.item_repository import ItemRepository
+from app.domain.entities.item import Item
+from app.interfaces.schemas.item_schemas import ItemCreate
+
+
+class BulkCreateItemsUseCase:
+    """Caso de uso para crear un lote de items en una transacción."""
+    
+    def __init__(self, item_repository: ItemRepository):
+        self.item_repository = item_repository
+    
+    def execute(self, items_data: List[ItemCreate]) -> List[Optional[int]]:
+        """
+        Crea todos los items del lote con el estado por defecto.
+        
+        Returns:
+            IDs asignados en el orden del lote (None si no están disponibles)
+        
+        Raises:
+            ValueError: Si falta el estado por defecto o el lote es rechazado
+        """
+        status = self.item_repository.get_status_by_name("IN_PROGRESS")
+        if not status:
+            raise ValueError("Estado IN_PROGRESS no encontrado")
+        
+        now = datetime.utcnow()
+        items = [
+            Item(
+                name=item_data.name,
+                description=item_data.description,
+                ticket_url=item_data.ticket_url,
+                publication_url=item_data.publication_url,
+                reported_user=item_data.reported_user,
+                creation_date=now,
+                status_id=status.id
+            )
+            for item_data in items_data
+        ]
+        return self.item_repository.bulk_create(items)
@@ -0,0 +1,37 @@
+"""Caso de uso: Actualizar el estado de items en lote."""
+from typing import List, Optional, Tuple
+from app.domain.repositories.item_repository import ItemRepository
+from app.domain.entities.item_filters import ItemFilters
+
+
+class BulkUpdateItemStatusUseCase:
+    """Caso de uso para aplicar una transición de estado a muchos items."""
+    
+    def __init__(self, item_repository: ItemRepository):
+        self.item_repository = item_repository
+    
+    def execute(
+        self,
+        status: str,
+        ids: Optional[List[int]] = None,
+        filters: Optional[ItemFilters] = None
+    ) -> Tuple[List[int], List[int]]:
+        """
+        Cambia el estado de los items por lista de IDs o por filtro.
+        
+        Returns:
+            IDs actualizados e IDs pedidos que no existen (vacío con filtro)
+        
+        Raises:
+            ValueError: Si el estado no existe
+        """
+        status_obj = self.item_repository.get_status_by_name(status)
+        if not status_obj:
+            raise ValueError(f"Estado inválido: {status}")
+        
+        updated = self.item_repository.update_status_many(status_obj.id, ids, filters)
+        if ids is None:
+            return updated, []
+        found = set(updated)
+        not_found = sorted({item_id for item_id in ids if item_id not in found})
+        return updated, not_found
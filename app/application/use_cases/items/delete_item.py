@@ -1,5 +1,6 @@
 """Caso de uso: Eliminar item."""
 from app.domain.repositories.item_repository import ItemRepository
+from app.domain.repositories.async_item_repository import AsyncItemRepository
 
 
 class DeleteItemUseCase:
@@ -12,3 +13,13 @@ class DeleteItemUseCase:
         """Elimina un item."""
         return self.item_repository.delete(item_id)
 
+
+class AsyncDeleteItemUseCase:
+    """Variante asíncrona de ``DeleteItemUseCase``."""
+    
+    def __init__(self, item_repository: AsyncItemRepository):
+        self.item_repository = item_repository
+    
+    async def execute(self, item_id: int) -> bool:
+        """Elimina un item."""
+        return await self.item_repository.delete(item_id)
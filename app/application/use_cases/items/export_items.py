@@ -0,0 +1,18 @@
+"""Caso de uso: Exportar items."""
+from typing import Any, Dict, Iterator
+from app.domain.repositories.item_repository import ItemRepository
+from app.domain.entities.item_filters import ItemFilters
+
+# Tamaño de lote que se pide al cursor de servidor
+EXPORT_BATCH_SIZE = 1000
+
+
+class ExportItemsUseCase:
+    """Caso de uso para exportar items filtrados en streaming."""
+    
+    def __init__(self, item_repository: ItemRepository):
+        self.item_repository = item_repository
+    
+    def execute(self, filters: ItemFilters) -> Iterator[Dict[str, Any]]:
+        """Devuelve un iterador perezoso de filas planas de items."""
+        return self.item_repository.iter_export_rows(filters, EXPORT_BATCH_SIZE)
@@ -1,6 +1,7 @@
 """Caso de uso: Obtener item."""
 from typing import Optional
 from app.domain.repositories.item_repository import ItemRepository
+from app.domain.repositories.async_item_repository import AsyncItemRepository
 from app.domain.entities.item import Item
 
 
@@ -11,6 +12,16 @@ class GetItemUseCase:
         self.item_repository = item_repository
     
     def execute(self, item_id: int) -> Optional[Item]:
-        """Obtiene un item por ID."""
-        return self.item_repository.get_by_id(item_id)
+        """Obtiene un item por ID con su estado cargado."""
+        return self.item_repository.get_by_id_with_status(item_id)
 
+
+class AsyncGetItemUseCase:
+    """Variante asíncrona de ``GetItemUseCase``."""
+    
+    def __init__(self, item_repository: AsyncItemRepository):
+        self.item_repository = item_repository
+    
+    async def execute(self, item_id: int) -> Optional[Item]:
+        """Obtiene un item por ID con su estado cargado."""
+        return await self.item_repository.get_by_id_with_status(item_id)
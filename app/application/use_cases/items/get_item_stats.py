@@ -0,0 +1,26 @@
+"""Caso de uso: Obtener estadísticas de items."""
+from app.domain.repositories.item_repository import ItemRepository
+from app.domain.repositories.async_item_repository import AsyncItemRepository
+from app.domain.entities.item_stats import ItemStats
+
+
+class GetItemStatsUseCase:
+    """Caso de uso para contar items por estado y por reportante."""
+    
+    def __init__(self, item_repository: ItemRepository):
+        self.item_repository = item_repository
+    
+    def execute(self, reporter_limit: int = 100) -> ItemStats:
+        """Obtiene los contadores de items."""
+        return self.item_repository.get_stats(reporter_limit)
+
+
+class AsyncGetItemStatsUseCase:
+    """Variante asíncrona de ``GetItemStatsUseCase``."""
+    
+    def __init__(self, item_repository: AsyncItemRepository):
+        self.item_repository = item_repository
+    
+    async def execute(self, reporter_limit: int = 100) -> ItemStats:
+        """Obtiene los contadores de items."""
+        return await self.item_repository.get_stats(reporter_limit)
@@ -1,6 +1,7 @@
 """Caso de uso: Obtener estados."""
 from typing import List
 from app.domain.repositories.item_repository import ItemRepository
+from app.domain.repositories.async_item_repository import AsyncItemRepository
 from app.domain.entities.item_status import ItemStatus
 
 
@@ -14,3 +15,13 @@ class GetStatusesUseCase:
         """Obtiene todos los estados disponibles."""
         return self.item_repository.get_all_statuses()
 
+
+class AsyncGetStatusesUseCase:
+    """Variante asíncrona de ``GetStatusesUseCase``."""
+    
+    def __init__(self, item_repository: AsyncItemRepository):
+        self.item_repository = item_repository
+    
+    async def execute(self) -> List[ItemStatus]:
+        """Obtiene todos los estados disponibles."""
+        return await self.item_repository.get_all_statuses()
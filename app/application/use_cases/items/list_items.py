@@ -1,7 +1,9 @@
 """Caso de uso: Listar items."""
-from typing import List
+from typing import List, Optional
 from app.domain.repositories.item_repository import ItemRepository
+from app.domain.repositories.async_item_repository import AsyncItemRepository
 from app.domain.entities.item import Item
+from app.domain.entities.item_filters import ItemFilters, ItemSort
 
 
 class ListItemsUseCase:
@@ -10,7 +12,29 @@ class ListItemsUseCase:
     def __init__(self, item_repository: ItemRepository):
         self.item_repository = item_repository
     
-    def execute(self, skip: int = 0, limit: int = 100) -> List[Item]:
-        """Lista items con paginación."""
-        return self.item_repository.get_all(skip, limit)
+    def execute(
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        filters: Optional[ItemFilters] = None,
+        sort: Optional[ItemSort] = None
+    ) -> List[Item]:
+        """Lista items filtrados y ordenados, cada uno con su estado cargado."""
+        return self.item_repository.get_all_with_status(skip, limit, filters, sort)
 
+
+class AsyncListItemsUseCase:
+    """Variante asíncrona de ``ListItemsUseCase``."""
+    
+    def __init__(self, item_repository: AsyncItemRepository):
+        self.item_repository = item_repository
+    
+    async def execute(
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        filters: Optional[ItemFilters] = None,
+        sort: Optional[ItemSort] = None
+    ) -> List[Item]:
+        """Lista items filtrados y ordenados, cada uno con su estado cargado."""
+        return await self.item_repository.get_all_with_status(skip, limit, filters, sort)
@@ -0,0 +1,50 @@
+"""Caso de uso: Listar items por cursor."""
+from typing import List, Optional, Tuple
+from app.domain.repositories.item_repository import ItemRepository
+from app.domain.repositories.async_item_repository import AsyncItemRepository
+from app.domain.entities.item import Item
+from app.domain.entities.item_filters import ItemFilters, ItemSort
+
+
+class ListItemsByCursorUseCase:
+    """Caso de uso para listar items con paginación por cursor (keyset)."""
+    
+    def __init__(self, item_repository: ItemRepository):
+        self.item_repository = item_repository
+    
+    def execute(
+        self,
+        cursor: Optional[str] = None,
+        limit: int = 100,
+        filters: Optional[ItemFilters] = None,
+        sort: Optional[ItemSort] = None
+    ) -> Tuple[List[Item], Optional[str]]:
+        """
+        Lista una página de items a partir de un cursor opaco.
+        
+        Raises:
+            ValueError: Si el cursor o el orden no son válidos
+        """
+        return self.item_repository.get_page(cursor, limit, filters, sort)
+
+
+class AsyncListItemsByCursorUseCase:
+    """Variante asíncrona de ``ListItemsByCursorUseCase``."""
+    
+    def __init__(self, item_repository: AsyncItemRepository):
+        self.item_repository = item_repository
+    
+    async def execute(
+        self,
+        cursor: Optional[str] = None,
+        limit: int = 100,
+        filters: Optional[ItemFilters] = None,
+        sort: Optional[ItemSort] = None
+    ) -> Tuple[List[Item], Optional[str]]:
+        """
+        Lista una página de items a partir de un cursor opaco.
+        
+        Raises:
+            ValueError: Si el cursor o el orden no son válidos
+        """
+        return await self.item_repository.get_page(cursor, limit, filters, sort)
@@ -0,0 +1,14 @@
+"""Caso de uso: Reconstruir estadísticas de items."""
+from app.domain.repositories.item_repository import ItemRepository
+from app.domain.entities.item_stats import ItemStats
+
+
+class RebuildItemStatsUseCase:
+    """Caso de uso para recalcular los contadores de items desde cero."""
+    
+    def __init__(self, item_repository: ItemRepository):
+        self.item_repository = item_repository
+    
+    def execute(self) -> ItemStats:
+        """Recalcula los contadores y devuelve el resultado."""
+        return self.item_repository.rebuild_stats()
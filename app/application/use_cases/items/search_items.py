@@ -0,0 +1,16 @@
+"""Caso de uso: Buscar items."""
+from typing import List
+from app.domain.repositories.item_repository import ItemRepository
+from app.domain.entities.item import Item
+from app.domain.entities.item_filters import ItemFilters
+
+
+class SearchItemsUseCase:
+    """Caso de uso para buscar items por texto."""
+    
+    def __init__(self, item_repository: ItemRepository):
+        self.item_repository = item_repository
+    
+    def execute(self, query: str, filters: ItemFilters, skip: int = 0, limit: int = 100) -> List[Item]:
+        """Busca items por nombre y descripción, los más relevantes primero."""
+        return self.item_repository.search(query, filters, skip, limit)
@@ -1,27 +1,71 @@
 """Caso de uso: Actualizar item."""
-from typing import Optional
+from typing import Any, Dict, Optional
 from app.domain.repositories.item_repository import ItemRepository
+from app.domain.repositories.async_item_repository import AsyncItemRepository
 from app.domain.entities.item import Item
 from app.interfaces.schemas.item_schemas import ItemCreate
 
 
+class ItemVersionConflict(ValueError):
+    """El item fue modificado por otra petición desde la versión indicada."""
+
+
+def _item_fields(item_data: ItemCreate) -> Dict[str, Any]:
+    """Campos editables de un item a partir del schema de entrada."""
+    return {
+        "name": item_data.name,
+        "description": item_data.description,
+        "ticket_url": item_data.ticket_url,
+        "publication_url": item_data.publication_url,
+        "reported_user": item_data.reported_user,
+    }
+
+
 class UpdateItemUseCase:
     """Caso de uso para actualizar un item."""
     
     def __init__(self, item_repository: ItemRepository):
         self.item_repository = item_repository
     
-    def execute(self, item_id: int, item_data: ItemCreate) -> Optional[Item]:
-        """Actualiza un item existente."""
-        db_item = self.item_repository.get_by_id(item_id)
-        if not db_item:
-            return None
-        
-        db_item.name = item_data.name
-        db_item.description = item_data.description
-        db_item.ticket_url = item_data.ticket_url
-        db_item.publication_url = item_data.publication_url
-        db_item.reported_user = item_data.reported_user
+    def execute(
+        self,
+        item_id: int,
+        item_data: ItemCreate,
+        expected_version: Optional[int] = None
+    ) -> Optional[Item]:
+        """
+        Actualiza un item existente; devuelve None si no existe.
         
-        return self.item_repository.update(db_item)
+        Raises:
+            ItemVersionConflict: Si ``expected_version`` no es la versión actual
+        """
+        updated = self.item_repository.update_fields(item_id, _item_fields(item_data), expected_version)
+        if updated is None and expected_version is not None:
+            if self.item_repository.get_by_id(item_id) is not None:
+                raise ItemVersionConflict(f"El item {item_id} ha cambiado (versión esperada {expected_version})")
+        return updated
 
+
+class AsyncUpdateItemUseCase:
+    """Variante asíncrona de ``UpdateItemUseCase``."""
+    
+    def __init__(self, item_repository: AsyncItemRepository):
+        self.item_repository = item_repository
+    
+    async def execute(
+        self,
+        item_id: int,
+        item_data: ItemCreate,
+        expected_version: Optional[int] = None
+    ) -> Optional[Item]:
+        """
+        Actualiza un item existente; devuelve None si no existe.
+        
+        Raises:
+            ItemVersionConflict: Si ``expected_version`` no es la versión actual
+        """
+        updated = await self.item_repository.update_fields(item_id, _item_fields(item_data), expected_version)
+        if updated is None and expected_version is not None:
+            if await self.item_repository.get_by_id(item_id) is not None:
+                raise ItemVersionConflict(f"El item {item_id} ha cambiado (versión esperada {expected_version})")
+        return updated
@@ -1,6 +1,7 @@
 """Caso de uso: Actualizar estado de item."""
 from typing import Optional
 from app.domain.repositories.item_repository import ItemRepository
+from app.domain.repositories.async_item_repository import AsyncItemRepository
 from app.domain.entities.item import Item
 
 
@@ -11,15 +12,24 @@ class UpdateItemStatusUseCase:
         self.item_repository = item_repository
     
     def execute(self, item_id: int, status: str) -> Optional[Item]:
-        """Actualiza el estado de un item."""
-        db_item = self.item_repository.get_by_id(item_id)
-        if not db_item:
-            return None
-        
+        """Actualiza el estado de un item; devuelve None si el item o el estado no existen."""
         status_obj = self.item_repository.get_status_by_name(status)
         if not status_obj:
             return None
         
-        db_item.status_id = status_obj.id
-        return self.item_repository.update(db_item)
+        return self.item_repository.update_fields(item_id, {"status_id": status_obj.id})
+
 
+class AsyncUpdateItemStatusUseCase:
+    """Variante asíncrona de ``UpdateItemStatusUseCase``."""
+    
+    def __init__(self, item_repository: AsyncItemRepository):
+        self.item_repository = item_repository
+    
+    async def execute(self, item_id: int, status: str) -> Optional[Item]:
+        """Actualiza el estado de un item; devuelve None si el item o el estado no existen."""
+        status_obj = await self.item_repository.get_status_by_name(status)
+        if not status_obj:
+            return None
+        
+        return await self.item_repository.update_fields(item_id, {"status_id": status_obj.id})
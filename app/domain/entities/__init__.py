@@ -2,5 +2,7 @@
 from .user import User
 from .item import Item
 from .item_status import ItemStatus
+from .item_filters import ItemFilters, ItemSort
+from .item_stats import ItemStats
 
-__all__ = ["User", "Item", "ItemStatus"]
+__all__ = ["User", "Item", "ItemStatus", "ItemFilters", "ItemSort", "ItemStats"]
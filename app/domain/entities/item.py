@@ -3,6 +3,8 @@ from dataclasses import dataclass
 from datetime import datetime
 from typing import Optional
 
+from app.domain.entities.item_status import ItemStatus
+
 
 @dataclass
 class Item:
@@ -15,4 +17,8 @@ class Item:
     reported_user: Optional[str] = None
     creation_date: Optional[datetime] = None
     status_id: int = 1
-
+    updated_at: Optional[datetime] = None
+    # Se incrementa en cada modificación; base del ETag y de If-Match
+    version: int = 1
+    # Estado asociado; solo se rellena cuando el repositorio lo carga junto al item
+    status: Optional[ItemStatus] = None
@@ -0,0 +1,41 @@
+"""Criterios de filtrado y ordenación de items."""
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Optional
+
+# Campos por los que se puede ordenar un listado de items
+ITEM_SORT_FIELDS = ("id", "creation_date", "name")
+
+
+@dataclass
+class ItemFilters:
+    """Filtros opcionales sobre items; los campos a None no filtran."""
+    status_id: Optional[int] = None
+    reported_user: Optional[str] = None
+    created_from: Optional[datetime] = None
+    created_to: Optional[datetime] = None
+
+
+@dataclass
+class ItemSort:
+    """Orden de un listado de items; el ID desempata siempre."""
+    field: str = "id"
+    descending: bool = False
+
+    @classmethod
+    def parse(cls, value: Optional[str]) -> "ItemSort":
+        """
+        Interpreta ``campo`` o ``-campo`` (descendente).
+        
+        Raises:
+            ValueError: Si el campo no admite ordenación
+        """
+        if not value:
+            return cls()
+        descending = value.startswith("-")
+        field = value.lstrip("-")
+        if field not in ITEM_SORT_FIELDS:
+            raise ValueError(
+                f"Orden inválido: {value}. Campos válidos: {', '.join(ITEM_SORT_FIELDS)}"
+            )
+        return cls(field=field, descending=descending)
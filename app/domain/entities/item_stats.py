@@ -0,0 +1,15 @@
+"""Entidad de dominio: Estadísticas de items."""
+from dataclasses import dataclass, field
+from typing import Dict, Optional
+
+
+@dataclass
+class ItemStats:
+    """Número de items por ID de estado y por usuario reportante."""
+    by_status: Dict[int, int] = field(default_factory=dict)
+    by_reporter: Dict[Optional[str], int] = field(default_factory=dict)
+
+    @property
+    def total(self) -> int:
+        """Total de items (suma de todos los estados)."""
+        return sum(self.by_status.values())
@@ -0,0 +1,111 @@
+"""Interfaz asíncrona de repositorio de items (puerto)."""
+from abc import ABC, abstractmethod
+from typing import Any, Dict, Optional, List, Tuple
+from app.domain.entities.item import Item
+from app.domain.entities.item_status import ItemStatus
+from app.domain.entities.item_filters import ItemFilters, ItemSort
+from app.domain.entities.item_stats import ItemStats
+
+
+class AsyncItemRepository(ABC):
+    """Puerto asíncrono para las operaciones CRUD y de lectura de ``ItemRepository``."""
+    
+    @abstractmethod
+    async def get_by_id(self, item_id: int) -> Optional[Item]:
+        """Obtiene un item por ID."""
+        pass
+    
+    @abstractmethod
+    async def get_all(
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        filters: Optional[ItemFilters] = None,
+        sort: Optional[ItemSort] = None
+    ) -> List[Item]:
+        """Obtiene items filtrados y ordenados con paginación."""
+        pass
+    
+    @abstractmethod
+    async def get_by_id_with_status(self, item_id: int) -> Optional[Item]:
+        """Obtiene un item por ID con su estado cargado en la misma consulta."""
+        pass
+    
+    @abstractmethod
+    async def get_all_with_status(
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        filters: Optional[ItemFilters] = None,
+        sort: Optional[ItemSort] = None
+    ) -> List[Item]:
+        """Obtiene items filtrados y ordenados con su estado cargado en la misma consulta."""
+        pass
+    
+    @abstractmethod
+    async def get_page(
+        self,
+        cursor: Optional[str] = None,
+        limit: int = 100,
+        filters: Optional[ItemFilters] = None,
+        sort: Optional[ItemSort] = None
+    ) -> Tuple[List[Item], Optional[str]]:
+        """
+        Obtiene una página de items (con estado) ordenada por fecha de creación e ID.
+        
+        Raises:
+            ValueError: Si el cursor o el orden no son válidos
+        """
+        pass
+    
+    @abstractmethod
+    async def create(self, item: Item) -> Item:
+        """Crea un nuevo item."""
+        pass
+    
+    @abstractmethod
+    async def update(self, item: Item) -> Item:
+        """Actualiza un item existente."""
+        pass
+    
+    @abstractmethod
+    async def update_fields(
+        self,
+        item_id: int,
+        fields: Dict[str, Any],
+        expected_version: Optional[int] = None
+    ) -> Optional[Item]:
+        """
+        Actualiza campos de un item en una sola sentencia y devuelve el item
+        resultante con su estado, o None si no existe o, con
+        ``expected_version``, si su versión actual es otra.
+        """
+        pass
+    
+    @abstractmethod
+    async def delete(self, item_id: int) -> bool:
+        """Elimina un item; devuelve False si no existía."""
+        pass
+    
+    @abstractmethod
+    async def get_stats(self, reporter_limit: int = 100) -> ItemStats:
+        """
+        Obtiene el número de items por estado y por reportante (los
+        ``reporter_limit`` con más items) sin recorrer los items.
+        """
+        pass
+    
+    @abstractmethod
+    async def get_status_by_name(self, status: str) -> Optional[ItemStatus]:
+        """Obtiene un estado por nombre."""
+        pass
+    
+    @abstractmethod
+    async def get_all_statuses(self) -> List[ItemStatus]:
+        """Obtiene todos los estados."""
+        pass
+    
+    @abstractmethod
+    async def get_status_by_id(self, status_id: int) -> Optional[ItemStatus]:
+        """Obtiene un estado por ID."""
+        pass
@@ -0,0 +1,23 @@
+"""Interfaz asíncrona de repositorio de usuarios (puerto)."""
+from abc import ABC, abstractmethod
+from typing import Optional
+from app.domain.entities.user import User
+
+
+class AsyncUserRepository(ABC):
+    """Puerto asíncrono para operaciones de usuarios."""
+    
+    @abstractmethod
+    async def get_by_email(self, email: str) -> Optional[User]:
+        """Busca un usuario por email."""
+        pass
+    
+    @abstractmethod
+    async def create(self, user: User) -> User:
+        """Crea un nuevo usuario."""
+        pass
+    
+    @abstractmethod
+    async def update(self, user: User) -> User:
+        """Actualiza un usuario existente."""
+        pass
@@ -1,8 +1,10 @@
 """Interfaz de repositorio de items (puerto)."""
 from abc import ABC, abstractmethod
-from typing import Optional, List
+from typing import Any, Dict, Iterator, Optional, List, Tuple
 from app.domain.entities.item import Item
 from app.domain.entities.item_status import ItemStatus
+from app.domain.entities.item_filters import ItemFilters, ItemSort
+from app.domain.entities.item_stats import ItemStats
 
 
 class ItemRepository(ABC):
@@ -14,8 +16,74 @@ class ItemRepository(ABC):
         pass
     
     @abstractmethod
-    def get_all(self, skip: int = 0, limit: int = 100) -> List[Item]:
-        """Obtiene todos los items con paginación."""
+    def get_all(
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        filters: Optional[ItemFilters] = None,
+        sort: Optional[ItemSort] = None
+    ) -> List[Item]:
+        """Obtiene items filtrados y ordenados con paginación."""
+        pass
+    
+    @abstractmethod
+    def get_by_id_with_status(self, item_id: int) -> Optional[Item]:
+        """Obtiene un item por ID con su estado cargado en la misma consulta."""
+        pass
+    
+    @abstractmethod
+    def get_all_with_status(
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        filters: Optional[ItemFilters] = None,
+        sort: Optional[ItemSort] = None
+    ) -> List[Item]:
+        """Obtiene items filtrados y ordenados con su estado cargado en la misma consulta."""
+        pass
+    
+    @abstractmethod
+    def get_page(
+        self,
+        cursor: Optional[str] = None,
+        limit: int = 100,
+        filters: Optional[ItemFilters] = None,
+        sort: Optional[ItemSort] = None
+    ) -> Tuple[List[Item], Optional[str]]:
+        """
+        Obtiene una página de items (con estado) ordenada por fecha de creación e ID.
+        
+        Args:
+            cursor: Cursor opaco devuelto por la página anterior; None para empezar
+            limit: Tamaño máximo de la página
+            filters: Filtros a aplicar
+            sort: Solo se admite ``creation_date`` ascendente o descendente
+        
+        Returns:
+            Tupla (items, cursor de la página siguiente o None si no hay más)
+        
+        Raises:
+            ValueError: Si el cursor o el orden no son válidos
+        """
+        pass
+    
+    @abstractmethod
+    def iter_export_rows(self, filters: ItemFilters, batch_size: int = 1000) -> Iterator[Dict[str, Any]]:
+        """
+        Recorre los items filtrados como diccionarios planos (incluye el nombre
+        del estado) sin materializar el resultado completo en memoria.
+        """
+        pass
+    
+    @abstractmethod
+    def search(self, query: str, filters: ItemFilters, skip: int = 0, limit: int = 100) -> List[Item]:
+        """
+        Busca items por texto en nombre y descripción, ordenados por
+        relevancia y con su estado cargado.
+        
+        Raises:
+            ValueError: Si la base de datos no soporta búsqueda de texto
+        """
         pass
     
     @abstractmethod
@@ -23,14 +91,69 @@ class ItemRepository(ABC):
         """Crea un nuevo item."""
         pass
     
+    @abstractmethod
+    def bulk_create(self, items: List[Item]) -> List[Optional[int]]:
+        """
+        Inserta varios items en una única transacción.
+        
+        Returns:
+            IDs asignados en el mismo orden que ``items``; None si el
+            mecanismo de inserción no los devuelve (COPY)
+        
+        Raises:
+            ValueError: Si algún estado no existe o la base de datos
+                rechaza el lote (se revierte entero)
+        """
+        pass
+    
     @abstractmethod
     def update(self, item: Item) -> Item:
         """Actualiza un item existente."""
         pass
     
+    @abstractmethod
+    def update_fields(
+        self,
+        item_id: int,
+        fields: Dict[str, Any],
+        expected_version: Optional[int] = None
+    ) -> Optional[Item]:
+        """
+        Actualiza campos de un item en una sola sentencia y devuelve el item
+        resultante con su estado, o None si no existe o, con
+        ``expected_version``, si su versión actual es otra.
+        """
+        pass
+    
+    @abstractmethod
+    def update_status_many(
+        self,
+        status_id: int,
+        ids: Optional[List[int]] = None,
+        filters: Optional[ItemFilters] = None
+    ) -> List[int]:
+        """
+        Cambia el estado de los items indicados por ``ids`` o por ``filters``
+        en una sola sentencia y devuelve los IDs actualizados.
+        """
+        pass
+    
     @abstractmethod
     def delete(self, item_id: int) -> bool:
-        """Elimina un item."""
+        """Elimina un item; devuelve False si no existía."""
+        pass
+    
+    @abstractmethod
+    def get_stats(self, reporter_limit: int = 100) -> ItemStats:
+        """
+        Obtiene el número de items por estado y por reportante (los
+        ``reporter_limit`` con más items) sin recorrer los items.
+        """
+        pass
+    
+    @abstractmethod
+    def rebuild_stats(self) -> ItemStats:
+        """Recalcula las estadísticas desde los items para corregir desviaciones."""
         pass
     
     @abstractmethod
@@ -17,3 +17,8 @@ class UserRepository(ABC):
         """Crea un nuevo usuario."""
         pass
 
+    
+    @abstractmethod
+    def update(self, user: User) -> User:
+        """Actualiza un usuario existente."""
+        pass
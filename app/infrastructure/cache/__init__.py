@@ -0,0 +1,17 @@
+"""Cachés en memoria del proceso."""
+from .lru_cache import LRUTTLCache
+from .status_catalog import StatusCatalog, status_catalog
+from .principal_cache import principal_cache, invalidate_principal
+from .read_cache import ReadCache, MemoryReadCache, RedisReadCache, create_read_cache
+
+__all__ = [
+    "LRUTTLCache",
+    "StatusCatalog",
+    "status_catalog",
+    "principal_cache",
+    "invalidate_principal",
+    "ReadCache",
+    "MemoryReadCache",
+    "RedisReadCache",
+    "create_read_cache",
+]
@@ -0,0 +1,121 @@
+"""
+Caché de usuarios autenticados (principales) por sujeto del token.
+
+Los cambios de email, rol o estado activo hechos con el ORM invalidan la
+entrada al confirmarse la transacción, no al hacer flush: así otra petición
+no puede volver a cachear el usuario antiguo antes del commit.
+
+La caché es de cada proceso: con varios workers la invalidación solo llega
+al que hizo el cambio y los demás pueden servir el usuario antiguo hasta
+``PRINCIPAL_CACHE_TTL_SECONDS``. Por eso el TTL por defecto baja de 60 a
+10 segundos cuando ``WEB_CONCURRENCY > 1``; si ese margen no es aceptable
+hay que usar ``AUTH_VERIFICATION_MODE=strict``.
+"""
+import os
+from dataclasses import replace
+from typing import Optional, Set
+
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import Session, SessionTransaction
+
+from app.domain.entities.user import User
+from app.infrastructure.cache.lru_cache import LRUTTLCache
+from app.infrastructure.database.models.user_model import User as SQLAlchemyUser
+
+# "strict": cada petición consulta la tabla users
+# "cached": se reutiliza el usuario verificado durante PRINCIPAL_CACHE_TTL_SECONDS
+AUTH_VERIFICATION_MODE = os.getenv("AUTH_VERIFICATION_MODE", "cached").lower()
+PRINCIPAL_CACHE_MAX_SIZE = int(os.getenv("PRINCIPAL_CACHE_MAX_SIZE", "10000"))
+# Con varios workers (los fija app.launcher) el TTL acota cuánto tiempo
+# sirven los demás procesos un usuario ya desactivado o con otro rol
+_MULTI_WORKER = int(os.getenv("WEB_CONCURRENCY") or "1") > 1
+PRINCIPAL_CACHE_TTL_SECONDS = float(
+    os.getenv("PRINCIPAL_CACHE_TTL_SECONDS") or ("10" if _MULTI_WORKER else "60")
+)
+
+# Sujetos a invalidar cuando se confirme la transacción (en ``Session.info``)
+_PENDING_KEY = "principal_cache_pending"
+
+principal_cache: LRUTTLCache[User] = LRUTTLCache(
+    max_size=PRINCIPAL_CACHE_MAX_SIZE,
+    ttl_seconds=PRINCIPAL_CACHE_TTL_SECONDS,
+)
+
+
+def is_cached_verification_enabled() -> bool:
+    """Indica si la verificación de usuarios usa la caché."""
+    return AUTH_VERIFICATION_MODE == "cached"
+
+
+def get_cached_principal(subject: str, role_claim: Optional[str] = None) -> Optional[User]:
+    """
+    Obtiene el usuario cacheado para el sujeto del token.
+
+    Si el token trae un rol distinto del cacheado se ignora la entrada y
+    se fuerza la verificación contra la base de datos.
+    """
+    user = principal_cache.get(subject)
+    if user is None:
+        return None
+    if role_claim is not None and role_claim != user.role:
+        principal_cache.delete(subject)
+        return None
+    return user
+
+
+def cache_principal(subject: str, user: User) -> None:
+    """Guarda el usuario verificado (sin el hash de la contraseña)."""
+    principal_cache.put(subject, replace(user, hashed_password=""))
+
+
+def invalidate_principal(subject: str) -> None:
+    """Elimina al usuario de la caché (desactivación, cambio de rol...)."""
+    principal_cache.delete(subject)
+
+
+def _pending(target) -> Optional[Set[str]]:
+    session = inspect(target).session
+    if session is None:
+        return None
+    return session.info.setdefault(_PENDING_KEY, set())
+
+
+def _invalidate_on_update(mapper, connection, target) -> None:
+    """Apunta al usuario si cambian el email, el rol o el estado activo."""
+    state = inspect(target)
+    if not any(state.attrs[attr].history.has_changes() for attr in ("email", "role", "is_active")):
+        return
+    pending = _pending(target)
+    subjects = [*(state.attrs.email.history.deleted or ()), target.email]
+    if pending is None:
+        for subject in subjects:
+            invalidate_principal(subject)
+    else:
+        pending.update(subjects)
+
+
+def _invalidate_on_delete(mapper, connection, target) -> None:
+    """Apunta al usuario eliminado."""
+    pending = _pending(target)
+    if pending is None:
+        invalidate_principal(target.email)
+    else:
+        pending.add(target.email)
+
+
+def _invalidate_after_commit(session: Session) -> None:
+    """Invalida los usuarios modificados en la transacción confirmada."""
+    for subject in session.info.pop(_PENDING_KEY, ()):
+        invalidate_principal(subject)
+
+
+def _discard_after_rollback(session: Session, previous_transaction: SessionTransaction) -> None:
+    """Olvida los cambios de una transacción deshecha (no los de un savepoint)."""
+    if not previous_transaction.nested:
+        session.info.pop(_PENDING_KEY, None)
+
+
+event.listen(SQLAlchemyUser, "after_update", _invalidate_on_update)
+event.listen(SQLAlchemyUser, "after_delete", _invalidate_on_delete)
+event.listen(Session, "after_commit", _invalidate_after_commit)
+event.listen(Session, "after_soft_rollback", _discard_after_rollback)
@@ -0,0 +1,235 @@
+"""
+Caché de lecturas intercambiable: LRU en memoria o servidor con protocolo Redis.
+
+Las claves incluyen la generación de su espacio de nombres (un item, los
+listados...). Invalidar un espacio le asigna una generación nueva, tomada
+de un reloj que solo avanza, sin enumerar las claves antiguas: caducan por
+TTL o se desalojan por LRU. Una lectura que empezó antes de la escritura
+guarda su resultado con la generación anterior y nadie vuelve a leerlo.
+"""
+import logging
+import os
+import threading
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional, Sequence, Tuple
+
+from app.infrastructure.cache.lru_cache import LRUTTLCache
+
+logger = logging.getLogger(__name__)
+
+# Workers que sirven la aplicación (los fija app.launcher)
+_WORKERS = int(os.getenv("WEB_CONCURRENCY") or "1")
+# "memory" (por proceso), "redis" (compartida entre procesos) o "none". Por
+# defecto "memory" con un solo proceso y "none" con varios: cada worker
+# tendría su propia copia y no vería las escrituras de los demás
+ITEM_CACHE_BACKEND = (os.getenv("ITEM_CACHE_BACKEND") or ("memory" if _WORKERS == 1 else "none")).lower()
+ITEM_CACHE_MAX_SIZE = int(os.getenv("ITEM_CACHE_MAX_SIZE", "5000"))
+# Con varios procesos y backend "memory" es también el retraso máximo con
+# el que un proceso ve las escrituras hechas en otro
+ITEM_CACHE_TTL_SECONDS = float(os.getenv("ITEM_CACHE_TTL_SECONDS", "10"))
+ITEM_CACHE_REDIS_URL = os.getenv("ITEM_CACHE_REDIS_URL", "redis://localhost:6379/0")
+
+
+class ReadCache(ABC):
+    """Puerto de caché de lecturas con generaciones para invalidar grupos de claves."""
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[Any]:
+        """Devuelve el valor cacheado o None."""
+
+    @abstractmethod
+    def put(self, key: str, value: Any) -> None:
+        """Guarda un valor con el TTL de la caché."""
+
+    @abstractmethod
+    def delete(self, key: str) -> None:
+        """Elimina una clave."""
+
+    @abstractmethod
+    def generations(self, namespaces: Sequence[str]) -> Optional[Tuple[int, ...]]:
+        """Generaciones actuales de varios espacios de nombres; None si no se pueden consultar."""
+
+    @abstractmethod
+    def bump(self, namespace: str) -> None:
+        """Invalida todas las claves construidas con la generación actual."""
+
+    @abstractmethod
+    def stats(self) -> Dict[str, Any]:
+        """Contadores de aciertos, fallos y desalojos."""
+
+
+class MemoryReadCache(ReadCache):
+    """
+    Caché en el proceso sobre ``LRUTTLCache``.
+
+    Guarda los objetos tal cual: un acierto no copia ni deserializa, así que
+    los valores devueltos no deben modificarse.
+    """
+
+    def __init__(self, max_size: int = ITEM_CACHE_MAX_SIZE, ttl_seconds: float = ITEM_CACHE_TTL_SECONDS):
+        self._entries: LRUTTLCache[Any] = LRUTTLCache(max_size=max_size, ttl_seconds=ttl_seconds)
+        self._generations: "OrderedDict[str, int]" = OrderedDict()
+        self._max_generations = max_size
+        # Generación de los espacios sin entrada; sube al descartar una para
+        # que ninguna clave anterior al descarte vuelva a ser válida
+        self._floor = 0
+        self._clock = 0
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[Any]:
+        return self._entries.get(key)
+
+    def put(self, key: str, value: Any) -> None:
+        self._entries.put(key, value)
+
+    def delete(self, key: str) -> None:
+        self._entries.delete(key)
+
+    def generations(self, namespaces: Sequence[str]) -> Optional[Tuple[int, ...]]:
+        with self._lock:
+            return tuple(self._generations.get(namespace, self._floor) for namespace in namespaces)
+
+    def bump(self, namespace: str) -> None:
+        with self._lock:
+            self._clock += 1
+            self._generations[namespace] = self._clock
+            self._generations.move_to_end(namespace)
+            if len(self._generations) > self._max_generations:
+                self._generations.popitem(last=False)
+                self._floor = self._clock
+
+    def stats(self) -> Dict[str, Any]:
+        return {"backend": "memory", "ttl_seconds": self._entries.ttl_seconds, **self._entries.stats()}
+
+
+class RedisReadCache(ReadCache):
+    """
+    Caché compartida en un servidor que hable el protocolo Redis.
+
+    ``client`` solo necesita ``get``, ``mget``, ``set(..., ex=)``, ``delete`` e ``incr``
+    (un cliente ``redis.Redis`` o cualquier sustituto local compatible). Los
+    valores se guardan como texto con ``encode``/``decode``. Los errores del
+    servidor y los valores que no se pueden decodificar (p. ej. guardados
+    por otra versión de la aplicación) se tratan como fallos de caché: la
+    lectura va a la base de datos.
+    """
+
+    def __init__(
+        self,
+        client,
+        encode: Callable[[Any], str],
+        decode: Callable[[str], Any],
+        ttl_seconds: float = ITEM_CACHE_TTL_SECONDS,
+        prefix: str = "cache:"
+    ):
+        self.client = client
+        self.encode = encode
+        self.decode = decode
+        self.ttl_seconds = ttl_seconds
+        self.prefix = prefix
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.errors = 0
+
+    def _count(self, counter: str) -> None:
+        with self._lock:
+            setattr(self, counter, getattr(self, counter) + 1)
+
+    def get(self, key: str) -> Optional[Any]:
+        try:
+            raw = self.client.get(self.prefix + key)
+        except Exception:
+            self._count("errors")
+            raw = None
+        if raw is None:
+            self._count("misses")
+            return None
+        try:
+            value = self.decode(raw.decode() if isinstance(raw, bytes) else raw)
+        except Exception:
+            self._count("errors")
+            self._count("misses")
+            self.delete(key)
+            return None
+        self._count("hits")
+        return value
+
+    def put(self, key: str, value: Any) -> None:
+        try:
+            self.client.set(self.prefix + key, self.encode(value), ex=max(1, int(self.ttl_seconds)))
+        except Exception:
+            self._count("errors")
+
+    def delete(self, key: str) -> None:
+        try:
+            self.client.delete(self.prefix + key)
+        except Exception:
+            self._count("errors")
+
+    def generations(self, namespaces: Sequence[str]) -> Optional[Tuple[int, ...]]:
+        try:
+            values = self.client.mget([f"{self.prefix}gen:{namespace}" for namespace in namespaces])
+        except Exception:
+            self._count("errors")
+            return None
+        return tuple(int(value) if value is not None else 0 for value in values)
+
+    def bump(self, namespace: str) -> None:
+        # La generación caduca después que cualquier clave guardada con la
+        # anterior, así que volver a 0 tras caducar no resucita entradas
+        try:
+            clock = self.client.incr(f"{self.prefix}clock")
+            self.client.set(f"{self.prefix}gen:{namespace}", clock, ex=max(2, int(self.ttl_seconds) * 2))
+        except Exception:
+            self._count("errors")
+
+    def stats(self) -> Dict[str, Any]:
+        stats: Dict[str, Any] = {
+            "backend": "redis",
+            "ttl_seconds": self.ttl_seconds,
+            "hits": self.hits,
+            "misses": self.misses,
+            "errors": self.errors,
+            "evictions": None,
+        }
+        info = getattr(self.client, "info", None)
+        if info is not None:
+            try:
+                stats["evictions"] = info("stats").get("evicted_keys")
+            except Exception:
+                pass
+        return stats
+
+
+def create_read_cache(
+    encode: Callable[[Any], str],
+    decode: Callable[[str], Any],
+    prefix: str
+) -> Optional[ReadCache]:
+    """
+    Crea la caché configurada en ``ITEM_CACHE_BACKEND`` (None si es "none").
+
+    Raises:
+        ValueError: Si el backend no es válido
+        RuntimeError: Si se pide "redis" sin el paquete ``redis`` instalado
+    """
+    if ITEM_CACHE_BACKEND == "none":
+        return None
+    if ITEM_CACHE_BACKEND == "memory":
+        if _WORKERS > 1:
+            logger.warning(
+                "ITEM_CACHE_BACKEND=memory con %d workers: cada uno ve las escrituras de los "
+                "demás con hasta %gs de retraso (ITEM_CACHE_TTL_SECONDS); usa redis",
+                _WORKERS, ITEM_CACHE_TTL_SECONDS,
+            )
+        return MemoryReadCache()
+    if ITEM_CACHE_BACKEND == "redis":
+        try:
+            import redis
+        except ImportError as e:
+            raise RuntimeError("ITEM_CACHE_BACKEND=redis requiere el paquete 'redis'") from e
+        client = redis.Redis.from_url(ITEM_CACHE_REDIS_URL, socket_timeout=0.5)
+        return RedisReadCache(client, encode, decode, prefix=prefix)
+    raise ValueError(f"ITEM_CACHE_BACKEND inválido: {ITEM_CACHE_BACKEND}")
@@ -0,0 +1,136 @@
+"""Catálogo en memoria de estados de items."""
+import os
+import threading
+import time
+from typing import Callable, Dict, Iterable, List, Optional
+
+from sqlalchemy import event
+
+from app.domain.entities.item_status import ItemStatus
+from app.infrastructure.database.models.item_status_model import ItemStatus as SQLAlchemyItemStatus
+
+STATUS_CATALOG_TTL_SECONDS = float(os.getenv("STATUS_CATALOG_TTL_SECONDS", "300"))
+# Intervalo mínimo entre recargas provocadas por estados desconocidos: un
+# cliente que pide estados inexistentes no puede leer la tabla en cada petición
+STATUS_CATALOG_MISS_RELOAD_SECONDS = float(os.getenv("STATUS_CATALOG_MISS_RELOAD_SECONDS", "5"))
+
+
+class StatusCatalog:
+    """
+    Caché de la tabla ``items_status`` compartida por todo el proceso.
+
+    Los estados casi nunca cambian, así que se cargan una vez y se sirven
+    desde diccionarios. Cada carga incrementa ``version``; la instantánea
+    caduca tras ``ttl_seconds`` o al llamar a ``invalidate``. Un estado que
+    no está provoca como mucho una recarga cada ``miss_reload_seconds``.
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: float = STATUS_CATALOG_TTL_SECONDS,
+        miss_reload_seconds: float = STATUS_CATALOG_MISS_RELOAD_SECONDS
+    ):
+        self.ttl_seconds = ttl_seconds
+        self.miss_reload_seconds = miss_reload_seconds
+        self._lock = threading.Lock()
+        self._by_id: Dict[int, ItemStatus] = {}
+        self._by_name: Dict[str, ItemStatus] = {}
+        self._loaded_at: Optional[float] = None
+        self._miss_reload_at = float("-inf")
+        self._version = 0
+
+    @property
+    def version(self) -> int:
+        """Número de cargas realizadas; cambia cada vez que se refresca."""
+        return self._version
+
+    def is_stale(self) -> bool:
+        """Indica si la instantánea no existe, fue invalidada o expiró."""
+        loaded_at = self._loaded_at
+        if loaded_at is None:
+            return True
+        return self.ttl_seconds > 0 and time.monotonic() - loaded_at > self.ttl_seconds
+
+    def load(self, statuses: Iterable[ItemStatus]) -> None:
+        """Sustituye la instantánea por los estados indicados."""
+        by_id = {}
+        by_name = {}
+        for status in statuses:
+            snapshot = ItemStatus(id=status.id, status=status.status)
+            by_id[snapshot.id] = snapshot
+            by_name[snapshot.status] = snapshot
+        with self._lock:
+            self._by_id = by_id
+            self._by_name = by_name
+            self._loaded_at = time.monotonic()
+            self._version += 1
+
+    def ensure_fresh(self, loader: Callable[[], Iterable[ItemStatus]]) -> bool:
+        """Recarga el catálogo con ``loader`` si está caducado; indica si recargó."""
+        if not self.is_stale():
+            return False
+        statuses = list(loader())
+        # Otro hilo pudo recargar mientras consultábamos; la última carga gana
+        self.load(statuses)
+        return True
+
+    def claim_miss_reload(self) -> bool:
+        """
+        Indica si un estado no encontrado puede recargar el catálogo ahora:
+        solo si la última carga (o recarga por fallo) tiene al menos
+        ``miss_reload_seconds``. Si devuelve True, cuenta como recarga.
+        """
+        now = time.monotonic()
+        with self._lock:
+            last = max(self._loaded_at if self._loaded_at is not None else float("-inf"), self._miss_reload_at)
+            if now - last < self.miss_reload_seconds:
+                return False
+            self._miss_reload_at = now
+            return True
+
+    def find(
+        self,
+        lookup: Callable[["StatusCatalog"], Optional[ItemStatus]],
+        loader: Callable[[], Iterable[ItemStatus]]
+    ) -> Optional[ItemStatus]:
+        """
+        Busca un estado con ``lookup``. Si no está y ``claim_miss_reload``
+        lo permite, recarga con ``loader`` y repite: el estado pudo crearse
+        después de la última carga (p. ej. en otro proceso).
+        """
+        self.ensure_fresh(loader)
+        found = lookup(self)
+        if found is None and self.claim_miss_reload():
+            self.load(loader())
+            found = lookup(self)
+        return found
+
+    def invalidate(self) -> None:
+        """Marca el catálogo como caducado; la próxima lectura lo recarga."""
+        with self._lock:
+            self._loaded_at = None
+
+    def get_by_id(self, status_id: int) -> Optional[ItemStatus]:
+        """Obtiene un estado por ID desde memoria."""
+        return self._by_id.get(status_id)
+
+    def get_by_name(self, status: str) -> Optional[ItemStatus]:
+        """Obtiene un estado por nombre desde memoria."""
+        return self._by_name.get(status)
+
+    def all(self) -> List[ItemStatus]:
+        """Lista todos los estados ordenados por ID."""
+        return [self._by_id[status_id] for status_id in sorted(self._by_id)]
+
+
+# Instancia compartida por el proceso
+status_catalog = StatusCatalog()
+
+
+def _invalidate_on_change(mapper, connection, target) -> None:
+    """Invalida el catálogo compartido cuando cambia una fila de estados vía ORM."""
+    status_catalog.invalidate()
+
+
+for _event_name in ("after_insert", "after_update", "after_delete"):
+    event.listen(SQLAlchemyItemStatus, _event_name, _invalidate_on_change)
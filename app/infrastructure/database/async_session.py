@@ -0,0 +1,103 @@
+"""Configuración de sesión asíncrona de base de datos."""
+from typing import AsyncIterator, Optional
+
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+from app.infrastructure.database.session import DATABASE_URL, DB_MODE, DB_WARMUP_CONNECTIONS, pool_options
+from app.infrastructure.monitoring.query_stats import install_query_listeners
+
+# Driver asíncrono para cada backend soportado
+_ASYNC_DRIVERS = {
+    "postgresql": "asyncpg",
+    "sqlite": "aiosqlite",
+}
+
+_async_engine: Optional[AsyncEngine] = None
+_async_sessionmaker: Optional[async_sessionmaker] = None
+
+
+def is_async_db_enabled() -> bool:
+    """Indica si la aplicación usa el acceso asíncrono a base de datos."""
+    return DB_MODE == "async"
+
+
+def to_async_url(url: str) -> str:
+    """
+    Convierte una URL síncrona (``postgresql://...``) en su equivalente asíncrona.
+    
+    Raises:
+        ValueError: Si el backend no tiene driver asíncrono configurado
+    """
+    parsed = make_url(url)
+    backend = parsed.get_backend_name()
+    driver = _ASYNC_DRIVERS.get(backend)
+    if driver is None:
+        raise ValueError(f"No hay driver asíncrono para el backend '{backend}'")
+    return parsed.set(drivername=f"{backend}+{driver}").render_as_string(hide_password=False)
+
+
+def get_async_engine() -> AsyncEngine:
+    """Crea (una sola vez) y devuelve el motor asíncrono."""
+    global _async_engine
+    if _async_engine is None:
+        _async_engine = create_async_engine(
+            to_async_url(DATABASE_URL),
+            **pool_options("async", AsyncAdaptedQueuePool),
+        )
+        install_query_listeners(_async_engine.sync_engine)
+    return _async_engine
+
+
+def get_async_engine_if_created() -> Optional[AsyncEngine]:
+    """Devuelve el motor asíncrono solo si ya se creó."""
+    return _async_engine
+
+
+def get_async_sessionmaker() -> async_sessionmaker:
+    """Devuelve la factoría de sesiones asíncronas."""
+    global _async_sessionmaker
+    if _async_sessionmaker is None:
+        # expire_on_commit=False: tras el commit no se puede recargar de forma implícita
+        _async_sessionmaker = async_sessionmaker(
+            bind=get_async_engine(),
+            autoflush=False,
+            expire_on_commit=False,
+        )
+    return _async_sessionmaker
+
+
+async def get_async_db() -> AsyncIterator[AsyncSession]:
+    """Dependencia para obtener sesión asíncrona de base de datos."""
+    async with get_async_sessionmaker()() as db:
+        yield db
+
+
+async def warm_up_async_connections(count: int = DB_WARMUP_CONNECTIONS) -> int:
+    """
+    Abre ``count`` conexiones del pool asíncrono y las devuelve al pool.
+    
+    Returns:
+        Conexiones abiertas (0 con SQLite)
+    """
+    engine = get_async_engine()
+    if not isinstance(engine.sync_engine.pool, AsyncAdaptedQueuePool):
+        return 0
+    connections = []
+    try:
+        for _ in range(min(count, engine.sync_engine.pool.size())):
+            connections.append(await engine.connect())
+    finally:
+        for connection in connections:
+            await connection.close()
+    return len(connections)
+
+
+async def dispose_async_engine() -> None:
+    """Cierra las conexiones del motor asíncrono si llegó a crearse."""
+    global _async_engine, _async_sessionmaker
+    if _async_engine is not None:
+        await _async_engine.dispose()
+        _async_engine = None
+        _async_sessionmaker = None
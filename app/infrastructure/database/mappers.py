@@ -1,4 +1,5 @@
 """Mappers entre entidades de dominio y modelos SQLAlchemy."""
+from sqlalchemy import inspect
 from app.domain.entities.user import User as DomainUser
 from app.domain.entities.item import Item as DomainItem
 from app.domain.entities.item_status import ItemStatus as DomainItemStatus
@@ -34,7 +35,15 @@ def user_to_db(domain_user: DomainUser) -> SQLAlchemyUser:
 
 
 def item_to_domain(db_item: SQLAlchemyItem) -> DomainItem:
-    """Convierte un modelo SQLAlchemy Item a entidad de dominio."""
+    """
+    Convierte un modelo SQLAlchemy Item a entidad de dominio.
+
+    Si la relación ``status_rel`` ya está cargada se incluye el estado;
+    nunca se dispara una carga perezosa desde aquí.
+    """
+    status = None
+    if "status_rel" not in inspect(db_item).unloaded and db_item.status_rel is not None:
+        status = item_status_to_domain(db_item.status_rel)
     return DomainItem(
         id=db_item.id,
         name=db_item.name,
@@ -43,7 +52,10 @@ def item_to_domain(db_item: SQLAlchemyItem) -> DomainItem:
         publication_url=db_item.publication_url,
         reported_user=db_item.reported_user,
         creation_date=db_item.creation_date,
-        status_id=db_item.status_id
+        status_id=db_item.status_id,
+        updated_at=db_item.updated_at,
+        version=db_item.version,
+        status=status
     )
 
 
@@ -61,6 +73,26 @@ def item_to_db(domain_item: DomainItem) -> SQLAlchemyItem:
     )
 
 
+def item_row_to_domain(row) -> DomainItem:
+    """
+    Convierte una fila de columnas de ``items`` más ``status`` (nombre del
+    estado), como la devuelta por un ``RETURNING``, a entidad de dominio.
+    """
+    return DomainItem(
+        id=row.id,
+        name=row.name,
+        description=row.description,
+        ticket_url=row.ticket_url,
+        publication_url=row.publication_url,
+        reported_user=row.reported_user,
+        creation_date=row.creation_date,
+        status_id=row.status_id,
+        updated_at=row.updated_at,
+        version=row.version,
+        status=DomainItemStatus(id=row.status_id, status=row.status)
+    )
+
+
 def item_status_to_domain(db_status: SQLAlchemyItemStatus) -> DomainItemStatus:
     """Convierte un modelo SQLAlchemy ItemStatus a entidad de dominio."""
     return DomainItemStatus(
@@ -2,5 +2,6 @@
 from .user_model import User
 from .item_status_model import ItemStatus
 from .item_model import Item
+from .item_counter_model import ItemCounter
 
-__all__ = ["User", "ItemStatus", "Item"]
+__all__ = ["User", "ItemStatus", "Item", "ItemCounter"]
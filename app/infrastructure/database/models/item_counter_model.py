@@ -0,0 +1,17 @@
+"""Modelo SQLAlchemy de contadores de items."""
+from sqlalchemy import Column, Integer, String
+from app.infrastructure.database.base import Base
+
+
+class ItemCounter(Base):
+    """
+    Número de items por dimensión (``status`` o ``reporter``) y valor.
+    
+    Se mantiene en la misma transacción que las escrituras de items;
+    ``label`` es el ID de estado o el usuario reportante ("" si no hay).
+    """
+    __tablename__ = "item_counters"
+
+    dimension = Column(String(16), primary_key=True)
+    label = Column(String(128), primary_key=True)
+    item_count = Column(Integer, nullable=False, default=0)
@@ -1,5 +1,5 @@
 """Modelo SQLAlchemy de Item."""
-from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey
+from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, Index, DDL, event
 from sqlalchemy.orm import relationship
 from datetime import datetime
 from app.infrastructure.database.base import Base
@@ -17,6 +17,39 @@ class Item(Base):
     reported_user = Column(String(128), nullable=True)
     creation_date = Column(DateTime, nullable=False, default=datetime.utcnow)
     status_id = Column(Integer, ForeignKey("items_status.id"), nullable=False, default=1)
+    # Validadores HTTP (ETag / Last-Modified); los mantiene el repositorio en cada escritura
+    updated_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+    version = Column(Integer, nullable=False, default=1)
 
     status_rel = relationship("ItemStatus", back_populates="items")
 
+    __table_args__ = (
+        # Paginación por cursor (keyset) sobre (creation_date, id)
+        Index("ix_items_creation_date_id", "creation_date", "id"),
+        # Filtros del listado ordenados por fecha: por estado y por reportante
+        Index("ix_items_status_id_creation_date", "status_id", "creation_date"),
+        Index("ix_items_reported_user_creation_date", "reported_user", "creation_date"),
+    )
+
+
+
+# Búsqueda de texto completo.
+# En PostgreSQL el índice GIN sobre la expresión tsvector de name y
+# description lo crea la migración 0005 y no se declara aquí. En SQLite
+# (tests) se crea una tabla FTS5 sincronizada con ``items`` mediante triggers.
+_SQLITE_FTS_DDL = (
+    "CREATE VIRTUAL TABLE IF NOT EXISTS items_fts USING fts5("
+    "name, description, content='items', content_rowid='id')",
+    "CREATE TRIGGER IF NOT EXISTS items_fts_ai AFTER INSERT ON items BEGIN "
+    "INSERT INTO items_fts(rowid, name, description) VALUES (new.id, new.name, new.description); END",
+    "CREATE TRIGGER IF NOT EXISTS items_fts_ad AFTER DELETE ON items BEGIN "
+    "INSERT INTO items_fts(items_fts, rowid, name, description) "
+    "VALUES ('delete', old.id, old.name, old.description); END",
+    "CREATE TRIGGER IF NOT EXISTS items_fts_au AFTER UPDATE ON items BEGIN "
+    "INSERT INTO items_fts(items_fts, rowid, name, description) "
+    "VALUES ('delete', old.id, old.name, old.description); "
+    "INSERT INTO items_fts(rowid, name, description) VALUES (new.id, new.name, new.description); END",
+)
+
+for _statement in _SQLITE_FTS_DDL:
+    event.listen(Item.__table__, "after_create", DDL(_statement).execute_if(dialect="sqlite"))
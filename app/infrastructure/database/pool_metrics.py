@@ -0,0 +1,90 @@
+"""Instrumentación del pool de conexiones de SQLAlchemy."""
+import threading
+import time
+from typing import Any, Dict, Type
+
+from sqlalchemy import exc
+from sqlalchemy.engine import Engine
+from sqlalchemy.pool import Pool, QueuePool
+
+from app.infrastructure.monitoring.histogram import Histogram
+
+
+class PoolMetrics:
+    """Tiempos de espera al obtener conexión y timeouts de un pool."""
+
+    def __init__(self):
+        self.checkout_wait = Histogram()
+        self._timeouts = 0
+        self._lock = threading.Lock()
+
+    def record_timeout(self) -> None:
+        with self._lock:
+            self._timeouts += 1
+
+    @property
+    def timeouts(self) -> int:
+        return self._timeouts
+
+
+# Métricas por nombre de motor ("primary", "async"...)
+pool_metrics: Dict[str, PoolMetrics] = {}
+
+
+class _InstrumentedPoolMixin:
+    """
+    Mide cuánto espera cada petición hasta obtener una conexión del pool y
+    guarda el ``max_overflow`` configurado (QueuePool no lo expone).
+    """
+
+    metrics: PoolMetrics
+
+    def __init__(self, creator, pool_size: int = 5, max_overflow: int = 10, **kw):
+        super().__init__(creator, pool_size=pool_size, max_overflow=max_overflow, **kw)
+        self.configured_max_overflow = max_overflow
+
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            return super()._do_get()
+        except exc.TimeoutError:
+            self.metrics.record_timeout()
+            raise
+        finally:
+            self.metrics.checkout_wait.observe(time.perf_counter() - started)
+
+
+def instrumented_pool_class(name: str, base: Type[QueuePool] = QueuePool) -> Type[Pool]:
+    """
+    Crea una subclase de ``base`` que registra sus métricas bajo ``name``.
+
+    Las métricas viven en la clase (no en la instancia) para sobrevivir a
+    ``Pool.recreate()``, que instancia de nuevo la misma clase.
+    """
+    metrics = pool_metrics.setdefault(name, PoolMetrics())
+    return type(
+        f"Instrumented{base.__name__}",
+        (_InstrumentedPoolMixin, base),
+        {"metrics": metrics},
+    )
+
+
+def pool_status(name: str, engine: Engine) -> Dict[str, Any]:
+    """Estado actual del pool de ``engine`` y sus métricas acumuladas."""
+    pool = engine.pool
+    status: Dict[str, Any] = {"engine": name, "pool_class": type(pool).__name__}
+    if isinstance(pool, QueuePool):
+        status.update(
+            size=pool.size(),
+            checked_in=pool.checkedin(),
+            checked_out=pool.checkedout(),
+            overflow=pool.overflow(),
+            timeout=pool.timeout(),
+        )
+    if isinstance(pool, _InstrumentedPoolMixin):
+        status["max_overflow"] = pool.configured_max_overflow
+    metrics = pool_metrics.get(name)
+    if metrics is not None:
+        status["timeouts"] = metrics.timeouts
+        status["checkout_wait_seconds"] = metrics.checkout_wait.snapshot()
+    return status
@@ -0,0 +1,137 @@
+"""
+Preparación de la base de datos antes de aceptar tráfico.
+
+Espera a que la base de datos responda, aplica las migraciones de Alembic
+pendientes y comprueba que existen las tablas requeridas, todo en el mismo
+proceso y con el motor de la aplicación (sin lanzar intérpretes ni
+comandos ``alembic`` aparte).
+
+Uso fuera del servidor: ``python -m app.infrastructure.database.readiness``
+"""
+import logging
+import os
+import sys
+import time
+from typing import Callable, List
+
+from sqlalchemy import inspect, text
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import OperationalError
+
+logger = logging.getLogger(__name__)
+
+# Preparar la base de datos al arrancar el servidor (start.sh lo activa;
+# desactivado, se asume la BD ya preparada)
+DB_PREPARE_ON_STARTUP = os.getenv("DB_PREPARE_ON_STARTUP", "false").lower() in ("1", "true", "yes")
+# Segundos máximos esperando a que la base de datos acepte conexiones
+DB_WAIT_TIMEOUT = float(os.getenv("DB_WAIT_TIMEOUT", "60"))
+DB_WAIT_INTERVAL = float(os.getenv("DB_WAIT_INTERVAL", "1"))
+
+REQUIRED_TABLES = ("items", "users", "items_status", "alembic_version")
+
+# Clave del bloqueo consultivo que serializa las migraciones entre procesos
+MIGRATION_LOCK_KEY = 720_230_001
+
+_PROJECT_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+ALEMBIC_INI = os.path.join(_PROJECT_DIR, "alembic.ini")
+
+
+class DatabaseNotReady(Exception):
+    """La base de datos no está disponible o le falta parte del esquema."""
+
+
+def wait_for_database(
+    engine: Engine,
+    timeout: float = DB_WAIT_TIMEOUT,
+    interval: float = DB_WAIT_INTERVAL,
+    sleep: Callable[[float], None] = time.sleep
+) -> None:
+    """
+    Reintenta ``SELECT 1`` hasta que la base de datos responde.
+
+    Raises:
+        DatabaseNotReady: Si no responde en ``timeout`` segundos
+    """
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            with engine.connect() as connection:
+                connection.execute(text("SELECT 1"))
+            return
+        except OperationalError as e:
+            if time.monotonic() >= deadline:
+                raise DatabaseNotReady(f"La base de datos no respondió en {timeout:g}s: {e}") from e
+            logger.info("Esperando a la base de datos...")
+            sleep(interval)
+
+
+def upgrade_schema(engine: Engine) -> None:
+    """
+    Aplica las migraciones pendientes (``alembic upgrade head``) sobre una
+    conexión del motor, con una transacción por migración.
+
+    En PostgreSQL toma un bloqueo consultivo de sesión (no de transacción:
+    las migraciones que crean índices con CONCURRENTLY confirman a mitad),
+    de modo que si arrancan varios procesos a la vez solo uno migra y el
+    resto espera y encuentra el esquema ya actualizado.
+    """
+    from alembic import command
+    from alembic.config import Config
+
+    config = Config(ALEMBIC_INI)
+    config.set_main_option("script_location", os.path.join(_PROJECT_DIR, "alembic"))
+    with engine.connect() as connection:
+        locked = connection.dialect.name == "postgresql"
+        if locked:
+            connection.execute(text("SELECT pg_advisory_lock(:key)"), {"key": MIGRATION_LOCK_KEY})
+            # Alembic abre sus propias transacciones sobre la conexión
+            connection.commit()
+        try:
+            config.attributes["connection"] = connection
+            command.upgrade(config, "head")
+        finally:
+            if locked:
+                connection.rollback()
+                connection.execute(text("SELECT pg_advisory_unlock(:key)"), {"key": MIGRATION_LOCK_KEY})
+                connection.commit()
+
+
+def missing_tables(engine: Engine) -> List[str]:
+    """Tablas de ``REQUIRED_TABLES`` que no existen."""
+    existing = set(inspect(engine).get_table_names())
+    return [table for table in REQUIRED_TABLES if table not in existing]
+
+
+def prepare_database(engine: Engine, migrate: bool = True) -> None:
+    """
+    Espera a la base de datos, aplica las migraciones y verifica el esquema.
+
+    Raises:
+        DatabaseNotReady: Si no responde a tiempo o faltan tablas
+    """
+    wait_for_database(engine)
+    if migrate:
+        upgrade_schema(engine)
+    missing = missing_tables(engine)
+    if missing:
+        raise DatabaseNotReady(f"Faltan las siguientes tablas: {missing}")
+
+
+def main() -> None:
+    """Prepara la base de datos de ``DATABASE_URL`` y termina (código 1 si falla)."""
+    from dotenv import load_dotenv
+
+    load_dotenv()
+    from app.infrastructure.database.session import get_engine
+
+    logging.basicConfig(level=logging.INFO)
+    try:
+        prepare_database(get_engine())
+    except DatabaseNotReady as e:
+        print(f"ERROR: {e}", file=sys.stderr)
+        sys.exit(1)
+    print(f"Base de datos lista; tablas requeridas presentes: {list(REQUIRED_TABLES)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,21 @@
+"""
+Reconstruye los contadores de items (``item_counters``) desde ``items``.
+
+Uso: ``python -m app.infrastructure.database.rebuild_item_counters``
+"""
+from app.application.use_cases.items.rebuild_item_stats import RebuildItemStatsUseCase
+from app.infrastructure.database.session import SessionLocal, get_engine
+from app.infrastructure.repositories.item_repository_impl import ItemRepositoryImpl
+
+
+def main() -> None:
+    """Recalcula los contadores e imprime el resultado por estado."""
+    with SessionLocal(bind=get_engine()) as db:
+        stats = RebuildItemStatsUseCase(ItemRepositoryImpl(db)).execute()
+    print(f"Contadores reconstruidos: {stats.total} items")
+    for status_id, count in sorted(stats.by_status.items()):
+        print(f"  estado {status_id}: {count}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,137 @@
+"""
+Enrutado de sesiones entre la base de datos primaria y sus réplicas de lectura.
+
+Las escrituras usan siempre la primaria. Las lecturas van a las réplicas por
+turnos, salvo para un cliente que confirmó una escritura hace menos de
+``stickiness_seconds``: ese cliente sigue leyendo de la primaria y ve sus
+propios cambios aunque las réplicas vayan con retraso.
+
+Lo que fija al cliente es un token firmado con el instante hasta el que
+debe leer de la primaria, que el propio cliente devuelve (cookie o
+cabecera). Así funciona igual con varios workers o instancias, sin estado
+compartido en el servidor; los relojes de los procesos deben estar
+sincronizados.
+"""
+import hashlib
+import hmac
+import threading
+import time
+from typing import Any, Callable, Dict, MutableMapping, Optional, Sequence
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session, sessionmaker
+
+# Claves en ``Session.info``
+_ROUTER = "session_router"
+_STICKY_SINK = "sticky_token_sink"
+ROUTED_TO = "routed_to"
+
+# Valores de ``Session.info[ROUTED_TO]``
+PRIMARY = "primary"
+REPLICA = "replica"
+STICKY = "sticky"
+
+# Clave en el ``sink`` de la sesión (el scope ASGI de la petición) del
+# token emitido tras un commit, como ``(token, segundos de validez)``
+STICKY_TOKEN = "db_sticky_token"
+
+
+class SessionRouter:
+    """
+    Crea sesiones contra la primaria o una réplica y emite y valida los
+    tokens que fijan a un cliente a la primaria.
+
+    Las sesiones de ``primary_session`` reciben un ``sink`` (un diccionario);
+    al confirmar una transacción se deja en él, bajo ``STICKY_TOKEN``, un
+    token válido durante ``stickiness_seconds`` junto con esa duración.
+    """
+
+    def __init__(
+        self,
+        primary: sessionmaker,
+        replicas: Sequence[sessionmaker] = (),
+        stickiness_seconds: float = 5.0,
+        secret: str = "",
+        clock: Callable[[], float] = time.time
+    ):
+        self.primary = primary
+        self.replicas = list(replicas)
+        self.stickiness_seconds = stickiness_seconds
+        self.secret = secret.encode()
+        self.clock = clock
+        self._next_replica = 0
+        self._lock = threading.Lock()
+        self.replica_reads = 0
+        self.sticky_reads = 0
+        self.tokens_issued = 0
+
+    @property
+    def has_replicas(self) -> bool:
+        return bool(self.replicas)
+
+    def primary_session(self, sink: Optional[MutableMapping[str, Any]] = None) -> Session:
+        """Sesión contra la primaria; sus commits dejan un token en ``sink``."""
+        db = self.primary()
+        db.info.update({_ROUTER: self, _STICKY_SINK: sink, ROUTED_TO: PRIMARY})
+        return db
+
+    def replica_session(self) -> Session:
+        """Sesión contra la siguiente réplica (por turnos)."""
+        with self._lock:
+            factory = self.replicas[self._next_replica % len(self.replicas)]
+            self._next_replica += 1
+            self.replica_reads += 1
+        db = factory()
+        db.info[ROUTED_TO] = REPLICA
+        return db
+
+    def _sign(self, payload: str) -> str:
+        return hmac.new(self.secret, payload.encode(), hashlib.sha256).hexdigest()
+
+    def sticky_token(self) -> Optional[str]:
+        """Token que fija al cliente a la primaria (None sin réplicas)."""
+        if not self.replicas or self.stickiness_seconds <= 0:
+            return None
+        payload = f"{self.clock() + self.stickiness_seconds:.3f}"
+        with self._lock:
+            self.tokens_issued += 1
+        return f"{payload}.{self._sign(payload)}"
+
+    def is_sticky(self, token: Optional[str]) -> bool:
+        """Indica si el token es auténtico y sigue vigente."""
+        if not token:
+            return False
+        # El instante lleva un punto decimal: el separador es el último punto
+        payload, _, signature = token.rpartition(".")
+        if not hmac.compare_digest(signature, self._sign(payload)):
+            return False
+        try:
+            until = float(payload)
+        except ValueError:
+            return False
+        if until <= self.clock():
+            return False
+        with self._lock:
+            self.sticky_reads += 1
+        return True
+
+    def stats(self) -> Dict[str, Any]:
+        """Réplicas configuradas, lecturas enrutadas y tokens emitidos."""
+        return {
+            "replicas": len(self.replicas),
+            "stickiness_seconds": self.stickiness_seconds,
+            "replica_reads": self.replica_reads,
+            "sticky_reads": self.sticky_reads,
+            "sticky_tokens_issued": self.tokens_issued,
+        }
+
+
+@event.listens_for(Session, "after_commit")
+def _issue_token_after_commit(session: Session) -> None:
+    router = session.info.get(_ROUTER)
+    sink = session.info.get(_STICKY_SINK)
+    if router is None or sink is None:
+        return
+    token = router.sticky_token()
+    if token is not None:
+        sink[STICKY_TOKEN] = (token, router.stickiness_seconds)
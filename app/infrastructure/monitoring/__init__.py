@@ -0,0 +1 @@
+"""Métricas e instrumentación de la aplicación."""
@@ -0,0 +1,43 @@
+"""Histograma acumulativo de latencias."""
+import bisect
+import threading
+from typing import Any, Dict, Sequence
+
+# Límites superiores en segundos (el último cubo, +Inf, es implícito)
+DEFAULT_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+
+class Histogram:
+    """Histograma de cubos fijos, seguro entre hilos."""
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS):
+        self.buckets = tuple(sorted(buckets))
+        self._counts = [0] * (len(self.buckets) + 1)
+        self._sum = 0.0
+        self._lock = threading.Lock()
+
+    def observe(self, value: float) -> None:
+        """Registra una observación."""
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            self._counts[index] += 1
+            self._sum += value
+
+    @property
+    def count(self) -> int:
+        """Número total de observaciones."""
+        return sum(self._counts)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Recuentos acumulados por límite superior (formato Prometheus)."""
+        with self._lock:
+            counts = list(self._counts)
+            total = self._sum
+        cumulative = {}
+        running = 0
+        for bound, value in zip(self.buckets, counts):
+            running += value
+            cumulative[str(bound)] = running
+        running += counts[-1]
+        cumulative["+Inf"] = running
+        return {"buckets": cumulative, "count": running, "sum": total}
@@ -0,0 +1,259 @@
+"""
+Registro de métricas con exposición en formato de texto de Prometheus.
+
+Contadores, gauges e histogramas con etiquetas, seguros entre hilos y sin
+dependencias externas. Los colectores añaden en cada lectura valores que
+ya mantiene otro componente (pools de conexiones, cachés...).
+
+Con varios workers, cada proceso solo ve sus propias peticiones. Si
+``METRICS_MULTIPROCESS_DIR`` apunta a un directorio compartido, cada worker
+vuelca ahí su instantánea cada ``METRICS_FLUSH_SECONDS`` y ``/metrics``
+suma las de todos: contadores e histogramas de cualquier proceso que haya
+existido (no retroceden al reiniciarse un worker) y gauges solo de los
+procesos vivos.
+"""
+import json
+import os
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from app.infrastructure.monitoring.histogram import DEFAULT_BUCKETS, Histogram
+
+METRICS_MULTIPROCESS_DIR = os.getenv("METRICS_MULTIPROCESS_DIR", "")
+METRICS_FLUSH_SECONDS = float(os.getenv("METRICS_FLUSH_SECONDS", "5"))
+
+LabelValues = Tuple[str, ...]
+# Instantánea serializable: nombre -> {type, help, labels, samples: [[valores de etiqueta, valor]]}
+Snapshot = Dict[str, Dict[str, Any]]
+
+
+class _Metric:
+    kind = ""
+
+    def __init__(self, name: str, help: str, labels: Sequence[str] = ()):
+        self.name = name
+        self.help = help
+        self.labels = tuple(labels)
+        self._values: Dict[LabelValues, Any] = {}
+        self._lock = threading.Lock()
+
+    def _samples(self) -> List[list]:
+        with self._lock:
+            return [[list(labels), value] for labels, value in self._values.items()]
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {"type": self.kind, "help": self.help, "labels": list(self.labels), "samples": self._samples()}
+
+
+class Counter(_Metric):
+    """Valor que solo crece."""
+    kind = "counter"
+
+    def inc(self, labels: LabelValues = (), amount: float = 1) -> None:
+        with self._lock:
+            self._values[labels] = self._values.get(labels, 0) + amount
+
+
+class Gauge(_Metric):
+    """Valor que sube y baja (peticiones en curso, conexiones...)."""
+    kind = "gauge"
+
+    def inc(self, labels: LabelValues = (), amount: float = 1) -> None:
+        with self._lock:
+            self._values[labels] = self._values.get(labels, 0) + amount
+
+    def dec(self, labels: LabelValues = (), amount: float = 1) -> None:
+        self.inc(labels, -amount)
+
+    def set(self, labels: LabelValues, value: float) -> None:
+        with self._lock:
+            self._values[labels] = value
+
+
+class LabelledHistogram(_Metric):
+    """Un ``Histogram`` por combinación de etiquetas."""
+    kind = "histogram"
+
+    def __init__(self, name: str, help: str, labels: Sequence[str] = (), buckets: Sequence[float] = DEFAULT_BUCKETS):
+        super().__init__(name, help, labels)
+        self.buckets = tuple(buckets)
+
+    def observe(self, labels: LabelValues, value: float) -> None:
+        histogram = self._values.get(labels)
+        if histogram is None:
+            with self._lock:
+                histogram = self._values.setdefault(labels, Histogram(self.buckets))
+        histogram.observe(value)
+
+    def _samples(self) -> List[list]:
+        with self._lock:
+            items = list(self._values.items())
+        return [[list(labels), histogram.snapshot()] for labels, histogram in items]
+
+
+class MetricsRegistry:
+    """Métricas del proceso y colectores que se evalúan al leerlas."""
+
+    def __init__(self, multiprocess_dir: str = METRICS_MULTIPROCESS_DIR, flush_seconds: float = METRICS_FLUSH_SECONDS):
+        self._metrics: Dict[str, _Metric] = {}
+        self._collectors: List[Callable[[], Snapshot]] = []
+        self._lock = threading.Lock()
+        self.multiprocess_dir = multiprocess_dir
+        self.flush_seconds = flush_seconds
+        self._last_flush = 0.0
+
+    def _register(self, metric: _Metric) -> Any:
+        with self._lock:
+            existing = self._metrics.get(metric.name)
+            if existing is not None:
+                if type(existing) is not type(metric) or existing.labels != metric.labels:
+                    raise ValueError(f"Métrica '{metric.name}' ya registrada con otro tipo o etiquetas")
+                return existing
+            self._metrics[metric.name] = metric
+            return metric
+
+    def counter(self, name: str, help: str, labels: Sequence[str] = ()) -> Counter:
+        return self._register(Counter(name, help, labels))
+
+    def gauge(self, name: str, help: str, labels: Sequence[str] = ()) -> Gauge:
+        return self._register(Gauge(name, help, labels))
+
+    def histogram(
+        self,
+        name: str,
+        help: str,
+        labels: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS
+    ) -> LabelledHistogram:
+        return self._register(LabelledHistogram(name, help, labels, buckets))
+
+    def register_collector(self, collector: Callable[[], Snapshot]) -> None:
+        """Añade una función que devuelve métricas en formato de instantánea."""
+        self._collectors.append(collector)
+
+    def snapshot(self) -> Snapshot:
+        """Métricas del proceso, incluidas las de los colectores."""
+        with self._lock:
+            metrics = list(self._metrics.values())
+        snapshot = {metric.name: metric.snapshot() for metric in metrics}
+        for collector in self._collectors:
+            snapshot.update(collector())
+        return snapshot
+
+    def flush(self) -> None:
+        """Vuelca la instantánea del proceso a ``multiprocess_dir`` (escritura atómica)."""
+        if not self.multiprocess_dir:
+            return
+        self._last_flush = time.monotonic()
+        pid = os.getpid()
+        path = os.path.join(self.multiprocess_dir, f"{pid}.json")
+        temporary = f"{path}.tmp"
+        with open(temporary, "w") as handle:
+            json.dump({"pid": pid, "metrics": self.snapshot()}, handle)
+        os.replace(temporary, path)
+
+    def maybe_flush(self) -> None:
+        """Vuelca si han pasado ``flush_seconds`` desde el último volcado."""
+        if self.multiprocess_dir and time.monotonic() - self._last_flush >= self.flush_seconds:
+            self.flush()
+
+    def collect(self) -> Snapshot:
+        """Instantánea del proceso o, en modo multiproceso, la suma de todos los workers."""
+        if not self.multiprocess_dir:
+            return self.snapshot()
+        self.flush()
+        snapshots = []
+        for filename in os.listdir(self.multiprocess_dir):
+            if not filename.endswith(".json"):
+                continue
+            try:
+                with open(os.path.join(self.multiprocess_dir, filename)) as handle:
+                    data = json.load(handle)
+            except (OSError, ValueError):
+                continue
+            snapshots.append((_is_alive(data["pid"]), data["metrics"]))
+        return merge_snapshots(snapshots)
+
+    def render(self) -> str:
+        return render_text(self.collect())
+
+
+def _is_alive(pid: int) -> bool:
+    if pid == os.getpid():
+        return True
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+def merge_snapshots(snapshots: Iterable[Tuple[bool, Snapshot]]) -> Snapshot:
+    """
+    Suma instantáneas de varios procesos, dadas como ``(vivo, instantánea)``.
+
+    Los gauges de procesos que ya no existen se descartan.
+    """
+    merged: Snapshot = {}
+    for alive, snapshot in snapshots:
+        for name, metric in snapshot.items():
+            if metric["type"] == "gauge" and not alive:
+                continue
+            target = merged.setdefault(name, {**metric, "samples": {}})
+            for labels, value in metric["samples"]:
+                key = tuple(labels)
+                current = target["samples"].get(key)
+                if current is None:
+                    target["samples"][key] = value
+                elif metric["type"] == "histogram":
+                    target["samples"][key] = {
+                        "buckets": {bound: current["buckets"].get(bound, 0) + count for bound, count in value["buckets"].items()},
+                        "count": current["count"] + value["count"],
+                        "sum": current["sum"] + value["sum"],
+                    }
+                else:
+                    target["samples"][key] = current + value
+    for metric in merged.values():
+        metric["samples"] = [[list(labels), value] for labels, value in metric["samples"].items()]
+    return merged
+
+
+def _escape(value: Any) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _label_text(names: Sequence[str], values: Sequence[Any], extra: Optional[Tuple[str, str]] = None) -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra is not None:
+        pairs.append(f'{extra[0]}="{extra[1]}"')
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _number(value: float) -> str:
+    return str(int(value)) if float(value).is_integer() else repr(float(value))
+
+
+def render_text(snapshot: Snapshot) -> str:
+    """Formato de exposición de texto de Prometheus (versión 0.0.4)."""
+    lines = []
+    for name in sorted(snapshot):
+        metric = snapshot[name]
+        lines.append(f"# HELP {name} {metric['help']}")
+        lines.append(f"# TYPE {name} {metric['type']}")
+        for labels, value in sorted(metric["samples"], key=lambda sample: sample[0]):
+            if metric["type"] == "histogram":
+                for bound, count in value["buckets"].items():
+                    lines.append(f"{name}_bucket{_label_text(metric['labels'], labels, ('le', bound))} {count}")
+                label_text = _label_text(metric["labels"], labels)
+                lines.append(f"{name}_sum{label_text} {_number(value['sum'])}")
+                lines.append(f"{name}_count{label_text} {value['count']}")
+            else:
+                lines.append(f"{name}{_label_text(metric['labels'], labels)} {_number(value)}")
+    return "\n".join(lines) + "\n"
+
+
+# Registro del proceso
+metrics = MetricsRegistry()
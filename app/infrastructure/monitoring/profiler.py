@@ -0,0 +1,161 @@
+"""
+Perfilador por muestreo de pilas y almacén de perfiles en disco.
+
+Mientras dura un perfil, un hilo toma cada ``PROFILER_INTERVAL_MS`` la pila
+de todos los hilos del proceso y cuenta las que pasan por código de la
+aplicación (paquete ``app``), lo que excluye hilos ociosos y el bucle de
+eventos en espera. El resultado se guarda en formato de pilas colapsadas
+(``marco;marco;marco cuenta``), que leen flamegraph.pl, speedscope o
+inferno. Los perfiles forman un anillo de ``PROFILER_MAX_FILES`` ficheros:
+al escribir uno nuevo se borran los más antiguos.
+
+Las pilas son del proceso, no de una petición: si hay otras peticiones
+ejecutando código de la aplicación a la vez, sus muestras también aparecen.
+"""
+import os
+import re
+import sys
+import tempfile
+import threading
+import time
+from collections import Counter
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from types import CodeType, FrameType
+from typing import Dict, List, Optional
+
+# Fracción de peticiones perfiladas (0 = ninguna)
+PROFILER_SAMPLE_RATE = float(os.getenv("PROFILER_SAMPLE_RATE", "0"))
+# Permite a un admin perfilar su petición con la cabecera X-Profile
+PROFILER_ALLOW_HEADER = os.getenv("PROFILER_ALLOW_HEADER", "false").lower() in ("1", "true", "yes")
+PROFILER_INTERVAL_MS = float(os.getenv("PROFILER_INTERVAL_MS", "2"))
+PROFILER_DIR = os.getenv("PROFILER_DIR", os.path.join(tempfile.gettempdir(), "ticketing-profiles"))
+PROFILER_MAX_FILES = int(os.getenv("PROFILER_MAX_FILES", "50"))
+
+PROFILE_SUFFIX = ".folded"
+
+_APP_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))) + os.sep
+_UNSAFE_NAME = re.compile(r"[^A-Za-z0-9_.-]+")
+
+
+def is_profiling_enabled() -> bool:
+    """Indica si hay que instalar el middleware de perfiles."""
+    return PROFILER_SAMPLE_RATE > 0 or PROFILER_ALLOW_HEADER
+
+
+class StackSampler:
+    """Hilo que muestrea las pilas del proceso hasta llamar a ``stop``."""
+
+    def __init__(self, interval_seconds: float = PROFILER_INTERVAL_MS / 1000):
+        self.interval_seconds = interval_seconds
+        self.stacks: Counter = Counter()
+        self._labels: Dict[CodeType, str] = {}
+        self._stopped = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="stack-sampler", daemon=True)
+
+    def start(self) -> "StackSampler":
+        self._thread.start()
+        return self
+
+    def stop(self) -> Counter:
+        """Detiene el muestreo y devuelve las pilas colapsadas con su número de muestras."""
+        self._stopped.set()
+        self._thread.join()
+        return self.stacks
+
+    def _label(self, code: CodeType) -> str:
+        label = self._labels.get(code)
+        if label is None:
+            filename = code.co_filename
+            if filename.startswith(_APP_DIR):
+                filename = os.path.relpath(filename, os.path.dirname(_APP_DIR.rstrip(os.sep)))
+            else:
+                filename = os.path.basename(filename)
+            # ';' separa marcos en el formato colapsado
+            label = f"{code.co_name} ({filename}:{code.co_firstlineno})".replace(";", ":")
+            self._labels[code] = label
+        return label
+
+    def _collapse(self, frame: Optional[FrameType]) -> Optional[str]:
+        codes = []
+        in_app = False
+        while frame is not None:
+            codes.append(frame.f_code)
+            in_app = in_app or frame.f_code.co_filename.startswith(_APP_DIR)
+            frame = frame.f_back
+        if not in_app:
+            return None
+        return ";".join(self._label(code) for code in reversed(codes))
+
+    def _run(self) -> None:
+        own_id = threading.get_ident()
+        while not self._stopped.wait(self.interval_seconds):
+            for thread_id, frame in sys._current_frames().items():
+                if thread_id == own_id:
+                    continue
+                stack = self._collapse(frame)
+                if stack is not None:
+                    self.stacks[stack] += 1
+
+
+@dataclass
+class ProfileInfo:
+    name: str
+    size: int
+    created_at: datetime
+
+
+class ProfileStore:
+    """Anillo de perfiles en un directorio, con nombres seguros para descargar."""
+
+    def __init__(self, directory: str = PROFILER_DIR, max_files: int = PROFILER_MAX_FILES):
+        self.directory = directory
+        self.max_files = max_files
+        self._lock = threading.Lock()
+
+    def new_name(self, method: str, path: str) -> str:
+        """Nombre único y ordenable por fecha para el perfil de una petición."""
+        slug = _UNSAFE_NAME.sub("_", path.strip("/")) or "root"
+        return f"{time.time_ns() // 1000}-{os.getpid()}-{method}-{slug[:60]}{PROFILE_SUFFIX}"
+
+    def save(self, name: str, stacks: Counter) -> None:
+        """Escribe un perfil y borra los más antiguos por encima de ``max_files``."""
+        os.makedirs(self.directory, exist_ok=True)
+        path = os.path.join(self.directory, name)
+        with open(f"{path}.tmp", "w") as handle:
+            for stack, count in stacks.most_common():
+                handle.write(f"{stack} {count}\n")
+        os.replace(f"{path}.tmp", path)
+        with self._lock:
+            names = self._names()
+            for old in names[:max(len(names) - self.max_files, 0)]:
+                try:
+                    os.remove(os.path.join(self.directory, old))
+                except FileNotFoundError:
+                    pass
+
+    def _names(self) -> List[str]:
+        try:
+            return sorted(name for name in os.listdir(self.directory) if name.endswith(PROFILE_SUFFIX))
+        except FileNotFoundError:
+            return []
+
+    def list(self) -> List[ProfileInfo]:
+        """Perfiles guardados, del más reciente al más antiguo."""
+        profiles = []
+        for name in reversed(self._names()):
+            try:
+                stat = os.stat(os.path.join(self.directory, name))
+            except FileNotFoundError:
+                continue
+            profiles.append(ProfileInfo(name, stat.st_size, datetime.fromtimestamp(stat.st_mtime, timezone.utc)))
+        return profiles
+
+    def path(self, name: str) -> Optional[str]:
+        """Ruta de un perfil existente; None si el nombre no es uno de los guardados."""
+        if name not in self._names():
+            return None
+        return os.path.join(self.directory, name)
+
+
+profile_store = ProfileStore()
@@ -0,0 +1,125 @@
+"""
+Instrumentación de sentencias SQL por petición.
+
+Los listeners de ``install_query_listeners`` miden cada sentencia de un
+motor y la suman a las estadísticas de la petición en curso (una variable
+de contexto, que los hilos del threadpool heredan) y a las de cualquier
+``observe_queries`` activo. Las sentencias que superan
+``SQL_SLOW_QUERY_MS`` se registran en el log.
+"""
+import heapq
+import logging
+import os
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Iterator, List, Optional, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+# Umbral en milisegundos para registrar una sentencia lenta (0 = no registrar)
+SQL_SLOW_QUERY_MS = float(os.getenv("SQL_SLOW_QUERY_MS", "200"))
+# Sentencias más lentas que se conservan por petición
+SQL_SLOWEST_PER_REQUEST = int(os.getenv("SQL_SLOWEST_PER_REQUEST", "3"))
+
+logger = logging.getLogger(__name__)
+
+_STARTED = "query_stats_started"
+_MAX_STATEMENT_LENGTH = 500
+
+
+@dataclass
+class QueryStats:
+    """Sentencias ejecutadas, tiempo total en la base de datos y las más lentas."""
+    count: int = 0
+    total_seconds: float = 0.0
+    # Montículo de (segundos, sentencia) con las SQL_SLOWEST_PER_REQUEST más lentas
+    slowest: List[Tuple[float, str]] = field(default_factory=list)
+    statements: Optional[List[str]] = None
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
+
+    def record(self, statement: str, seconds: float) -> None:
+        with self._lock:
+            self.count += 1
+            self.total_seconds += seconds
+            if self.statements is not None:
+                self.statements.append(statement)
+            entry = (seconds, statement[:_MAX_STATEMENT_LENGTH])
+            if len(self.slowest) < SQL_SLOWEST_PER_REQUEST:
+                heapq.heappush(self.slowest, entry)
+            elif self.slowest and entry > self.slowest[0]:
+                heapq.heapreplace(self.slowest, entry)
+
+    def slowest_first(self) -> List[Tuple[float, str]]:
+        """Sentencias más lentas, de mayor a menor duración."""
+        return sorted(self.slowest, reverse=True)
+
+
+_request_stats: ContextVar[Optional[QueryStats]] = ContextVar("request_query_stats", default=None)
+_observers: List[QueryStats] = []
+_observers_lock = threading.Lock()
+
+
+def current_query_stats() -> Optional[QueryStats]:
+    """Estadísticas de la petición en curso (None fuera de ``track_queries``)."""
+    return _request_stats.get()
+
+
+@contextmanager
+def track_queries() -> Iterator[QueryStats]:
+    """Acumula las sentencias del contexto actual (una petición) en un ``QueryStats`` nuevo."""
+    stats = QueryStats()
+    token = _request_stats.set(stats)
+    try:
+        yield stats
+    finally:
+        _request_stats.reset(token)
+
+
+@contextmanager
+def observe_queries(keep_statements: bool = True) -> Iterator[QueryStats]:
+    """
+    Acumula las sentencias de todos los hilos mientras dura el bloque.
+
+    Pensado para tests y benchmarks, donde la petición corre en otro hilo
+    sin el contexto del llamador. Con ``keep_statements`` guarda también
+    el texto de cada sentencia.
+    """
+    stats = QueryStats(statements=[] if keep_statements else None)
+    with _observers_lock:
+        _observers.append(stats)
+    try:
+        yield stats
+    finally:
+        with _observers_lock:
+            _observers.remove(stats)
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    # En el contexto de ejecución y no en la conexión: si la sentencia
+    # falla no hay after_cursor_execute y no queda nada que limpiar
+    setattr(context, _STARTED, time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    started = getattr(context, _STARTED, None)
+    if started is None:
+        return
+    seconds = time.perf_counter() - started
+    stats = _request_stats.get()
+    if stats is not None:
+        stats.record(statement, seconds)
+    for observer in _observers:
+        observer.record(statement, seconds)
+    if SQL_SLOW_QUERY_MS and seconds * 1000 >= SQL_SLOW_QUERY_MS:
+        logger.warning("Sentencia SQL lenta (%.1f ms): %s", seconds * 1000, statement[:_MAX_STATEMENT_LENGTH])
+
+
+def install_query_listeners(engine: Engine) -> None:
+    """Instrumenta ``engine`` (una sola vez por motor)."""
+    if not event.contains(engine, "before_cursor_execute", _before_cursor_execute):
+        event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(engine, "after_cursor_execute", _after_cursor_execute)
@@ -0,0 +1,62 @@
+"""
+Medición del tiempo de arranque del proceso.
+
+El reloj empieza al importar ``app.main`` (este módulo es lo primero que
+importa) y cada fase del arranque (importación, preparación de la base
+de datos, precalentamiento...) se registra con su duración. Las fases del
+precalentamiento se ejecutan en paralelo, así que sus duraciones pueden
+sumar más que la fase que las contiene.
+"""
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, Optional
+
+
+class StartupReport:
+    """Duración de cada fase del arranque y tiempo total hasta estar listo."""
+
+    def __init__(self, clock: Callable[[], float] = time.perf_counter):
+        self.clock = clock
+        self.started = clock()
+        self.phases: Dict[str, float] = {}
+        self.failed: Dict[str, str] = {}
+        self.ready_seconds: Optional[float] = None
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """Mide el bloque como la fase ``name``; si falla, anota el error y lo relanza."""
+        started = self.clock()
+        try:
+            yield
+        except Exception as e:
+            with self._lock:
+                self.failed[name] = f"{type(e).__name__}: {e}"
+            raise
+        finally:
+            with self._lock:
+                self.phases[name] = self.clock() - started
+
+    def finish(self) -> None:
+        """Marca el proceso como listo para recibir tráfico."""
+        self.ready_seconds = self.clock() - self.started
+
+    def as_dict(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "ready_ms": None if self.ready_seconds is None else round(self.ready_seconds * 1000, 1),
+                "phases_ms": {name: round(seconds * 1000, 1) for name, seconds in self.phases.items()},
+                "failed": dict(self.failed),
+            }
+
+    def summary(self) -> str:
+        """Resumen de una línea para el log."""
+        report = self.as_dict()
+        phases = ", ".join(f"{name}={ms}ms" for name, ms in report["phases_ms"].items())
+        failed = f" (fallidas: {', '.join(report['failed'])})" if report["failed"] else ""
+        return f"listo en {report['ready_ms']}ms: {phases}{failed}"
+
+
+# Informe del proceso
+startup_report = StartupReport()
@@ -0,0 +1,263 @@
+"""Implementación asíncrona de repositorio de items."""
+from typing import Any, Callable, Dict, Optional, List, Tuple
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload
+from app.domain.repositories.async_item_repository import AsyncItemRepository
+from app.domain.entities.item import Item
+from app.domain.entities.item_status import ItemStatus
+from app.domain.entities.item_filters import ItemFilters, ItemSort
+from app.domain.entities.item_stats import ItemStats
+from app.infrastructure.database.models.item_model import Item as SQLAlchemyItem
+from app.infrastructure.database.models.item_status_model import ItemStatus as SQLAlchemyItemStatus
+from app.infrastructure.cache.status_catalog import StatusCatalog
+from app.infrastructure.repositories.keyset_cursor import encode_cursor
+from app.infrastructure.repositories.item_writes import (
+    COUNTED_FIELDS,
+    delete_returning,
+    previous_values_query,
+    returns_previous_values,
+    update_returning,
+)
+from app.infrastructure.repositories.item_counters import (
+    CounterDeltas,
+    counter_deltas,
+    counter_rows,
+    counter_upsert,
+    stats_from_rows,
+    stats_query,
+)
+from app.infrastructure.repositories.item_query import (
+    filter_conditions,
+    keyset_condition,
+    keyset_sort,
+    order_by_clauses,
+)
+from app.infrastructure.database.mappers import (
+    item_to_domain,
+    item_row_to_domain,
+    item_to_db,
+    item_status_to_domain,
+)
+
+
+class AsyncItemRepositoryImpl(AsyncItemRepository):
+    """
+    Implementación asíncrona del repositorio de items.
+    
+    Mismas consultas que ``ItemRepositoryImpl`` sobre una ``AsyncSession``;
+    comparte el ``StatusCatalog`` del proceso si se le pasa.
+    """
+    
+    def __init__(self, db: AsyncSession, status_catalog: Optional[StatusCatalog] = None):
+        self.db = db
+        self.status_catalog = status_catalog
+    
+    async def get_by_id(self, item_id: int) -> Optional[Item]:
+        """Obtiene un item por ID."""
+        db_item = await self.db.get(SQLAlchemyItem, item_id)
+        if db_item is None:
+            return None
+        return item_to_domain(db_item)
+    
+    async def get_all(
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        filters: Optional[ItemFilters] = None,
+        sort: Optional[ItemSort] = None
+    ) -> List[Item]:
+        """Obtiene items filtrados y ordenados con paginación."""
+        result = await self.db.scalars(
+            select(SQLAlchemyItem)
+            .where(*filter_conditions(filters))
+            .order_by(*order_by_clauses(sort))
+            .offset(skip)
+            .limit(limit)
+        )
+        return [item_to_domain(db_item) for db_item in result]
+    
+    async def get_by_id_with_status(self, item_id: int) -> Optional[Item]:
+        """Obtiene un item por ID con su estado cargado en la misma consulta."""
+        db_item = await self.db.scalar(self._select_with_status().where(SQLAlchemyItem.id == item_id))
+        if db_item is None:
+            return None
+        return item_to_domain(db_item)
+    
+    async def get_all_with_status(
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        filters: Optional[ItemFilters] = None,
+        sort: Optional[ItemSort] = None
+    ) -> List[Item]:
+        """Obtiene items filtrados y ordenados con su estado cargado en la misma consulta."""
+        result = await self.db.scalars(
+            self._select_with_status()
+            .where(*filter_conditions(filters))
+            .order_by(*order_by_clauses(sort))
+            .offset(skip)
+            .limit(limit)
+        )
+        return [item_to_domain(db_item) for db_item in result]
+    
+    async def get_page(
+        self,
+        cursor: Optional[str] = None,
+        limit: int = 100,
+        filters: Optional[ItemFilters] = None,
+        sort: Optional[ItemSort] = None
+    ) -> Tuple[List[Item], Optional[str]]:
+        """Obtiene una página por keyset sobre (creation_date, id)."""
+        sort = keyset_sort(sort)
+        stmt = self._select_with_status().where(*filter_conditions(filters))
+        if cursor:
+            stmt = stmt.where(keyset_condition(cursor, sort))
+        stmt = stmt.order_by(*order_by_clauses(sort)).limit(limit + 1)
+        db_items = list(await self.db.scalars(stmt))
+        next_cursor = None
+        if len(db_items) > limit:
+            db_items = db_items[:limit]
+            last = db_items[-1]
+            next_cursor = encode_cursor(last.creation_date, last.id)
+        return [item_to_domain(db_item) for db_item in db_items], next_cursor
+    
+    async def create(self, item: Item) -> Item:
+        """Crea un nuevo item."""
+        db_item = item_to_db(item)
+        self.db.add(db_item)
+        await self.db.flush()
+        await self._apply_counters(counter_deltas(added=[(db_item.status_id, db_item.reported_user)]))
+        await self.db.commit()
+        return await self._reload_with_status(db_item.id)
+    
+    async def update(self, item: Item) -> Item:
+        """Actualiza un item existente."""
+        updated = await self.update_fields(item.id, {
+            "name": item.name,
+            "description": item.description,
+            "ticket_url": item.ticket_url,
+            "publication_url": item.publication_url,
+            "reported_user": item.reported_user,
+            "status_id": item.status_id,
+        })
+        if updated is None:
+            raise ValueError(f"Item con id {item.id} no encontrado")
+        return updated
+    
+    async def update_fields(
+        self,
+        item_id: int,
+        fields: Dict[str, Any],
+        expected_version: Optional[int] = None
+    ) -> Optional[Item]:
+        """Actualiza campos con ``UPDATE ... RETURNING`` (ver ``ItemRepositoryImpl``)."""
+        counted = any(name in fields for name in COUNTED_FIELDS)
+        in_statement = counted and returns_previous_values(self.db.get_bind().dialect.name)
+        previous = None
+        if counted and not in_statement:
+            previous = (await self.db.execute(previous_values_query(SQLAlchemyItem.id == item_id))).first()
+            if previous is None:
+                await self.db.rollback()
+                return None
+        result = await self.db.execute(update_returning(
+            item_id, fields, with_previous=in_statement, expected_version=expected_version
+        ))
+        row = result.first()
+        if row is None:
+            await self.db.rollback()
+            return None
+        if counted:
+            removed = (
+                (row.previous_status_id, row.previous_reported_user) if in_statement
+                else (previous.status_id, previous.reported_user)
+            )
+            await self._apply_counters(counter_deltas(added=[(row.status_id, row.reported_user)], removed=[removed]))
+        await self.db.commit()
+        return item_row_to_domain(row)
+    
+    async def delete(self, item_id: int) -> bool:
+        """Elimina un item con ``DELETE ... RETURNING``."""
+        row = (await self.db.execute(delete_returning(item_id))).first()
+        if row is None:
+            await self.db.rollback()
+            return False
+        await self._apply_counters(counter_deltas(removed=[(row.status_id, row.reported_user)]))
+        await self.db.commit()
+        return True
+    
+    async def get_stats(self, reporter_limit: int = 100) -> ItemStats:
+        """Obtiene el número de items por estado y por reportante desde los contadores."""
+        result = await self.db.execute(stats_query(reporter_limit))
+        return stats_from_rows(result)
+    
+    async def get_status_by_name(self, status: str) -> Optional[ItemStatus]:
+        """Obtiene un estado por nombre."""
+        if self.status_catalog is not None:
+            return await self._find_in_catalog(lambda catalog: catalog.get_by_name(status))
+        db_status = await self.db.scalar(
+            select(SQLAlchemyItemStatus).where(SQLAlchemyItemStatus.status == status)
+        )
+        if db_status is None:
+            return None
+        return item_status_to_domain(db_status)
+    
+    async def get_all_statuses(self) -> List[ItemStatus]:
+        """Obtiene todos los estados."""
+        if self.status_catalog is not None:
+            return (await self._catalog()).all()
+        return await self._load_statuses()
+    
+    async def get_status_by_id(self, status_id: int) -> Optional[ItemStatus]:
+        """Obtiene un estado por ID."""
+        if self.status_catalog is not None:
+            return await self._find_in_catalog(lambda catalog: catalog.get_by_id(status_id))
+        db_status = await self.db.get(SQLAlchemyItemStatus, status_id)
+        if db_status is None:
+            return None
+        return item_status_to_domain(db_status)
+    
+    async def _load_statuses(self) -> List[ItemStatus]:
+        """Lee todos los estados de la base de datos."""
+        result = await self.db.scalars(select(SQLAlchemyItemStatus))
+        return [item_status_to_domain(db_status) for db_status in result]
+    
+    async def _catalog(self) -> StatusCatalog:
+        """Devuelve el catálogo, recargándolo desde esta sesión si caducó."""
+        if self.status_catalog.is_stale():
+            self.status_catalog.load(await self._load_statuses())
+        return self.status_catalog
+    
+    async def _find_in_catalog(
+        self,
+        lookup: Callable[[StatusCatalog], Optional[ItemStatus]]
+    ) -> Optional[ItemStatus]:
+        """
+        Busca en el catálogo; si no está, lo recarga cuando
+        ``StatusCatalog.claim_miss_reload`` lo permite (el estado pudo
+        crearse después de la última carga).
+        """
+        found = lookup(await self._catalog())
+        if found is None and self.status_catalog.claim_miss_reload():
+            self.status_catalog.load(await self._load_statuses())
+            found = lookup(self.status_catalog)
+        return found
+    
+    async def _apply_counters(self, deltas: CounterDeltas) -> None:
+        """Aplica incrementos a ``item_counters`` dentro de la transacción en curso."""
+        if deltas:
+            dialect = self.db.get_bind().dialect.name
+            await self.db.execute(counter_upsert(dialect), counter_rows(deltas))
+    
+    def _select_with_status(self):
+        """Consulta base de items que trae el estado mediante JOIN."""
+        return select(SQLAlchemyItem).options(joinedload(SQLAlchemyItem.status_rel))
+    
+    async def _reload_with_status(self, item_id: int) -> Item:
+        """Recarga un item tras un commit junto con su estado."""
+        db_item = await self.db.scalar(
+            self._select_with_status()
+            .where(SQLAlchemyItem.id == item_id)
+            .execution_options(populate_existing=True)
+        )
+        return item_to_domain(db_item)
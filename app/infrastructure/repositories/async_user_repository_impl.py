@@ -0,0 +1,46 @@
+"""Implementación asíncrona de repositorio de usuarios."""
+from typing import Optional
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.domain.repositories.async_user_repository import AsyncUserRepository
+from app.domain.entities.user import User
+from app.infrastructure.database.models.user_model import User as SQLAlchemyUser
+from app.infrastructure.database.mappers import user_to_domain, user_to_db
+
+
+class AsyncUserRepositoryImpl(AsyncUserRepository):
+    """Implementación asíncrona del repositorio de usuarios."""
+    
+    def __init__(self, db: AsyncSession):
+        self.db = db
+    
+    async def get_by_email(self, email: str) -> Optional[User]:
+        """Busca un usuario por email."""
+        db_user = await self.db.scalar(select(SQLAlchemyUser).where(SQLAlchemyUser.email == email))
+        if db_user is None:
+            return None
+        return user_to_domain(db_user)
+    
+    async def create(self, user: User) -> User:
+        """Crea un nuevo usuario."""
+        db_user = user_to_db(user)
+        self.db.add(db_user)
+        await self.db.commit()
+        await self.db.refresh(db_user)
+        return user_to_domain(db_user)
+    
+    async def update(self, user: User) -> User:
+        """Actualiza un usuario existente."""
+        db_user = await self.db.get(SQLAlchemyUser, user.id)
+        if db_user is None:
+            raise ValueError(f"Usuario con id {user.id} no encontrado")
+        
+        db_user.email = user.email
+        db_user.hashed_password = user.hashed_password
+        db_user.full_name = user.full_name
+        db_user.role = user.role
+        db_user.is_active = user.is_active
+        
+        await self.db.commit()
+        await self.db.refresh(db_user)
+        return user_to_domain(db_user)
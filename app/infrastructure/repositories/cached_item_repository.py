@@ -0,0 +1,207 @@
+"""Repositorio de items con caché de lecturas delante de otro repositorio."""
+import json
+from dataclasses import asdict
+from datetime import datetime
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from app.domain.entities.item import Item
+from app.domain.entities.item_filters import ItemFilters, ItemSort
+from app.domain.entities.item_stats import ItemStats
+from app.domain.entities.item_status import ItemStatus
+from app.domain.repositories.item_repository import ItemRepository
+from app.infrastructure.cache.read_cache import ReadCache, create_read_cache
+
+# Espacios de nombres: los listados, cada item ("item:<id>") y todos los
+# items a la vez, para invalidaciones masivas sin recorrer los IDs
+_LIST_NAMESPACE = "list"
+_ALL_ITEMS_NAMESPACE = "items"
+
+
+def _item_namespace(item_id: int) -> str:
+    return f"item:{item_id}"
+
+
+def _item_to_json(item: Item) -> Dict[str, Any]:
+    data = asdict(item)
+    for field in ("creation_date", "updated_at"):
+        if data[field] is not None:
+            data[field] = data[field].isoformat()
+    return data
+
+
+def _item_from_json(data: Dict[str, Any]) -> Item:
+    for field in ("creation_date", "updated_at"):
+        if data[field] is not None:
+            data[field] = datetime.fromisoformat(data[field])
+    if data["status"] is not None:
+        data["status"] = ItemStatus(**data["status"])
+    return Item(**data)
+
+
+def encode_cached_value(value: Any) -> str:
+    """Serializa a JSON lo que cachea ``CachedItemRepository``: item, lista o página."""
+    if isinstance(value, Item):
+        return json.dumps({"item": _item_to_json(value)})
+    if isinstance(value, tuple):
+        items, next_cursor = value
+        return json.dumps({"page": [_item_to_json(item) for item in items], "next": next_cursor})
+    return json.dumps({"items": [_item_to_json(item) for item in value]})
+
+
+def decode_cached_value(raw: str) -> Any:
+    """Inverso de ``encode_cached_value``."""
+    data = json.loads(raw)
+    if "item" in data:
+        return _item_from_json(data["item"])
+    if "page" in data:
+        return [_item_from_json(item) for item in data["page"]], data["next"]
+    return [_item_from_json(item) for item in data["items"]]
+
+
+class CachedItemRepository(ItemRepository):
+    """
+    Decorador de ``ItemRepository`` que cachea las lecturas con estado.
+
+    ``get_by_id_with_status``, ``get_all_with_status`` y ``get_page`` se
+    sirven desde ``cache`` sin SQL ni mapeo cuando hay acierto. Las
+    escrituras delegan en el repositorio envuelto y, tras confirmarse,
+    invalidan el item afectado y todos los listados. El resto de métodos
+    delega sin caché.
+    """
+
+    def __init__(self, inner: ItemRepository, cache: ReadCache):
+        self.inner = inner
+        self.cache = cache
+
+    def _cached(self, namespaces: Tuple[str, ...], key: str, load):
+        generations = self.cache.generations(namespaces)
+        if generations is None:
+            return load()
+        full_key = ":".join(f"{namespace}={generation}" for namespace, generation in zip(namespaces, generations))
+        full_key = f"{full_key}:{key}"
+        value = self.cache.get(full_key)
+        if value is None:
+            value = load()
+            if value is not None:
+                self.cache.put(full_key, value)
+        return value
+
+    def _invalidate(self, item_id: Optional[int] = None, all_items: bool = False) -> None:
+        if all_items:
+            self.cache.bump(_ALL_ITEMS_NAMESPACE)
+        elif item_id is not None:
+            self.cache.bump(_item_namespace(item_id))
+        self.cache.bump(_LIST_NAMESPACE)
+
+    def get_by_id(self, item_id: int) -> Optional[Item]:
+        return self.inner.get_by_id(item_id)
+
+    def get_all(
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        filters: Optional[ItemFilters] = None,
+        sort: Optional[ItemSort] = None
+    ) -> List[Item]:
+        return self.inner.get_all(skip, limit, filters, sort)
+
+    def get_by_id_with_status(self, item_id: int) -> Optional[Item]:
+        return self._cached(
+            (_ALL_ITEMS_NAMESPACE, _item_namespace(item_id)), "",
+            lambda: self.inner.get_by_id_with_status(item_id)
+        )
+
+    def get_all_with_status(
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        filters: Optional[ItemFilters] = None,
+        sort: Optional[ItemSort] = None
+    ) -> List[Item]:
+        key = f"all:{skip}:{limit}:{filters!r}:{sort!r}"
+        return self._cached(
+            (_LIST_NAMESPACE,), key, lambda: self.inner.get_all_with_status(skip, limit, filters, sort)
+        )
+
+    def get_page(
+        self,
+        cursor: Optional[str] = None,
+        limit: int = 100,
+        filters: Optional[ItemFilters] = None,
+        sort: Optional[ItemSort] = None
+    ) -> Tuple[List[Item], Optional[str]]:
+        key = f"page:{cursor}:{limit}:{filters!r}:{sort!r}"
+        return self._cached(
+            (_LIST_NAMESPACE,), key, lambda: self.inner.get_page(cursor, limit, filters, sort)
+        )
+
+    def iter_export_rows(self, filters: ItemFilters, batch_size: int = 1000) -> Iterator[Dict[str, Any]]:
+        return self.inner.iter_export_rows(filters, batch_size)
+
+    def search(self, query: str, filters: ItemFilters, skip: int = 0, limit: int = 100) -> List[Item]:
+        return self.inner.search(query, filters, skip, limit)
+
+    def create(self, item: Item) -> Item:
+        created = self.inner.create(item)
+        self._invalidate()
+        return created
+
+    def bulk_create(self, items: List[Item]) -> List[Optional[int]]:
+        ids = self.inner.bulk_create(items)
+        self._invalidate()
+        return ids
+
+    def update(self, item: Item) -> Item:
+        try:
+            return self.inner.update(item)
+        finally:
+            self._invalidate(item.id)
+
+    def update_fields(
+        self,
+        item_id: int,
+        fields: Dict[str, Any],
+        expected_version: Optional[int] = None
+    ) -> Optional[Item]:
+        updated = self.inner.update_fields(item_id, fields, expected_version)
+        if updated is not None:
+            self._invalidate(item_id)
+        return updated
+
+    def update_status_many(
+        self,
+        status_id: int,
+        ids: Optional[List[int]] = None,
+        filters: Optional[ItemFilters] = None
+    ) -> List[int]:
+        updated = self.inner.update_status_many(status_id, ids, filters)
+        if updated:
+            self._invalidate(all_items=True)
+        return updated
+
+    def delete(self, item_id: int) -> bool:
+        deleted = self.inner.delete(item_id)
+        if deleted:
+            self._invalidate(item_id)
+        return deleted
+
+    def get_stats(self, reporter_limit: int = 100) -> ItemStats:
+        return self.inner.get_stats(reporter_limit)
+
+    def rebuild_stats(self) -> ItemStats:
+        return self.inner.rebuild_stats()
+
+    def get_status_by_name(self, status: str) -> Optional[ItemStatus]:
+        return self.inner.get_status_by_name(status)
+
+    def get_all_statuses(self) -> List[ItemStatus]:
+        return self.inner.get_all_statuses()
+
+    def get_status_by_id(self, status_id: int) -> Optional[ItemStatus]:
+        return self.inner.get_status_by_id(status_id)
+
+
+# Caché de items del proceso (None con ITEM_CACHE_BACKEND=none)
+item_read_cache: Optional[ReadCache] = create_read_cache(
+    encode_cached_value, decode_cached_value, prefix="items:"
+)
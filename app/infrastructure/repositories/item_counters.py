@@ -0,0 +1,131 @@
+"""
+Contadores de items por estado y por reportante.
+
+Las escrituras de items suman o restan sobre ``item_counters`` con un
+UPSERT en su misma transacción, de modo que ``GET /items/stats`` lee tantas
+filas como estados y reportantes haya, no tantas como items.
+"""
+from typing import Dict, Iterable, List, Optional, Tuple
+from sqlalchemy import String, cast, delete, func, literal, select
+from app.domain.entities.item_stats import ItemStats
+from app.infrastructure.database.models.item_counter_model import ItemCounter
+from app.infrastructure.database.models.item_model import Item as SQLAlchemyItem
+
+STATUS_DIMENSION = "status"
+REPORTER_DIMENSION = "reporter"
+
+# (dimensión, etiqueta) -> incremento
+CounterDeltas = Dict[Tuple[str, str], int]
+
+_counters = ItemCounter.__table__
+
+
+def _labels(status_id: int, reported_user: Optional[str]) -> Tuple[Tuple[str, str], ...]:
+    """Claves de contador afectadas por un item."""
+    return (
+        (STATUS_DIMENSION, str(status_id)),
+        (REPORTER_DIMENSION, reported_user or ""),
+    )
+
+
+def counter_deltas(
+    added: Iterable[Tuple[int, Optional[str]]] = (),
+    removed: Iterable[Tuple[int, Optional[str]]] = ()
+) -> CounterDeltas:
+    """
+    Calcula los incrementos para items añadidos y eliminados, dados como
+    pares ``(status_id, reported_user)``. Omite las claves que se compensan.
+    """
+    deltas: CounterDeltas = {}
+    for sign, items in ((1, added), (-1, removed)):
+        for status_id, reported_user in items:
+            for key in _labels(status_id, reported_user):
+                deltas[key] = deltas.get(key, 0) + sign
+    return {key: delta for key, delta in deltas.items() if delta}
+
+
+def counter_upsert(dialect_name: str):
+    """
+    Sentencia ``INSERT ... ON CONFLICT DO UPDATE`` que suma el incremento
+    al contador existente; se ejecuta con las filas de ``counter_rows``.
+
+    Raises:
+        ValueError: Si el dialecto no admite ON CONFLICT
+    """
+    if dialect_name == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert
+    elif dialect_name == "sqlite":
+        from sqlalchemy.dialects.sqlite import insert
+    else:
+        raise ValueError(f"Contadores de items no soportados en '{dialect_name}'")
+    stmt = insert(_counters)
+    return stmt.on_conflict_do_update(
+        index_elements=[_counters.c.dimension, _counters.c.label],
+        set_={"item_count": _counters.c.item_count + stmt.excluded.item_count},
+    )
+
+
+def counter_rows(deltas: CounterDeltas) -> List[dict]:
+    """Parámetros de ``counter_upsert`` para unos incrementos."""
+    return [
+        {"dimension": dimension, "label": label, "item_count": delta}
+        for (dimension, label), delta in deltas.items()
+    ]
+
+
+def rebuild_statements() -> list:
+    """
+    Sentencias que recalculan todos los contadores desde ``items``.
+
+    Deben ejecutarse en una única transacción.
+    """
+    by_status = select(
+        literal(STATUS_DIMENSION),
+        cast(SQLAlchemyItem.status_id, String),
+        func.count(),
+    ).group_by(SQLAlchemyItem.status_id)
+    reporter = func.coalesce(SQLAlchemyItem.reported_user, "")
+    by_reporter = select(
+        literal(REPORTER_DIMENSION),
+        reporter,
+        func.count(),
+    ).group_by(reporter)
+    columns = [_counters.c.dimension, _counters.c.label, _counters.c.item_count]
+    return [
+        delete(_counters),
+        _counters.insert().from_select(columns, by_status),
+        _counters.insert().from_select(columns, by_reporter),
+    ]
+
+
+def stats_query(reporter_limit: int):
+    """
+    Consulta de contadores: todos los estados y los ``reporter_limit``
+    reportantes con más items.
+    """
+    top_reporters = (
+        select(_counters.c.dimension, _counters.c.label, _counters.c.item_count)
+        .where(_counters.c.dimension == REPORTER_DIMENSION, _counters.c.item_count > 0)
+        .order_by(_counters.c.item_count.desc(), _counters.c.label)
+        .limit(reporter_limit)
+    )
+    statuses = select(_counters.c.dimension, _counters.c.label, _counters.c.item_count).where(
+        _counters.c.dimension == STATUS_DIMENSION
+    )
+    return statuses.union_all(top_reporters.subquery().select())
+
+
+def stats_from_rows(rows) -> ItemStats:
+    """Construye ``ItemStats`` a partir de filas ``(dimension, label, item_count)``."""
+    stats = ItemStats()
+    reporters = []
+    for dimension, label, item_count in rows:
+        if dimension == STATUS_DIMENSION:
+            if item_count:
+                stats.by_status[int(label)] = item_count
+        else:
+            reporters.append((label, item_count))
+    # UNION ALL no conserva el orden de la subconsulta
+    for label, item_count in sorted(reporters, key=lambda row: (-row[1], row[0])):
+        stats.by_reporter[label or None] = item_count
+    return stats
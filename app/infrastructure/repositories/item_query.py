@@ -0,0 +1,62 @@
+"""Construcción de condiciones y órdenes SQL para consultas de items."""
+from typing import List, Optional
+
+from sqlalchemy import tuple_
+
+from app.domain.entities.item_filters import ItemFilters, ItemSort
+from app.infrastructure.database.models.item_model import Item as SQLAlchemyItem
+from app.infrastructure.repositories.keyset_cursor import decode_cursor
+
+
+def filter_conditions(filters: Optional[ItemFilters]) -> list:
+    """Traduce ``ItemFilters`` a condiciones SQL."""
+    conditions = []
+    if filters is None:
+        return conditions
+    if filters.status_id is not None:
+        conditions.append(SQLAlchemyItem.status_id == filters.status_id)
+    if filters.reported_user is not None:
+        conditions.append(SQLAlchemyItem.reported_user == filters.reported_user)
+    if filters.created_from is not None:
+        conditions.append(SQLAlchemyItem.creation_date >= filters.created_from)
+    if filters.created_to is not None:
+        conditions.append(SQLAlchemyItem.creation_date < filters.created_to)
+    return conditions
+
+
+def order_by_clauses(sort: Optional[ItemSort]) -> List:
+    """Cláusulas ORDER BY para ``sort``, con el ID como desempate estable."""
+    sort = sort or ItemSort()
+    column = getattr(SQLAlchemyItem, sort.field)
+    id_column = SQLAlchemyItem.id
+    if sort.descending:
+        column, id_column = column.desc(), id_column.desc()
+    if sort.field == "id":
+        return [column]
+    return [column, id_column]
+
+
+def keyset_sort(sort: Optional[ItemSort]) -> ItemSort:
+    """
+    Valida el orden admitido por la paginación por cursor.
+    
+    Raises:
+        ValueError: Si el orden no es por fecha de creación
+    """
+    sort = sort or ItemSort(field="creation_date")
+    if sort.field != "creation_date":
+        raise ValueError("La paginación por cursor solo admite orden por creation_date")
+    return sort
+
+
+def keyset_condition(cursor: str, sort: ItemSort):
+    """
+    Condición para continuar tras ``cursor`` en el sentido de ``sort``.
+    
+    Raises:
+        ValueError: Si el cursor no es válido
+    """
+    creation_date, item_id = decode_cursor(cursor)
+    key = tuple_(SQLAlchemyItem.creation_date, SQLAlchemyItem.id)
+    value = tuple_(creation_date, item_id)
+    return key < value if sort.descending else key > value
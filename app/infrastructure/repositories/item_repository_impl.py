@@ -1,23 +1,110 @@
 """Implementación de repositorio de items."""
-from typing import Optional, List
-from sqlalchemy.orm import Session
+import io
+from datetime import datetime
+from typing import Any, Dict, Iterator, Optional, List, Tuple
+from sqlalchemy import Float, Integer, func, insert, literal_column, select, text
+from sqlalchemy.exc import DBAPIError, OperationalError, SQLAlchemyError
+from sqlalchemy.orm import Session, joinedload
 from app.domain.repositories.item_repository import ItemRepository
 from app.domain.entities.item import Item
 from app.domain.entities.item_status import ItemStatus
+from app.domain.entities.item_filters import ItemFilters, ItemSort
+from app.domain.entities.item_stats import ItemStats
 from app.infrastructure.database.models.item_model import Item as SQLAlchemyItem
 from app.infrastructure.database.models.item_status_model import ItemStatus as SQLAlchemyItemStatus
+from app.infrastructure.cache.status_catalog import StatusCatalog
+from app.infrastructure.repositories.keyset_cursor import encode_cursor
+from app.infrastructure.repositories.item_writes import (
+    COUNTED_FIELDS,
+    delete_returning,
+    previous_values_query,
+    returns_previous_values,
+    status_update_returning,
+    update_returning,
+)
+from app.infrastructure.repositories.item_counters import (
+    CounterDeltas,
+    counter_deltas,
+    counter_rows,
+    counter_upsert,
+    rebuild_statements,
+    stats_from_rows,
+    stats_query,
+)
+from app.infrastructure.repositories.item_query import (
+    filter_conditions,
+    keyset_condition,
+    keyset_sort,
+    order_by_clauses,
+)
 from app.infrastructure.database.mappers import (
     item_to_domain,
+    item_row_to_domain,
     item_to_db,
     item_status_to_domain,
 )
 
 
+# Columnas cargadas con COPY en ``bulk_create``
+_COPY_COLUMNS = (
+    "name",
+    "description",
+    "ticket_url",
+    "publication_url",
+    "reported_user",
+    "creation_date",
+    "updated_at",
+    "status_id",
+)
+
+# Configuración de texto de PostgreSQL y expresión indexada (GIN) por la
+# migración 0005; deben coincidir con ella para que se use el índice
+SEARCH_CONFIG = "simple"
+SEARCH_VECTOR_SQL = (
+    f"to_tsvector('{SEARCH_CONFIG}', coalesce(items.name, '') || ' ' || coalesce(items.description, ''))"
+)
+
+# Columnas de item incluidas en la exportación
+_EXPORT_COLUMNS = (
+    SQLAlchemyItem.id,
+    SQLAlchemyItem.name,
+    SQLAlchemyItem.description,
+    SQLAlchemyItem.ticket_url,
+    SQLAlchemyItem.publication_url,
+    SQLAlchemyItem.reported_user,
+    SQLAlchemyItem.creation_date,
+    SQLAlchemyItem.status_id,
+)
+
+
+def _fts5_query(query: str) -> str:
+    """Convierte texto libre en una consulta FTS5 (todas las palabras, sin operadores)."""
+    return " ".join('"' + term.replace('"', '""') + '"' for term in query.split())
+
+
+def _copy_field(value) -> str:
+    """
+    Formatea un valor para COPY en CSV: NULL es un campo vacío sin comillas
+    y cualquier otro valor va entre comillas (así "" sigue siendo cadena vacía).
+    """
+    if value is None:
+        return ""
+    if isinstance(value, datetime):
+        value = value.isoformat()
+    return '"' + str(value).replace('"', '""') + '"'
+
+
 class ItemRepositoryImpl(ItemRepository):
-    """Implementación del repositorio de items."""
+    """
+    Implementación del repositorio de items.
+    
+    Si recibe un ``StatusCatalog`` las consultas de estados se resuelven
+    en memoria y solo se accede a ``items_status`` al recargarlo.
+    """
     
-    def __init__(self, db: Session):
+    def __init__(self, db: Session, status_catalog: Optional[StatusCatalog] = None):
         self.db = db
+        self.status_catalog = status_catalog
     
     def get_by_id(self, item_id: int) -> Optional[Item]:
         """Obtiene un item por ID."""
@@ -26,48 +113,323 @@ class ItemRepositoryImpl(ItemRepository):
             return None
         return item_to_domain(db_item)
     
-    def get_all(self, skip: int = 0, limit: int = 100) -> List[Item]:
-        """Obtiene todos los items con paginación."""
-        db_items = self.db.query(SQLAlchemyItem).offset(skip).limit(limit).all()
+    def get_all(
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        filters: Optional[ItemFilters] = None,
+        sort: Optional[ItemSort] = None
+    ) -> List[Item]:
+        """Obtiene items filtrados y ordenados con paginación."""
+        db_items = (
+            self.db.query(SQLAlchemyItem)
+            .filter(*filter_conditions(filters))
+            .order_by(*order_by_clauses(sort))
+            .offset(skip)
+            .limit(limit)
+            .all()
+        )
+        return [item_to_domain(db_item) for db_item in db_items]
+    
+    def get_by_id_with_status(self, item_id: int) -> Optional[Item]:
+        """Obtiene un item por ID con su estado cargado en la misma consulta."""
+        db_item = self._query_with_status().filter(SQLAlchemyItem.id == item_id).first()
+        if db_item is None:
+            return None
+        return item_to_domain(db_item)
+    
+    def get_all_with_status(
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        filters: Optional[ItemFilters] = None,
+        sort: Optional[ItemSort] = None
+    ) -> List[Item]:
+        """Obtiene items filtrados y ordenados con su estado cargado en la misma consulta."""
+        db_items = (
+            self._query_with_status()
+            .filter(*filter_conditions(filters))
+            .order_by(*order_by_clauses(sort))
+            .offset(skip)
+            .limit(limit)
+            .all()
+        )
+        return [item_to_domain(db_item) for db_item in db_items]
+    
+    def get_page(
+        self,
+        cursor: Optional[str] = None,
+        limit: int = 100,
+        filters: Optional[ItemFilters] = None,
+        sort: Optional[ItemSort] = None
+    ) -> Tuple[List[Item], Optional[str]]:
+        """Obtiene una página por keyset sobre (creation_date, id)."""
+        sort = keyset_sort(sort)
+        query = self._query_with_status().filter(*filter_conditions(filters))
+        if cursor:
+            query = query.filter(keyset_condition(cursor, sort))
+        # Se pide una fila extra para saber si existe una página siguiente
+        db_items = query.order_by(*order_by_clauses(sort)).limit(limit + 1).all()
+        next_cursor = None
+        if len(db_items) > limit:
+            db_items = db_items[:limit]
+            last = db_items[-1]
+            next_cursor = encode_cursor(last.creation_date, last.id)
+        return [item_to_domain(db_item) for db_item in db_items], next_cursor
+    
+    def iter_export_rows(self, filters: ItemFilters, batch_size: int = 1000) -> Iterator[Dict[str, Any]]:
+        """
+        Recorre los items filtrados con un cursor de servidor (``yield_per``).
+        
+        Usa una sesión propia sobre el mismo motor para que el recorrido no
+        dependa de la vida de la sesión de la petición mientras se emite la
+        respuesta.
+        """
+        stmt = (
+            select(*_EXPORT_COLUMNS, SQLAlchemyItemStatus.status)
+            .join(SQLAlchemyItemStatus, SQLAlchemyItem.status_id == SQLAlchemyItemStatus.id)
+            .where(*filter_conditions(filters))
+            .order_by(SQLAlchemyItem.id)
+            .execution_options(yield_per=batch_size)
+        )
+        with Session(bind=self.db.get_bind()) as session:
+            for row in session.execute(stmt):
+                yield dict(row._mapping)
+    
+    def search(self, query: str, filters: ItemFilters, skip: int = 0, limit: int = 100) -> List[Item]:
+        """
+        Busca items por texto usando el índice de la base de datos.
+        
+        PostgreSQL: índice GIN de expresión (``SEARCH_VECTOR_SQL``) con ``websearch_to_tsquery``
+        y orden por ``ts_rank_cd``. SQLite: tabla FTS5 ``items_fts`` con ``bm25``.
+        
+        Raises:
+            ValueError: Si el dialecto no admite búsqueda o falta la tabla FTS5
+        """
+        dialect = self.db.get_bind().dialect.name
+        if dialect == "postgresql":
+            tsquery = func.websearch_to_tsquery(literal_column(f"'{SEARCH_CONFIG}'::regconfig"), query)
+            vector = literal_column(SEARCH_VECTOR_SQL)
+            db_query = (
+                self._query_with_status()
+                .filter(vector.op("@@")(tsquery), *filter_conditions(filters))
+                .order_by(func.ts_rank_cd(vector, tsquery).desc(), SQLAlchemyItem.id)
+            )
+        elif dialect == "sqlite":
+            match = _fts5_query(query)
+            if not match:
+                return []
+            fts = (
+                text("SELECT rowid AS item_id, bm25(items_fts) AS rank FROM items_fts WHERE items_fts MATCH :match")
+                .bindparams(match=match)
+                .columns(item_id=Integer, rank=Float)
+                .subquery("fts")
+            )
+            db_query = (
+                self._query_with_status()
+                .join(fts, fts.c.item_id == SQLAlchemyItem.id)
+                .filter(*filter_conditions(filters))
+                .order_by(fts.c.rank, SQLAlchemyItem.id)
+            )
+        else:
+            raise ValueError(f"Búsqueda de texto no soportada en '{dialect}'")
+        try:
+            db_items = db_query.offset(skip).limit(limit).all()
+        except OperationalError as e:
+            if dialect == "sqlite" and "no such table: items_fts" in str(e.orig):
+                raise ValueError(
+                    "La base de datos no tiene la tabla de búsqueda items_fts (aplica la migración 0005)"
+                ) from e
+            raise
         return [item_to_domain(db_item) for db_item in db_items]
     
     def create(self, item: Item) -> Item:
         """Crea un nuevo item."""
         db_item = item_to_db(item)
         self.db.add(db_item)
+        # flush para conocer el estado por defecto antes de contar
+        self.db.flush()
+        self._apply_counters(counter_deltas(added=[(db_item.status_id, db_item.reported_user)]))
         self.db.commit()
-        self.db.refresh(db_item)
-        return item_to_domain(db_item)
+        return self._reload_with_status(db_item.id)
+    
+    def bulk_create(self, items: List[Item]) -> List[Optional[int]]:
+        """
+        Inserta varios items en una única transacción.
+        
+        En PostgreSQL (psycopg2) usa ``COPY ... FROM STDIN``, que no devuelve
+        IDs; en el resto usa un INSERT multi-fila con RETURNING.
+        
+        Raises:
+            ValueError: Si algún estado no existe o la base de datos rechaza el lote
+        """
+        if not items:
+            return []
+        # Cada estado distinto se resuelve una vez (del catálogo si lo hay)
+        unknown = {
+            status_id for status_id in {item.status_id for item in items}
+            if status_id is None or self.get_status_by_id(status_id) is None
+        }
+        if unknown:
+            positions = [index for index, item in enumerate(items) if item.status_id in unknown]
+            raise ValueError(f"Estado inválido en las posiciones {positions} del lote")
+        now = datetime.utcnow()
+        rows = [
+            {
+                "name": item.name,
+                "description": item.description,
+                "ticket_url": item.ticket_url,
+                "publication_url": item.publication_url,
+                "reported_user": item.reported_user,
+                "creation_date": item.creation_date or now,
+                "updated_at": item.creation_date or now,
+                "status_id": item.status_id,
+            }
+            for item in items
+        ]
+        try:
+            self._apply_counters(
+                counter_deltas(added=[(row["status_id"], row["reported_user"]) for row in rows])
+            )
+            if self._supports_copy():
+                self._copy_rows(rows)
+                ids: List[Optional[int]] = [None] * len(rows)
+            else:
+                result = self.db.execute(
+                    insert(SQLAlchemyItem).returning(SQLAlchemyItem.id, sort_by_parameter_order=True),
+                    rows,
+                )
+                ids = list(result.scalars())
+            self.db.commit()
+        except SQLAlchemyError as e:
+            self.db.rollback()
+            raise ValueError(f"Error al insertar el lote: {getattr(e, 'orig', e)}") from e
+        return ids
     
     def update(self, item: Item) -> Item:
         """Actualiza un item existente."""
-        db_item = self.db.query(SQLAlchemyItem).filter(SQLAlchemyItem.id == item.id).first()
-        if db_item is None:
+        updated = self.update_fields(item.id, {
+            "name": item.name,
+            "description": item.description,
+            "ticket_url": item.ticket_url,
+            "publication_url": item.publication_url,
+            "reported_user": item.reported_user,
+            "status_id": item.status_id,
+        })
+        if updated is None:
             raise ValueError(f"Item con id {item.id} no encontrado")
+        return updated
+    
+    def update_fields(
+        self,
+        item_id: int,
+        fields: Dict[str, Any],
+        expected_version: Optional[int] = None
+    ) -> Optional[Item]:
+        """
+        Actualiza campos con ``UPDATE ... RETURNING``.
         
-        # Actualizar campos
-        db_item.name = item.name
-        db_item.description = item.description
-        db_item.ticket_url = item.ticket_url
-        db_item.publication_url = item.publication_url
-        db_item.reported_user = item.reported_user
-        db_item.status_id = item.status_id
-        
+        Si cambian campos contados, los valores previos para ``item_counters``
+        salen de la misma sentencia en PostgreSQL; en el resto de dialectos
+        se leen antes con la fila bloqueada.
+        """
+        counted = any(name in fields for name in COUNTED_FIELDS)
+        in_statement = counted and returns_previous_values(self.db.get_bind().dialect.name)
+        previous = None
+        if counted and not in_statement:
+            previous = self.db.execute(previous_values_query(SQLAlchemyItem.id == item_id)).first()
+            if previous is None:
+                self.db.rollback()
+                return None
+        row = self.db.execute(update_returning(
+            item_id, fields, with_previous=in_statement, expected_version=expected_version
+        )).first()
+        if row is None:
+            self.db.rollback()
+            return None
+        if counted:
+            removed = (
+                (row.previous_status_id, row.previous_reported_user) if in_statement
+                else (previous.status_id, previous.reported_user)
+            )
+            self._apply_counters(counter_deltas(added=[(row.status_id, row.reported_user)], removed=[removed]))
         self.db.commit()
-        self.db.refresh(db_item)
-        return item_to_domain(db_item)
+        return item_row_to_domain(row)
+    
+    def update_status_many(
+        self,
+        status_id: int,
+        ids: Optional[List[int]] = None,
+        filters: Optional[ItemFilters] = None
+    ) -> List[int]:
+        """
+        Cambia el estado de varios items con un único ``UPDATE ... RETURNING``.
+        
+        Los contadores se ajustan con los estados previos, obtenidos como en
+        ``update_fields``.
+        """
+        conditions = filter_conditions(filters)
+        if ids is not None:
+            conditions.append(SQLAlchemyItem.id.in_(ids))
+        if not conditions:
+            raise ValueError("Se requieren IDs o un filtro")
+        in_statement = returns_previous_values(self.db.get_bind().dialect.name)
+        previous = {}
+        try:
+            if not in_statement:
+                previous = {row.id: row.status_id for row in self.db.execute(previous_values_query(*conditions))}
+            rows = self.db.execute(
+                status_update_returning(conditions, status_id, with_previous=in_statement)
+            ).all()
+            self._apply_counters(counter_deltas(
+                added=[(status_id, row.reported_user) for row in rows],
+                removed=[
+                    (row.previous_status_id if in_statement else previous[row.id], row.reported_user)
+                    for row in rows
+                ],
+            ))
+            self.db.commit()
+        except SQLAlchemyError:
+            self.db.rollback()
+            raise
+        return sorted(row.id for row in rows)
     
     def delete(self, item_id: int) -> bool:
-        """Elimina un item."""
-        db_item = self.db.query(SQLAlchemyItem).filter(SQLAlchemyItem.id == item_id).first()
-        if not db_item:
+        """Elimina un item con ``DELETE ... RETURNING``."""
+        row = self.db.execute(delete_returning(item_id)).first()
+        if row is None:
+            self.db.rollback()
             return False
-        self.db.delete(db_item)
+        self._apply_counters(counter_deltas(removed=[(row.status_id, row.reported_user)]))
         self.db.commit()
         return True
     
+    def get_stats(self, reporter_limit: int = 100) -> ItemStats:
+        """Obtiene el número de items por estado y por reportante desde los contadores."""
+        return stats_from_rows(self.db.execute(stats_query(reporter_limit)))
+    
+    def rebuild_stats(self) -> ItemStats:
+        """
+        Recalcula los contadores desde ``items`` en una transacción.
+        
+        En PostgreSQL bloquea las escrituras de ``items`` (SHARE) mientras
+        tanto para que ningún incremento concurrente se pierda.
+        """
+        try:
+            if self.db.get_bind().dialect.name == "postgresql":
+                self.db.execute(text("LOCK TABLE items IN SHARE MODE"))
+            for statement in rebuild_statements():
+                self.db.execute(statement)
+            self.db.commit()
+        except SQLAlchemyError:
+            self.db.rollback()
+            raise
+        return self.get_stats()
+    
     def get_status_by_name(self, status: str) -> Optional[ItemStatus]:
         """Obtiene un estado por nombre."""
+        if self.status_catalog is not None:
+            return self.status_catalog.find(lambda catalog: catalog.get_by_name(status), self._load_statuses)
         db_status = self.db.query(SQLAlchemyItemStatus).filter(
             SQLAlchemyItemStatus.status == status
         ).first()
@@ -77,15 +439,80 @@ class ItemRepositoryImpl(ItemRepository):
     
     def get_all_statuses(self) -> List[ItemStatus]:
         """Obtiene todos los estados."""
-        db_statuses = self.db.query(SQLAlchemyItemStatus).all()
-        return [item_status_to_domain(db_status) for db_status in db_statuses]
+        if self.status_catalog is not None:
+            return self._catalog().all()
+        return self._load_statuses()
     
     def get_status_by_id(self, status_id: int) -> Optional[ItemStatus]:
         """Obtiene un estado por ID."""
+        if self.status_catalog is not None:
+            return self.status_catalog.find(lambda catalog: catalog.get_by_id(status_id), self._load_statuses)
         db_status = self.db.query(SQLAlchemyItemStatus).filter(
             SQLAlchemyItemStatus.id == status_id
         ).first()
         if db_status is None:
             return None
         return item_status_to_domain(db_status)
+    
+    def _load_statuses(self) -> List[ItemStatus]:
+        """Lee todos los estados de la base de datos."""
+        db_statuses = self.db.query(SQLAlchemyItemStatus).all()
+        return [item_status_to_domain(db_status) for db_status in db_statuses]
+    
+    def _catalog(self) -> StatusCatalog:
+        """Devuelve el catálogo, recargándolo desde esta sesión si caducó."""
+        self.status_catalog.ensure_fresh(self._load_statuses)
+        return self.status_catalog
+    
+    def _apply_counters(self, deltas: CounterDeltas) -> None:
+        """Aplica incrementos a ``item_counters`` dentro de la transacción en curso."""
+        if deltas:
+            dialect = self.db.get_bind().dialect.name
+            self.db.execute(counter_upsert(dialect), counter_rows(deltas))
+    
+    def _supports_copy(self) -> bool:
+        """Indica si la conexión admite COPY (PostgreSQL con psycopg2)."""
+        dialect = self.db.get_bind().dialect
+        return dialect.name == "postgresql" and dialect.driver == "psycopg2"
+    
+    def _copy_rows(self, rows: List[dict]) -> None:
+        """
+        Carga filas con COPY dentro de la transacción de la sesión.
+        
+        Raises:
+            DBAPIError: Si el servidor rechaza los datos (el error del driver
+                se envuelve, ya que ``copy_expert`` no pasa por SQLAlchemy)
+        """
+        buffer = io.StringIO()
+        for row in rows:
+            buffer.write(",".join(_copy_field(row[column]) for column in _COPY_COLUMNS))
+            buffer.write("\n")
+        buffer.seek(0)
+        statement = f"COPY items ({', '.join(_COPY_COLUMNS)}) FROM STDIN WITH (FORMAT csv)"
+        dbapi = self.db.get_bind().dialect.loaded_dbapi
+        dbapi_connection = self.db.connection().connection.dbapi_connection
+        with dbapi_connection.cursor() as cursor:
+            try:
+                cursor.copy_expert(statement, buffer)
+            except dbapi.Error as e:
+                raise DBAPIError.instance(statement, None, e, dbapi.Error) from e
+    
+    def _query_with_status(self):
+        """Consulta base de items que trae el estado mediante JOIN."""
+        return self.db.query(SQLAlchemyItem).options(joinedload(SQLAlchemyItem.status_rel))
+    
+    def _reload_with_status(self, item_id: int) -> Item:
+        """
+        Recarga un item tras un commit junto con su estado.
+        
+        Sustituye a ``refresh`` para que la respuesta no necesite una
+        segunda consulta al estado.
+        """
+        db_item = (
+            self._query_with_status()
+            .populate_existing()
+            .filter(SQLAlchemyItem.id == item_id)
+            .one()
+        )
+        return item_to_domain(db_item)
 
@@ -0,0 +1,113 @@
+"""
+Sentencias de escritura de items en un único viaje a la base de datos.
+
+``UPDATE ... RETURNING`` y ``DELETE ... RETURNING`` devuelven la fila
+resultante (con el nombre del estado) en lugar de leerla antes y después;
+si no devuelven fila, el item no existía.
+"""
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+from sqlalchemy import delete, select, update
+
+from app.infrastructure.database.models.item_model import Item as SQLAlchemyItem
+from app.infrastructure.database.models.item_status_model import ItemStatus as SQLAlchemyItemStatus
+
+# Campos de item que afectan a los contadores de ``item_counters``
+COUNTED_FIELDS = ("status_id", "reported_user")
+
+_ITEM_COLUMNS = tuple(SQLAlchemyItem.__table__.c)
+
+
+def _status_name():
+    """Nombre del estado de la fila escrita, como subconsulta correlacionada."""
+    return (
+        select(SQLAlchemyItemStatus.status)
+        .where(SQLAlchemyItemStatus.id == SQLAlchemyItem.status_id)
+        .correlate(SQLAlchemyItem)
+        .scalar_subquery()
+        .label("status")
+    )
+
+
+def returns_previous_values(dialect_name: str) -> bool:
+    """
+    Indica si el dialecto puede devolver en RETURNING los valores previos
+    mediante un ``UPDATE ... FROM`` (PostgreSQL; SQLite no admite columnas
+    de tablas del FROM en RETURNING).
+    """
+    return dialect_name == "postgresql"
+
+
+def previous_values_query(*conditions):
+    """ID y valores contados actuales de los items que cumplen ``conditions``, bloqueando las filas."""
+    return (
+        select(SQLAlchemyItem.id, SQLAlchemyItem.status_id, SQLAlchemyItem.reported_user)
+        .where(*conditions)
+        .with_for_update()
+    )
+
+
+def _touch() -> Dict[str, Any]:
+    """Valores que toda modificación aplica: fecha de cambio y nueva versión."""
+    return {"updated_at": datetime.utcnow(), "version": SQLAlchemyItem.version + 1}
+
+
+def update_returning(
+    item_id: int,
+    values: Dict[str, Any],
+    with_previous: bool = False,
+    expected_version: Optional[int] = None
+):
+    """
+    ``UPDATE items SET ... RETURNING`` columnas del item y ``status``.
+
+    Incrementa ``version`` y fija ``updated_at``. Con ``expected_version``
+    solo actualiza si la versión actual coincide (If-Match). Con
+    ``with_previous`` añade ``previous_status_id`` y
+    ``previous_reported_user`` leídos de la fila bloqueada antes de
+    actualizarla (solo en dialectos con ``returns_previous_values``).
+    """
+    stmt = update(SQLAlchemyItem).values({**values, **_touch()}).returning(*_ITEM_COLUMNS, _status_name())
+    if expected_version is not None:
+        stmt = stmt.where(SQLAlchemyItem.version == expected_version)
+    if with_previous:
+        previous = previous_values_query(SQLAlchemyItem.id == item_id).subquery("previous")
+        stmt = stmt.where(SQLAlchemyItem.id == previous.c.id).returning(
+            previous.c.status_id.label("previous_status_id"),
+            previous.c.reported_user.label("previous_reported_user"),
+        )
+    else:
+        stmt = stmt.where(SQLAlchemyItem.id == item_id)
+    return stmt.execution_options(synchronize_session=False)
+
+
+def status_update_returning(conditions: list, status_id: int, with_previous: bool = False):
+    """
+    ``UPDATE items SET status_id = ...`` sobre todas las filas que cumplen
+    ``conditions``, devolviendo ``id`` y ``reported_user`` de cada una (y
+    ``previous_status_id`` con ``with_previous``, como ``update_returning``).
+    """
+    stmt = (
+        update(SQLAlchemyItem)
+        .values(status_id=status_id, **_touch())
+        .returning(SQLAlchemyItem.id, SQLAlchemyItem.reported_user)
+    )
+    if with_previous:
+        previous = previous_values_query(*conditions).subquery("previous")
+        stmt = stmt.where(SQLAlchemyItem.id == previous.c.id).returning(
+            previous.c.status_id.label("previous_status_id")
+        )
+    else:
+        stmt = stmt.where(*conditions)
+    return stmt.execution_options(synchronize_session=False)
+
+
+def delete_returning(item_id: int):
+    """``DELETE FROM items ... RETURNING`` los valores contados de la fila borrada."""
+    return (
+        delete(SQLAlchemyItem)
+        .where(SQLAlchemyItem.id == item_id)
+        .returning(SQLAlchemyItem.status_id, SQLAlchemyItem.reported_user)
+        .execution_options(synchronize_session=False)
+    )
@@ -0,0 +1,27 @@
+"""Cursores opacos para paginación keyset sobre (creation_date, id)."""
+import base64
+import binascii
+import json
+from datetime import datetime
+from typing import Tuple
+
+
+def encode_cursor(creation_date: datetime, item_id: int) -> str:
+    """Codifica la clave (creation_date, id) como cursor opaco."""
+    raw = json.dumps([creation_date.isoformat(), item_id]).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, int]:
+    """
+    Decodifica un cursor opaco.
+    
+    Raises:
+        ValueError: Si el cursor está mal formado
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        creation_date, item_id = json.loads(base64.urlsafe_b64decode(padded))
+        return datetime.fromisoformat(creation_date), int(item_id)
+    except (binascii.Error, UnicodeDecodeError, TypeError, ValueError) as e:
+        raise ValueError("Cursor de paginación inválido") from e
@@ -0,0 +1,28 @@
+"""Adaptador asíncrono de un repositorio de usuarios síncrono."""
+from typing import Optional
+from anyio import to_thread
+from app.domain.repositories.async_user_repository import AsyncUserRepository
+from app.domain.repositories.user_repository import UserRepository
+from app.domain.entities.user import User
+
+
+class ThreadedUserRepository(AsyncUserRepository):
+    """
+    Expone un ``UserRepository`` síncrono como ``AsyncUserRepository``
+    ejecutando cada llamada en un hilo, sin bloquear el bucle de eventos.
+    """
+    
+    def __init__(self, user_repository: UserRepository):
+        self.user_repository = user_repository
+    
+    async def get_by_email(self, email: str) -> Optional[User]:
+        """Busca un usuario por email."""
+        return await to_thread.run_sync(self.user_repository.get_by_email, email)
+    
+    async def create(self, user: User) -> User:
+        """Crea un nuevo usuario."""
+        return await to_thread.run_sync(self.user_repository.create, user)
+    
+    async def update(self, user: User) -> User:
+        """Actualiza un usuario existente."""
+        return await to_thread.run_sync(self.user_repository.update, user)
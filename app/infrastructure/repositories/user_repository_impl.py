@@ -28,3 +28,19 @@ class UserRepositoryImpl(UserRepository):
         self.db.refresh(db_user)
         return user_to_domain(db_user)
 
+    
+    def update(self, user: User) -> User:
+        """Actualiza un usuario existente."""
+        db_user = self.db.query(SQLAlchemyUser).filter(SQLAlchemyUser.id == user.id).first()
+        if db_user is None:
+            raise ValueError(f"Usuario con id {user.id} no encontrado")
+        
+        db_user.email = user.email
+        db_user.hashed_password = user.hashed_password
+        db_user.full_name = user.full_name
+        db_user.role = user.role
+        db_user.is_active = user.is_active
+        
+        self.db.commit()
+        self.db.refresh(db_user)
+        return user_to_domain(db_user)
@@ -1,10 +1,22 @@
 """Servicios de seguridad (JWT, contraseñas)."""
-from .password_handler import verify_password, get_password_hash
+from .password_handler import (
+    verify_password,
+    verify_and_update_password,
+    verify_and_update_password_async,
+    get_password_hash,
+    get_password_hash_async,
+)
+from .hashing_pool import HashingPoolSaturated, hashing_pool
 from .jwt_handler import create_access_token, decode_token, SECRET_KEY, ALGORITHM, ACCESS_TOKEN_EXPIRE_MINUTES
 
 __all__ = [
     "verify_password",
+    "verify_and_update_password",
+    "verify_and_update_password_async",
     "get_password_hash",
+    "get_password_hash_async",
+    "HashingPoolSaturated",
+    "hashing_pool",
     "create_access_token",
     "decode_token",
     "SECRET_KEY",
@@ -0,0 +1,180 @@
+"""Pool dedicado y acotado para el cálculo de hashes de contraseñas."""
+import asyncio
+import multiprocessing
+import os
+import threading
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import Any, Callable, Dict, Optional
+
+from starlette.concurrency import run_in_threadpool
+
+# Procesos dedicados a bcrypt; 0 ejecuta el hash en el hilo que lo pide
+PASSWORD_HASH_WORKERS = int(os.getenv("PASSWORD_HASH_WORKERS", str(max((os.cpu_count() or 2) // 2, 1))))
+# Peticiones que pueden esperar turno además de las que se están ejecutando
+PASSWORD_HASH_QUEUE_SIZE = int(os.getenv("PASSWORD_HASH_QUEUE_SIZE", "32"))
+# Segundos sugeridos al cliente en Retry-After cuando el pool está saturado
+PASSWORD_HASH_RETRY_AFTER = int(os.getenv("PASSWORD_HASH_RETRY_AFTER", "1"))
+
+
+class HashingPoolSaturated(Exception):
+    """El pool de hashing no admite más trabajos en este momento."""
+
+    def __init__(self, retry_after: int):
+        super().__init__("Servicio de autenticación saturado, reintenta más tarde")
+        self.retry_after = retry_after
+
+
+def _timed_call(fn: Callable[..., Any], *args: Any) -> tuple:
+    """Ejecuta ``fn`` en el worker y devuelve (resultado, segundos de CPU empleados)."""
+    started = time.perf_counter()
+    result = fn(*args)
+    return result, time.perf_counter() - started
+
+
+class PasswordHashingPool:
+    """
+    Ejecuta funciones de hashing en un pool de procesos de tamaño fijo.
+
+    Admite como máximo ``max_workers + queue_size`` trabajos simultáneos;
+    por encima de ese límite ``run`` lanza ``HashingPoolSaturated`` en lugar
+    de encolar, para que el servidor responda 503 en vez de acumular latencia.
+    """
+
+    def __init__(
+        self,
+        max_workers: int = PASSWORD_HASH_WORKERS,
+        queue_size: int = PASSWORD_HASH_QUEUE_SIZE,
+        retry_after: int = PASSWORD_HASH_RETRY_AFTER,
+    ):
+        self.max_workers = max_workers
+        self.queue_size = queue_size
+        self.retry_after = retry_after
+        self.capacity = max(max_workers, 1) + queue_size
+        self._slots = threading.BoundedSemaphore(self.capacity)
+        self._lock = threading.Lock()
+        self._executor: Optional[Executor] = None
+        self._in_flight = 0
+        self._completed = 0
+        self._rejected = 0
+        self._wait_total = 0.0
+        self._wait_max = 0.0
+
+    def _get_executor(self) -> Executor:
+        """
+        Crea el pool de procesos en el primer uso.
+
+        Los procesos se arrancan con "spawn": el pool se crea durante el
+        precalentamiento, con los hilos del arranque y del servidor ya en
+        marcha, y un fork copiaría cerrojos tomados por esos hilos.
+        """
+        with self._lock:
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.max_workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                )
+            return self._executor
+
+    def _acquire(self) -> float:
+        """
+        Reserva un hueco del pool y devuelve el instante de la reserva.
+
+        Raises:
+            HashingPoolSaturated: Si el pool y su cola están llenos
+        """
+        if not self._slots.acquire(blocking=False):
+            with self._lock:
+                self._rejected += 1
+            raise HashingPoolSaturated(self.retry_after)
+        with self._lock:
+            self._in_flight += 1
+        return time.perf_counter()
+
+    def _complete(self, submitted: float, cpu_seconds: float) -> None:
+        wait = max(time.perf_counter() - submitted - cpu_seconds, 0.0)
+        with self._lock:
+            self._completed += 1
+            self._wait_total += wait
+            self._wait_max = max(self._wait_max, wait)
+
+    def _release(self) -> None:
+        with self._lock:
+            self._in_flight -= 1
+        self._slots.release()
+
+    def run(self, fn: Callable[..., Any], *args: Any) -> Any:
+        """
+        Ejecuta ``fn(*args)`` en el pool y espera el resultado.
+
+        Raises:
+            HashingPoolSaturated: Si el pool y su cola están llenos
+        """
+        submitted = self._acquire()
+        try:
+            if self.max_workers > 0:
+                result, cpu_seconds = self._get_executor().submit(_timed_call, fn, *args).result()
+            else:
+                result, cpu_seconds = _timed_call(fn, *args)
+            self._complete(submitted, cpu_seconds)
+            return result
+        finally:
+            self._release()
+
+    async def run_async(self, fn: Callable[..., Any], *args: Any) -> Any:
+        """
+        Variante de ``run`` para rutas asíncronas: espera el resultado en el
+        bucle de eventos, sin ocupar un hilo del threadpool mientras bcrypt
+        calcula (sin procesos dedicados, el hash se calcula en el threadpool).
+
+        Raises:
+            HashingPoolSaturated: Si el pool y su cola están llenos
+        """
+        submitted = self._acquire()
+        try:
+            if self.max_workers > 0:
+                future = self._get_executor().submit(_timed_call, fn, *args)
+                result, cpu_seconds = await asyncio.wrap_future(future)
+            else:
+                result, cpu_seconds = await run_in_threadpool(_timed_call, fn, *args)
+            self._complete(submitted, cpu_seconds)
+            return result
+        finally:
+            self._release()
+
+    def warm_up(self, fn: Callable[..., Any], *args: Any) -> None:
+        """
+        Arranca los procesos del pool ejecutando ``fn(*args)`` una vez por
+        proceso, para que carguen lo que necesite ``fn`` antes del primer
+        trabajo real. No cuenta en las estadísticas.
+        """
+        if self.max_workers <= 0:
+            return
+        executor = self._get_executor()
+        for future in [executor.submit(fn, *args) for _ in range(self.max_workers)]:
+            future.result()
+
+    def stats(self) -> Dict[str, Any]:
+        """Profundidad de cola y tiempos de espera acumulados."""
+        with self._lock:
+            return {
+                "workers": self.max_workers,
+                "capacity": self.capacity,
+                "in_flight": self._in_flight,
+                "queue_depth": max(self._in_flight - max(self.max_workers, 1), 0),
+                "completed": self._completed,
+                "rejected": self._rejected,
+                "wait_seconds_avg": self._wait_total / self._completed if self._completed else 0.0,
+                "wait_seconds_max": self._wait_max,
+            }
+
+    def shutdown(self) -> None:
+        """Detiene los procesos del pool si llegaron a crearse."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+
+# Pool compartido por el proceso
+hashing_pool = PasswordHashingPool()
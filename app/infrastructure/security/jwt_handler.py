@@ -1,8 +1,9 @@
 """Manejo de tokens JWT."""
 import os
 from datetime import datetime, timedelta
+from functools import lru_cache
+from types import ModuleType
 from typing import Optional
-from jose import JWTError, jwt
 
 # Configuración - Usar variables de entorno en producción
 SECRET_KEY = os.getenv("SECRET_KEY", "tu-clave-secreta-muy-segura-cambiar-en-produccion")
@@ -10,6 +11,16 @@ ALGORITHM = "HS256"
 ACCESS_TOKEN_EXPIRE_MINUTES = int(os.getenv("ACCESS_TOKEN_EXPIRE_MINUTES", "30"))
 
 
+@lru_cache(maxsize=None)
+def _jwt() -> ModuleType:
+    """
+    Importa ``jose.jwt`` en el primer uso: carga los backends criptográficos,
+    que no hacen falta para importar la aplicación (se precargan en ``warm_up``).
+    """
+    from jose import jwt
+    return jwt
+
+
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
     """
     Crea un token JWT con los datos proporcionados.
@@ -24,7 +35,7 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -
     to_encode = data.copy()
     expire = datetime.utcnow() + (expires_delta or timedelta(minutes=15))
     to_encode.update({"exp": expire})
-    return jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
+    return _jwt().encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
 
 
 def decode_token(token: str) -> dict:
@@ -34,5 +45,10 @@ def decode_token(token: str) -> dict:
     Raises:
         JWTError: Si el token es inválido
     """
-    return jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+    return _jwt().decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+
+
 
+def warm_up() -> None:
+    """Carga los backends de JWT firmando y verificando un token de prueba."""
+    decode_token(create_access_token({"sub": "warm-up"}))
@@ -1,29 +1,109 @@
 """Manejo de contraseñas."""
-from passlib.context import CryptContext
+import os
+from functools import lru_cache
+from typing import TYPE_CHECKING, Optional, Tuple
 
-# Contexto de encriptación para contraseñas
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+from app.infrastructure.security.hashing_pool import hashing_pool
+
+if TYPE_CHECKING:
+    from passlib.context import CryptContext
+
+# Coste de bcrypt; los hashes con otro coste se regeneran en el siguiente login
+BCRYPT_ROUNDS = int(os.getenv("BCRYPT_ROUNDS", "12"))
+
+# Hash bcrypt de coste 4 usado solo para cargar el backend en ``warm_up``
+_WARM_UP_PASSWORD = "warm-up"
+_WARM_UP_HASH = "$2b$04$PSrkIvc3lIkHg4Kb3q0sSOmZN98JPAhn2hTbj3islg36dOeTlzQwm"
+
+
+@lru_cache(maxsize=None)
+def get_pwd_context() -> "CryptContext":
+    """
+    Contexto de encriptación para contraseñas, creado en el primer uso
+    (passlib no se importa al importar la aplicación).
+    """
+    from passlib.context import CryptContext
+    return CryptContext(
+        schemes=["bcrypt"],
+        deprecated="auto",
+        bcrypt__rounds=BCRYPT_ROUNDS,
+        bcrypt__min_rounds=BCRYPT_ROUNDS,
+        bcrypt__max_rounds=BCRYPT_ROUNDS,
+    )
+
+
+# Funciones ejecutadas dentro del pool de hashing (deben ser de nivel de módulo)
+def _verify(plain_password: str, hashed_password: str) -> bool:
+    return get_pwd_context().verify(plain_password, hashed_password)
+
+
+def _verify_and_update(plain_password: str, hashed_password: str) -> Tuple[bool, Optional[str]]:
+    return get_pwd_context().verify_and_update(plain_password, hashed_password)
+
+
+def _hash(password: str) -> str:
+    return get_pwd_context().hash(password)
+
+
+def warm_up() -> None:
+    """
+    Carga passlib y bcrypt en este proceso y arranca los procesos del pool
+    de hashing, para que el primer login no pague ninguno de los dos costes.
+    """
+    _verify(_WARM_UP_PASSWORD, _WARM_UP_HASH)
+    hashing_pool.warm_up(_verify, _WARM_UP_PASSWORD, _WARM_UP_HASH)
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
-    """Verifica si la contraseña en texto plano coincide con el hash."""
-    return pwd_context.verify(plain_password, hashed_password)
+    """
+    Verifica si la contraseña en texto plano coincide con el hash.
+    
+    Raises:
+        HashingPoolSaturated: Si el pool de hashing está lleno
+    """
+    return hashing_pool.run(_verify, plain_password, hashed_password)
 
 
-def get_password_hash(password: str) -> str:
+def verify_and_update_password(plain_password: str, hashed_password: str) -> Tuple[bool, Optional[str]]:
     """
-    Genera hash bcrypt de la contraseña.
+    Verifica la contraseña y, si el hash usa un coste distinto al configurado,
+    devuelve también el hash regenerado.
+    
+    Returns:
+        Tupla (contraseña válida, nuevo hash o None si no hay que actualizarlo)
+    
+    Raises:
+        HashingPoolSaturated: Si el pool de hashing está lleno
+    """
+    return hashing_pool.run(_verify_and_update, plain_password, hashed_password)
+
+
+async def verify_and_update_password_async(plain_password: str, hashed_password: str) -> Tuple[bool, Optional[str]]:
+    """
+    Variante asíncrona de ``verify_and_update_password``.
+    
+    Raises:
+        HashingPoolSaturated: Si el pool de hashing está lleno
+    """
+    return await hashing_pool.run_async(_verify_and_update, plain_password, hashed_password)
+
+
+def _check_password(password: str) -> int:
+    """
+    Valida la contraseña antes de hashearla y devuelve su longitud en bytes.
     
     Bcrypt tiene un límite de 72 bytes. Si la contraseña es más larga,
-    se valida y se lanza un error claro.
+    se lanza un error claro.
+    
+    Raises:
+        ValueError: Si la contraseña no es válida
     """
     # Asegurarse de que la contraseña es una cadena
     if not isinstance(password, str):
         raise ValueError("La contraseña debe ser una cadena de texto")
     
     # Convertir a bytes para verificar la longitud real
-    password_bytes = password.encode('utf-8')
-    password_length_bytes = len(password_bytes)
+    password_length_bytes = len(password.encode('utf-8'))
     
     # Validar longitud antes de pasar a passlib
     if password_length_bytes > 72:
@@ -32,20 +112,53 @@ def get_password_hash(password: str) -> str:
             f"Tu contraseña tiene {password_length_bytes} bytes. "
             f"Por favor, usa una contraseña más corta."
         )
+    return password_length_bytes
+
+
+def _length_error(error: ValueError, password_length_bytes: int) -> Optional[ValueError]:
+    """Traduce un error de longitud de passlib (None si el error es otro)."""
+    error_msg = str(error)
+    if "72 bytes" in error_msg.lower() or "truncate" in error_msg.lower():
+        return ValueError(
+            f"La contraseña excede el límite de 72 bytes de bcrypt. "
+            f"Tu contraseña tiene {password_length_bytes} bytes. "
+            f"Por favor, usa una contraseña más corta. "
+            f"Ejemplo de formato válido: (Aion__2025)"
+        )
+    return None
+
+
+def get_password_hash(password: str) -> str:
+    """
+    Genera hash bcrypt de la contraseña.
     
-    # Intentar hacer el hash, capturando errores de passlib
+    Raises:
+        ValueError: Si la contraseña no es válida
+        HashingPoolSaturated: Si el pool de hashing está lleno
+    """
+    password_length_bytes = _check_password(password)
     try:
-        return pwd_context.hash(password)
+        return hashing_pool.run(_hash, password)
     except ValueError as e:
-        # Capturar errores específicos de passlib sobre longitud
-        error_msg = str(e)
-        if "72 bytes" in error_msg.lower() or "truncate" in error_msg.lower():
-            raise ValueError(
-                f"La contraseña excede el límite de 72 bytes de bcrypt. "
-                f"Tu contraseña tiene {password_length_bytes} bytes. "
-                f"Por favor, usa una contraseña más corta. "
-                f"Ejemplo de formato válido: (Aion__2025)"
-            ) from e
-        # Re-lanzar otros errores de ValueError
-        raise
+        length_error = _length_error(e, password_length_bytes)
+        if length_error is None:
+            raise
+        raise length_error from e
 
+
+async def get_password_hash_async(password: str) -> str:
+    """
+    Variante asíncrona de ``get_password_hash``.
+    
+    Raises:
+        ValueError: Si la contraseña no es válida
+        HashingPoolSaturated: Si el pool de hashing está lleno
+    """
+    password_length_bytes = _check_password(password)
+    try:
+        return await hashing_pool.run_async(_hash, password)
+    except ValueError as e:
+        length_error = _length_error(e, password_length_bytes)
+        if length_error is None:
+            raise
+        raise length_error from e
@@ -0,0 +1,195 @@
+"""
+Limitación de peticiones por cliente con cubos de fichas (token bucket).
+
+Cada clave (política + cliente) tiene un cubo de ``limit`` fichas que se
+rellena de forma continua a razón de ``limit / period`` fichas por segundo;
+cada petición gasta una. Equivale a una ventana deslizante sin bordes: se
+admiten ráfagas de hasta ``limit`` peticiones y, sostenido, ``limit`` por
+``period``.
+
+El almacén es intercambiable: en memoria (por proceso) o en un servidor
+con protocolo Redis, compartido entre workers y réplicas.
+"""
+import math
+import os
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Optional, Tuple
+
+RATE_LIMIT_ENABLED = os.getenv("RATE_LIMIT_ENABLED", "true").lower() in ("1", "true", "yes")
+# "memory" (por proceso: con N workers el límite efectivo es N veces mayor) o "redis"
+RATE_LIMIT_BACKEND = os.getenv("RATE_LIMIT_BACKEND", "memory").lower()
+RATE_LIMIT_REDIS_URL = os.getenv("RATE_LIMIT_REDIS_URL", "redis://localhost:6379/0")
+# Cubos guardados como máximo en memoria (se descartan los usados hace más tiempo)
+RATE_LIMIT_MAX_KEYS = int(os.getenv("RATE_LIMIT_MAX_KEYS", "100000"))
+
+
+def parse_rate(value: str) -> Optional[Tuple[int, float]]:
+    """
+    Convierte ``"10/60"`` (10 peticiones cada 60 segundos) en ``(10, 60.0)``.
+
+    Returns:
+        None si el valor está vacío o el límite es 0 (política desactivada)
+
+    Raises:
+        ValueError: Si el formato no es válido
+    """
+    value = value.strip()
+    if not value:
+        return None
+    try:
+        limit, period = value.split("/")
+        limit, period = int(limit), float(period)
+    except ValueError as e:
+        raise ValueError(f"Límite de peticiones inválido '{value}' (formato: peticiones/segundos)") from e
+    if limit <= 0:
+        return None
+    if period <= 0:
+        raise ValueError(f"Límite de peticiones inválido '{value}': el periodo debe ser positivo")
+    return limit, period
+
+
+@dataclass(frozen=True)
+class RateLimitDecision:
+    """Resultado de gastar una ficha de un cubo."""
+    allowed: bool
+    limit: int
+    remaining: int
+    # Segundos hasta que el cubo vuelve a estar lleno
+    reset_seconds: int
+    # Segundos hasta que habrá una ficha (0 si se admitió)
+    retry_after: int
+
+
+def _decision(tokens: float, allowed: bool, limit: int, period: float) -> RateLimitDecision:
+    rate = limit / period
+    return RateLimitDecision(
+        allowed=allowed,
+        limit=limit,
+        remaining=max(int(tokens), 0),
+        reset_seconds=math.ceil((limit - tokens) / rate),
+        retry_after=0 if allowed else max(math.ceil((1 - tokens) / rate), 1),
+    )
+
+
+class RateLimitStore(ABC):
+    """Puerto de almacén de cubos de fichas."""
+
+    # El almacén hace E/S de red (hay que llamarlo fuera del bucle de eventos)
+    blocking = False
+
+    @abstractmethod
+    def hit(self, key: str, limit: int, period: float) -> RateLimitDecision:
+        """Gasta una ficha del cubo ``key`` si la hay."""
+
+    @abstractmethod
+    def stats(self) -> Dict[str, Any]:
+        """Estado del almacén."""
+
+
+class MemoryRateLimitStore(RateLimitStore):
+    """Cubos en el proceso, acotados a ``max_keys`` con descarte LRU."""
+
+    def __init__(self, max_keys: int = RATE_LIMIT_MAX_KEYS, clock: Callable[[], float] = time.monotonic):
+        self.max_keys = max_keys
+        self.clock = clock
+        # clave -> (fichas, instante de la última actualización)
+        self._buckets: "OrderedDict[str, Tuple[float, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def hit(self, key: str, limit: int, period: float) -> RateLimitDecision:
+        now = self.clock()
+        with self._lock:
+            tokens, updated = self._buckets.get(key, (float(limit), now))
+            tokens = min(float(limit), tokens + (now - updated) * limit / period)
+            allowed = tokens >= 1
+            if allowed:
+                tokens -= 1
+            self._buckets[key] = (tokens, now)
+            self._buckets.move_to_end(key)
+            if len(self._buckets) > self.max_keys:
+                self._buckets.popitem(last=False)
+        return _decision(tokens, allowed, limit, period)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {"backend": "memory", "keys": len(self._buckets), "max_keys": self.max_keys}
+
+
+# Actualización atómica del cubo en el servidor: KEYS[1] = cubo,
+# ARGV = límite, periodo (s), instante actual (s). Devuelve [admitida, fichas].
+# El cubo caduca cuando ya estaría lleno, así que las claves no se acumulan.
+_TOKEN_BUCKET_SCRIPT = """
+local limit = tonumber(ARGV[1])
+local period = tonumber(ARGV[2])
+local now = tonumber(ARGV[3])
+local bucket = redis.call('HMGET', KEYS[1], 'tokens', 'updated')
+local tokens = tonumber(bucket[1]) or limit
+local updated = tonumber(bucket[2]) or now
+tokens = math.min(limit, tokens + math.max(now - updated, 0) * limit / period)
+local allowed = 0
+if tokens >= 1 then
+  tokens = tokens - 1
+  allowed = 1
+end
+redis.call('HSET', KEYS[1], 'tokens', tostring(tokens), 'updated', tostring(now))
+redis.call('PEXPIRE', KEYS[1], math.ceil(period * 1000))
+return {allowed, tostring(tokens)}
+"""
+
+
+class RedisRateLimitStore(RateLimitStore):
+    """
+    Cubos compartidos en un servidor que hable el protocolo Redis.
+
+    ``client`` solo necesita ``eval``. La hora la pone cada proceso, así que
+    los relojes de los workers deben estar sincronizados. Si el servidor no
+    responde la petición se admite (mejor sin límite que sin servicio) y se
+    cuenta en ``errors``.
+    """
+
+    blocking = True
+
+    def __init__(self, client, prefix: str = "ratelimit:", clock: Callable[[], float] = time.time):
+        self.client = client
+        self.prefix = prefix
+        self.clock = clock
+        self._lock = threading.Lock()
+        self.errors = 0
+
+    def hit(self, key: str, limit: int, period: float) -> RateLimitDecision:
+        try:
+            allowed, tokens = self.client.eval(
+                _TOKEN_BUCKET_SCRIPT, 1, self.prefix + key, limit, period, self.clock()
+            )
+        except Exception:
+            with self._lock:
+                self.errors += 1
+            return _decision(float(limit), True, limit, period)
+        tokens = float(tokens.decode() if isinstance(tokens, bytes) else tokens)
+        return _decision(tokens, bool(int(allowed)), limit, period)
+
+    def stats(self) -> Dict[str, Any]:
+        return {"backend": "redis", "errors": self.errors}
+
+
+def create_rate_limit_store() -> RateLimitStore:
+    """
+    Crea el almacén configurado en ``RATE_LIMIT_BACKEND``.
+
+    Raises:
+        ValueError: Si el backend no es válido
+        RuntimeError: Si se pide "redis" sin el paquete ``redis`` instalado
+    """
+    if RATE_LIMIT_BACKEND == "memory":
+        return MemoryRateLimitStore()
+    if RATE_LIMIT_BACKEND == "redis":
+        try:
+            import redis
+        except ImportError as e:
+            raise RuntimeError("RATE_LIMIT_BACKEND=redis requiere el paquete 'redis'") from e
+        return RedisRateLimitStore(redis.Redis.from_url(RATE_LIMIT_REDIS_URL, socket_timeout=0.5))
+    raise ValueError(f"RATE_LIMIT_BACKEND inválido: {RATE_LIMIT_BACKEND}")
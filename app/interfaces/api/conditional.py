@@ -0,0 +1,95 @@
+"""
+Peticiones condicionales HTTP para items (ETag, Last-Modified, If-Match).
+
+Los validadores se calculan a partir de ``id``/``version``/``updated_at``
+de las entidades de dominio, antes de serializar la respuesta, de modo
+que un 304 no construye el cuerpo.
+
+Los listados solo llevan ETag: la fecha de modificación más reciente de
+una página no cambia cuando se borra un item o deja de cumplir el filtro,
+así que ``If-Modified-Since`` daría por vigente una página obsoleta.
+"""
+import hashlib
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Dict, Iterable, List, Optional
+
+from fastapi import Request, Response
+
+from app.domain.entities.item import Item as DomainItem
+
+
+def item_etag(domain_item: DomainItem) -> str:
+    """ETag fuerte de un item: cambia con cada nueva versión."""
+    return f'"{domain_item.id}-{domain_item.version}"'
+
+
+def list_etag(domain_items: Iterable[DomainItem]) -> str:
+    """ETag fuerte de una página: resumen de los pares (id, versión) en orden."""
+    digest = hashlib.sha1()
+    for domain_item in domain_items:
+        digest.update(f"{domain_item.id}:{domain_item.version},".encode())
+    return f'"l-{digest.hexdigest()}"'
+
+
+def validator_headers(etag: str, modified: Optional[datetime] = None) -> Dict[str, str]:
+    """Cabeceras ``ETag`` y ``Last-Modified`` (las fechas se guardan en UTC sin zona)."""
+    headers = {"ETag": etag}
+    if modified is not None:
+        headers["Last-Modified"] = format_datetime(_as_utc(modified), usegmt=True)
+    return headers
+
+
+def _as_utc(value: datetime) -> datetime:
+    return value.replace(tzinfo=timezone.utc) if value.tzinfo is None else value
+
+
+def _etag_list(header: str) -> List[str]:
+    return [tag.strip() for tag in header.split(",") if tag.strip()]
+
+
+def not_modified(request: Request, etag: str, modified: Optional[datetime] = None) -> bool:
+    """
+    Evalúa ``If-None-Match`` (comparación débil) o, si no viene,
+    ``If-Modified-Since`` con resolución de segundos (RFC 9110). Sin
+    ``modified`` (listados) solo cuenta la ETag.
+    """
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        tags = _etag_list(if_none_match)
+        return "*" in tags or etag in (tag.removeprefix("W/") for tag in tags)
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since is None or modified is None:
+        return False
+    try:
+        since = parsedate_to_datetime(if_modified_since)
+    except (TypeError, ValueError):
+        return False
+    if since.tzinfo is None:
+        since = since.replace(tzinfo=timezone.utc)
+    return _as_utc(modified).replace(microsecond=0) <= since
+
+
+def not_modified_response(etag: str, modified: Optional[datetime] = None, **headers: str) -> Response:
+    """Respuesta 304 con los validadores y cabeceras adicionales."""
+    return Response(status_code=304, headers={**validator_headers(etag, modified), **headers})
+
+
+def expected_version(if_match: Optional[str], item_id: int) -> Optional[int]:
+    """
+    Versión exigida por ``If-Match`` para actualizar el item ``item_id``.
+
+    Devuelve None si la cabecera falta o es ``*``. Un ETag de otro item o
+    con formato desconocido no puede coincidir y se traduce en versión 0.
+    """
+    if if_match is None:
+        return None
+    tags = _etag_list(if_match)
+    if "*" in tags:
+        return None
+    prefix = f'"{item_id}-'
+    for tag in tags:
+        # If-Match usa comparación fuerte: las ETags débiles nunca coinciden
+        if tag.startswith(prefix) and tag.endswith('"') and tag[len(prefix):-1].isdigit():
+            return int(tag[len(prefix):-1])
+    return 0
@@ -1,14 +1,28 @@
-"""Convertidores entre entidades de dominio y schemas Pydantic."""
+"""
+Convertidores entre entidades de dominio y schemas Pydantic.
+
+Las entidades de dominio ya son datos validados: los schemas se construyen
+con ``model_construct`` y las funciones ``*_to_dict`` generan directamente
+el cuerpo JSON de las respuestas rápidas (``FastJSONResponse``).
+"""
+from typing import Any, Dict, List, Optional
 from app.domain.entities.user import User as DomainUser
 from app.domain.entities.item import Item as DomainItem
 from app.domain.entities.item_status import ItemStatus as DomainItemStatus
+from app.domain.entities.item_stats import ItemStats as DomainItemStats
 from app.interfaces.schemas.user_schemas import User as UserSchema
-from app.interfaces.schemas.item_schemas import Item as ItemSchema, ItemStatus as ItemStatusSchema
+from app.interfaces.schemas.item_schemas import (
+    Item as ItemSchema,
+    ItemStatus as ItemStatusSchema,
+    ItemStats as ItemStatsSchema,
+    ReporterCount,
+    StatusCount,
+)
 
 
 def domain_user_to_schema(domain_user: DomainUser) -> UserSchema:
     """Convierte una entidad de dominio User a schema Pydantic."""
-    return UserSchema(
+    return UserSchema.model_construct(
         id=domain_user.id,
         email=domain_user.email,
         full_name=domain_user.full_name,
@@ -18,9 +32,22 @@ def domain_user_to_schema(domain_user: DomainUser) -> UserSchema:
     )
 
 
-def domain_item_to_schema(domain_item: DomainItem, status: DomainItemStatus) -> ItemSchema:
-    """Convierte una entidad de dominio Item a schema Pydantic."""
-    return ItemSchema(
+def domain_item_to_schema(
+    domain_item: DomainItem,
+    status: Optional[DomainItemStatus] = None
+) -> ItemSchema:
+    """
+    Convierte una entidad de dominio Item a schema Pydantic.
+
+    Si no se indica ``status`` se usa el estado cargado en el propio item.
+
+    Raises:
+        ValueError: Si no hay estado disponible para el item
+    """
+    status = status or domain_item.status
+    if status is None:
+        raise ValueError(f"Estado no cargado para el item {domain_item.id}")
+    return ItemSchema.model_construct(
         id=domain_item.id,
         name=domain_item.name,
         description=domain_item.description,
@@ -29,13 +56,52 @@ def domain_item_to_schema(domain_item: DomainItem, status: DomainItemStatus) ->
         reported_user=domain_item.reported_user,
         creation_date=domain_item.creation_date,
         status_id=domain_item.status_id,
-        status_rel=ItemStatusSchema(
+        updated_at=domain_item.updated_at,
+        version=domain_item.version,
+        status_rel=ItemStatusSchema.model_construct(
             id=status.id,
             status=status.status
         )
     )
 
 
+def domain_user_to_dict(domain_user: DomainUser) -> Dict[str, Any]:
+    """Cuerpo JSON de ``User`` para una entidad de dominio User."""
+    return {
+        "email": domain_user.email,
+        "full_name": domain_user.full_name,
+        "id": domain_user.id,
+        "role": domain_user.role,
+        "is_active": domain_user.is_active,
+        "created_at": domain_user.created_at,
+    }
+
+
+def domain_item_to_dict(domain_item: DomainItem) -> Dict[str, Any]:
+    """
+    Cuerpo JSON de ``Item`` para un item con su estado cargado.
+
+    Raises:
+        ValueError: Si no hay estado disponible para el item
+    """
+    status = domain_item.status
+    if status is None:
+        raise ValueError(f"Estado no cargado para el item {domain_item.id}")
+    return {
+        "name": domain_item.name,
+        "description": domain_item.description,
+        "ticket_url": domain_item.ticket_url,
+        "publication_url": domain_item.publication_url,
+        "reported_user": domain_item.reported_user,
+        "id": domain_item.id,
+        "creation_date": domain_item.creation_date,
+        "status_id": domain_item.status_id,
+        "updated_at": domain_item.updated_at,
+        "version": domain_item.version,
+        "status_rel": {"status": status.status, "id": status.id},
+    }
+
+
 def domain_item_status_to_schema(domain_status: DomainItemStatus) -> ItemStatusSchema:
     """Convierte una entidad de dominio ItemStatus a schema Pydantic."""
     return ItemStatusSchema(
@@ -43,3 +109,27 @@ def domain_item_status_to_schema(domain_status: DomainItemStatus) -> ItemStatusS
         status=domain_status.status
     )
 
+
+def domain_item_stats_to_schema(
+    domain_stats: DomainItemStats,
+    statuses: List[DomainItemStatus]
+) -> ItemStatsSchema:
+    """
+    Convierte ``ItemStats`` de dominio a schema Pydantic; los estados sin
+    items aparecen con cuenta 0.
+    """
+    return ItemStatsSchema(
+        total=domain_stats.total,
+        by_status=[
+            StatusCount(
+                status_id=status.id,
+                status=status.status,
+                count=domain_stats.by_status.get(status.id, 0)
+            )
+            for status in statuses
+        ],
+        by_reporter=[
+            ReporterCount(reported_user=reported_user, count=count)
+            for reported_user, count in domain_stats.by_reporter.items()
+        ]
+    )
@@ -2,53 +2,142 @@
 from typing import List, Optional
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from jose import JWTError
 
-from app.infrastructure.database.session import get_db
+from app.infrastructure.database.session import get_db, get_read_db
+from app.infrastructure.database.async_session import get_async_db, is_async_db_enabled
 from app.domain.entities.user import User
 from app.infrastructure.security.jwt_handler import decode_token, ACCESS_TOKEN_EXPIRE_MINUTES
 from app.domain.repositories.user_repository import UserRepository
+from app.domain.repositories.async_user_repository import AsyncUserRepository
 from app.infrastructure.repositories.user_repository_impl import UserRepositoryImpl
+from app.infrastructure.repositories.async_user_repository_impl import AsyncUserRepositoryImpl
+from app.infrastructure.monitoring.metrics import metrics
+from app.infrastructure.cache.principal_cache import (
+    cache_principal,
+    get_cached_principal,
+    is_cached_verification_enabled,
+)
 
 # Esquema OAuth2 - apunta al endpoint de login
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="auth/login")
 
+token_rejections = metrics.counter(
+    "auth_token_rejections_total", "Tokens rechazados (invalid: firma, caducidad o sujeto; unknown_user)", ("reason",)
+)
+
 
 def get_user_repository(db: Session = Depends(get_db)) -> UserRepository:
     """Dependencia para obtener el repositorio de usuarios."""
     return UserRepositoryImpl(db)
 
 
-async def get_current_user(
+def get_read_user_repository(db: Session = Depends(get_read_db)) -> UserRepository:
+    """Repositorio de usuarios para búsquedas de solo lectura (réplica si hay)."""
+    return UserRepositoryImpl(db)
+
+
+def get_async_user_repository(db: AsyncSession = Depends(get_async_db)) -> AsyncUserRepository:
+    """Dependencia para obtener el repositorio asíncrono de usuarios."""
+    return AsyncUserRepositoryImpl(db)
+
+
+def _credentials_exception() -> HTTPException:
+    """Error 401 estándar para credenciales inválidas."""
+    return HTTPException(
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        detail="No se pudieron validar las credenciales",
+        headers={"WWW-Authenticate": "Bearer"},
+    )
+
+
+def _decode_payload(token: str) -> dict:
+    """
+    Decodifica el token y comprueba que tenga sujeto.
+    
+    Raises:
+        HTTPException 401: Si el token es inválido
+    """
+    try:
+        payload = decode_token(token)
+    except JWTError:
+        token_rejections.inc(("invalid",))
+        raise _credentials_exception()
+    if payload.get("sub") is None:
+        token_rejections.inc(("invalid",))
+        raise _credentials_exception()
+    return payload
+
+
+def get_current_user_sync(
     token: str = Depends(oauth2_scheme),
-    user_repo: UserRepository = Depends(get_user_repository)
+    user_repo: UserRepository = Depends(get_read_user_repository)
 ) -> User:
     """
     Dependencia que extrae y valida el usuario del token JWT.
     
+    Es síncrona a propósito: FastAPI la ejecuta en el threadpool y la
+    consulta a la base de datos no bloquea el event loop.
+    
+    En modo ``AUTH_VERIFICATION_MODE=cached`` el usuario verificado se
+    reutiliza desde la caché de principales y solo se consulta la tabla
+    users en un fallo de caché.
+    
     Raises:
         HTTPException 401: Si el token es inválido o el usuario no existe
     """
-    credentials_exception = HTTPException(
-        status_code=status.HTTP_401_UNAUTHORIZED,
-        detail="No se pudieron validar las credenciales",
-        headers={"WWW-Authenticate": "Bearer"},
-    )
-    try:
-        payload = decode_token(token)
-        email: str = payload.get("sub")
-        if email is None:
-            raise credentials_exception
-    except JWTError:
-        raise credentials_exception
+    payload = _decode_payload(token)
+    email: str = payload["sub"]
+    
+    use_cache = is_cached_verification_enabled()
+    if use_cache:
+        user = get_cached_principal(email, payload.get("role"))
+        if user is not None:
+            return user
     
     user = user_repo.get_by_email(email)
     if user is None:
-        raise credentials_exception
+        token_rejections.inc(("unknown_user",))
+        raise _credentials_exception()
+    if use_cache:
+        cache_principal(email, user)
     return user
 
 
+async def get_current_user_async(
+    token: str = Depends(oauth2_scheme),
+    user_repo: AsyncUserRepository = Depends(get_async_user_repository)
+) -> User:
+    """
+    Variante de ``get_current_user_sync`` sobre el motor asíncrono.
+    
+    Raises:
+        HTTPException 401: Si el token es inválido o el usuario no existe
+    """
+    payload = _decode_payload(token)
+    email: str = payload["sub"]
+    
+    use_cache = is_cached_verification_enabled()
+    if use_cache:
+        user = get_cached_principal(email, payload.get("role"))
+        if user is not None:
+            return user
+    
+    user = await user_repo.get_by_email(email)
+    if user is None:
+        token_rejections.inc(("unknown_user",))
+        raise _credentials_exception()
+    if use_cache:
+        cache_principal(email, user)
+    return user
+
+
+# Se elige según DB_MODE; el resto de dependencias encadenan con esta
+get_current_user = get_current_user_async if is_async_db_enabled() else get_current_user_sync
+
+
 async def get_current_active_user(
     current_user: User = Depends(get_current_user)
 ) -> User:
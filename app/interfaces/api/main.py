@@ -1,17 +1,180 @@
 """Aplicación FastAPI principal."""
-from fastapi import FastAPI
+import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from typing import Any, Callable
 
-from app.interfaces.api.routes import auth, items
+from fastapi import Depends, FastAPI
+from sqlalchemy.exc import SQLAlchemyError
+from starlette.concurrency import run_in_threadpool
 
-app = FastAPI(title="Ticketing System API", version="1.0.0")
+from app.infrastructure.cache.read_cache import ITEM_CACHE_BACKEND
+from app.infrastructure.cache.status_catalog import status_catalog
+from app.infrastructure.database.readiness import DB_PREPARE_ON_STARTUP, prepare_database
+from app.infrastructure.database.session import (
+    DATABASE_REPLICA_URLS,
+    SessionLocal,
+    get_engine,
+    warm_up_connections,
+)
+from app.infrastructure.database.async_session import (
+    dispose_async_engine,
+    is_async_db_enabled,
+    warm_up_async_connections,
+)
+from app.infrastructure.repositories.item_repository_impl import ItemRepositoryImpl
+from app.infrastructure.monitoring.profiler import is_profiling_enabled
+from app.infrastructure.monitoring.startup import startup_report
+from app.infrastructure.security import jwt_handler, password_handler
+from app.infrastructure.security.hashing_pool import hashing_pool
+from app.interfaces.api.profiling import ProfilingMiddleware
+from app.interfaces.api.rate_limiting import RateLimitHeadersMiddleware, enforce_rate_limits, rate_limit_store
+from app.interfaces.api.read_your_writes import ReadYourWritesMiddleware
+from app.interfaces.api.request_metrics import RequestMetricsMiddleware, track_in_flight
+from app.interfaces.api.server_timing import ServerTimingMiddleware
+from app.interfaces.api.routes import (
+    admin,
+    auth,
+    items,
+    items_async,
+    items_bulk,
+    items_export,
+    items_search,
+    metrics,
+)
 
-# Incluir routers
+logger = logging.getLogger(__name__)
+
+# Precalentar conexiones, cachés y backends criptográficos al arrancar
+STARTUP_WARM_UP = os.getenv("STARTUP_WARM_UP", "true").lower() in ("1", "true", "yes")
+
+
+def load_status_catalog() -> None:
+    """Carga el catálogo de estados; si la BD no responde se cargará en la primera petición."""
+    db = SessionLocal(bind=get_engine())
+    try:
+        ItemRepositoryImpl(db, status_catalog).get_all_statuses()
+    except SQLAlchemyError as e:
+        logger.warning("No se pudo precargar el catálogo de estados: %s", e)
+    finally:
+        db.close()
+
+
+def _warm_up_step(name: str, step: Callable[[], Any]) -> None:
+    """Ejecuta un paso del precalentamiento; si falla, lo registra y sigue."""
+    try:
+        with startup_report.phase(name):
+            step()
+    except Exception as e:
+        logger.warning("Precalentamiento '%s' fallido: %s", name, e)
+
+
+def warm_up() -> None:
+    """
+    Deja el proceso listo para servir sin costes de primer uso.
+
+    Arranca los procesos del pool de hashing y después, en paralelo, abre
+    conexiones del pool, carga el catálogo de estados y los backends de JWT.
+    Los fallos no impiden arrancar: lo no precalentado se carga en el
+    primer uso.
+    """
+    _warm_up_step("password_hashing", password_handler.warm_up)
+    steps = {
+        "db_connections": warm_up_connections,
+        "status_catalog": load_status_catalog,
+        "jwt": jwt_handler.warm_up,
+    }
+    with ThreadPoolExecutor(max_workers=len(steps), thread_name_prefix="warm-up") as executor:
+        for name, step in steps.items():
+            executor.submit(_warm_up_step, name, step)
+
+
+def start_up() -> None:
+    """
+    Crea el motor, prepara la base de datos si ``DB_PREPARE_ON_STARTUP`` y
+    precalienta el proceso.
+
+    Raises:
+        DatabaseNotReady: Si la base de datos no está lista (el servidor no arranca)
+    """
+    with startup_report.phase("engine"):
+        engine = get_engine()
+    if DB_PREPARE_ON_STARTUP:
+        with startup_report.phase("prepare_database"):
+            prepare_database(engine)
+    if STARTUP_WARM_UP:
+        with startup_report.phase("warm_up"):
+            warm_up()
+
+
+def warn_sync_only_settings() -> None:
+    """
+    Avisa de la configuración que no tiene efecto con ``DB_MODE=async``: la
+    caché de items y las réplicas de lectura solo están en las rutas
+    síncronas de items.
+    """
+    if not is_async_db_enabled():
+        return
+    if os.getenv("ITEM_CACHE_BACKEND") and ITEM_CACHE_BACKEND != "none":
+        logger.warning(
+            "ITEM_CACHE_BACKEND=%s no tiene efecto con DB_MODE=async: las rutas asíncronas "
+            "de items no usan la caché de lecturas", ITEM_CACHE_BACKEND,
+        )
+    if DATABASE_REPLICA_URLS:
+        logger.warning(
+            "Con DB_MODE=async las rutas de items leen siempre de la primaria: "
+            "DATABASE_REPLICA_URLS solo se usa en el resto de rutas"
+        )
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Tareas de arranque y parada de la aplicación."""
+    warn_sync_only_settings()
+    await run_in_threadpool(start_up)
+    if STARTUP_WARM_UP and is_async_db_enabled():
+        try:
+            with startup_report.phase("async_db_connections"):
+                await warm_up_async_connections()
+        except Exception as e:
+            logger.warning("Precalentamiento 'async_db_connections' fallido: %s", e)
+    startup_report.finish()
+    logger.info("Arranque: %s", startup_report.summary())
+    yield
+    await dispose_async_engine()
+    hashing_pool.shutdown()
+
+
+app = FastAPI(
+    title="Ticketing System API",
+    version="1.0.0",
+    lifespan=lifespan,
+    dependencies=[Depends(track_in_flight), Depends(enforce_rate_limits)],
+)
+app.add_middleware(ServerTimingMiddleware)
+# Con RATE_LIMIT_ENABLED=false la dependencia no hace nada y no hay cabeceras que añadir
+if rate_limit_store is not None:
+    app.add_middleware(RateLimitHeadersMiddleware)
+# Sin réplicas no se emiten tokens y el middleware no añade nada
+app.add_middleware(ReadYourWritesMiddleware)
+app.add_middleware(RequestMetricsMiddleware)
+# Sin perfilado configurado el middleware no se instala (coste cero)
+if is_profiling_enabled():
+    app.add_middleware(ProfilingMiddleware)
+
+# Incluir routers (las rutas fijas de /items van antes que /items/{item_id})
 app.include_router(auth.router)
-app.include_router(items.router)
+app.include_router(items_bulk.router)
+app.include_router(items_export.router)
+app.include_router(items_search.router)
+# DB_MODE=async sirve los items con rutas y repositorios asíncronos
+app.include_router(items_async.router if is_async_db_enabled() else items.router)
+app.include_router(admin.router)
+app.include_router(metrics.router)
 
 
 @app.get("/health", tags=["health"])
 def health():
     """Health check endpoint (público)."""
     return {"status": "ok"}
-
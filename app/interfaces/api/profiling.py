@@ -0,0 +1,83 @@
+"""Perfilado por muestreo de peticiones en vivo."""
+import random
+import threading
+
+from jose import JWTError
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.infrastructure.monitoring.profiler import (
+    PROFILER_ALLOW_HEADER,
+    PROFILER_SAMPLE_RATE,
+    ProfileStore,
+    StackSampler,
+    profile_store,
+)
+from app.infrastructure.security.jwt_handler import decode_token
+
+PROFILE_HEADER = "x-profile"
+
+
+def _is_admin_token(headers: Headers) -> bool:
+    """Indica si la petición trae un token válido con rol admin."""
+    scheme, _, token = headers.get("authorization", "").partition(" ")
+    if scheme.lower() != "bearer" or not token:
+        return False
+    try:
+        return decode_token(token).get("role") == "admin"
+    except JWTError:
+        return False
+
+
+class ProfilingMiddleware:
+    """
+    Perfila una fracción ``sample_rate`` de las peticiones y, con
+    ``allow_header``, las que traen ``X-Profile`` con un token de admin.
+
+    Solo se instala si alguna de las dos opciones está activa. Se perfila
+    una petición a la vez: mientras hay un perfil en curso el resto de
+    peticiones no se muestrean. La respuesta perfilada lleva
+    ``X-Profile-Id`` con el nombre del perfil que se descargará desde
+    ``/admin/profiles``.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        sample_rate: float = PROFILER_SAMPLE_RATE,
+        allow_header: bool = PROFILER_ALLOW_HEADER,
+        store: ProfileStore = profile_store
+    ):
+        self.app = app
+        self.sample_rate = sample_rate
+        self.allow_header = allow_header
+        self.store = store
+        self._busy = threading.Lock()
+
+    def _wants_profile(self, scope: Scope) -> bool:
+        if self.allow_header:
+            headers = Headers(scope=scope)
+            if PROFILE_HEADER in headers and _is_admin_token(headers):
+                return True
+        return self.sample_rate > 0 and random.random() < self.sample_rate
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not self._wants_profile(scope) or not self._busy.acquire(blocking=False):
+            await self.app(scope, receive, send)
+            return
+        name = self.store.new_name(scope["method"], scope["path"])
+
+        async def send_with_profile_id(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                MutableHeaders(scope=message).append("X-Profile-Id", name)
+            await send(message)
+
+        try:
+            sampler = StackSampler().start()
+            try:
+                await self.app(scope, receive, send_with_profile_id)
+            finally:
+                stacks = sampler.stop()
+                self.store.save(name, stacks)
+        finally:
+            self._busy.release()
@@ -0,0 +1,202 @@
+"""
+Límites de peticiones por ruta y cliente, con cabeceras ``RateLimit-*``.
+
+Cada política se aplica a una ruta (método y plantilla) y cuenta las
+peticiones por una clave del cliente: su IP, el usuario del token Bearer
+(o la IP si no hay token válido) o el email con el que intenta hacer login.
+Una petición debe pasar todas las políticas de su ruta; las rutas sin
+política propia usan ``RATE_LIMIT_DEFAULT`` si está configurado.
+
+La IP es la del cliente de la conexión: detrás de un proxy, uvicorn debe
+confiar en sus cabeceras (``--forwarded-allow-ips``) o todos los clientes
+compartirán la IP del proxy.
+"""
+import os
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+from fastapi import HTTPException, Request
+from jose import JWTError
+from starlette.concurrency import run_in_threadpool
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.infrastructure.monitoring.metrics import metrics
+from app.infrastructure.security.jwt_handler import decode_token
+from app.infrastructure.security.rate_limit import (
+    RATE_LIMIT_ENABLED,
+    RateLimitDecision,
+    RateLimitStore,
+    create_rate_limit_store,
+    parse_rate,
+)
+from app.interfaces.api.request_metrics import route_template
+
+# Límites "peticiones/segundos" de cada política (vacío o 0 = sin límite)
+RATE_LIMIT_LOGIN_PER_EMAIL = os.getenv("RATE_LIMIT_LOGIN_PER_EMAIL", "5/60")
+RATE_LIMIT_LOGIN_PER_IP = os.getenv("RATE_LIMIT_LOGIN_PER_IP", "20/60")
+RATE_LIMIT_REGISTER_PER_IP = os.getenv("RATE_LIMIT_REGISTER_PER_IP", "10/600")
+RATE_LIMIT_ITEMS_LIST = os.getenv("RATE_LIMIT_ITEMS_LIST", "120/60")
+RATE_LIMIT_DEFAULT = os.getenv("RATE_LIMIT_DEFAULT", "")
+
+# Claves de cliente
+BY_IP = "ip"
+BY_USER = "user"
+BY_LOGIN_EMAIL = "login_email"
+
+# Plantilla de las políticas que se aplican a las rutas sin política propia
+ANY_ROUTE = "*"
+# Rutas que nunca se limitan (sondas y scraping de métricas)
+EXEMPT_ROUTES = frozenset({"/health", "/metrics"})
+
+# Cabeceras de la respuesta, guardadas en el scope por la dependencia
+_SCOPE_HEADERS = "rate_limit_headers"
+
+rejections_total = metrics.counter(
+    "rate_limit_rejections_total", "Peticiones rechazadas con 429 por política", ("policy",)
+)
+
+
+@dataclass(frozen=True)
+class RateLimitPolicy:
+    name: str
+    method: str
+    route: str
+    key: str
+    limit: int
+    period: float
+
+
+def build_policies(settings: List[Tuple[str, str, str, str, str]]) -> List[RateLimitPolicy]:
+    """
+    Crea las políticas activas a partir de ``(nombre, método, ruta, clave, límite)``.
+
+    Raises:
+        ValueError: Si algún límite no es válido
+    """
+    policies = []
+    for name, method, route, key, value in settings:
+        rate = parse_rate(value)
+        if rate is not None:
+            policies.append(RateLimitPolicy(name, method, route, key, *rate))
+    return policies
+
+
+rate_limit_policies = build_policies([
+    # Fuerza bruta contra una cuenta (cada intento cuesta un bcrypt)
+    ("login-email", "POST", "/auth/login", BY_LOGIN_EMAIL, RATE_LIMIT_LOGIN_PER_EMAIL),
+    # Un cliente probando muchas cuentas
+    ("login-ip", "POST", "/auth/login", BY_IP, RATE_LIMIT_LOGIN_PER_IP),
+    ("register-ip", "POST", "/auth/register", BY_IP, RATE_LIMIT_REGISTER_PER_IP),
+    ("items-list", "GET", "/items/", BY_USER, RATE_LIMIT_ITEMS_LIST),
+    ("default", ANY_ROUTE, ANY_ROUTE, BY_USER, RATE_LIMIT_DEFAULT),
+])
+
+rate_limit_store: Optional[RateLimitStore] = create_rate_limit_store() if RATE_LIMIT_ENABLED else None
+
+
+def policies_for(method: str, route: str, policies: List[RateLimitPolicy]) -> List[RateLimitPolicy]:
+    """Políticas de una ruta: las suyas o, si no tiene, las de ``ANY_ROUTE``."""
+    if route in EXEMPT_ROUTES:
+        return []
+    own = [policy for policy in policies if policy.method == method and policy.route == route]
+    return own or [policy for policy in policies if policy.route == ANY_ROUTE]
+
+
+def _client_ip(request: Request) -> str:
+    return request.client.host if request.client else "unknown"
+
+
+async def client_key(kind: str, request: Request) -> Optional[str]:
+    """Clave del cliente para una política; None si la petición no la tiene."""
+    if kind == BY_IP:
+        return f"ip:{_client_ip(request)}"
+    if kind == BY_USER:
+        scheme, _, token = request.headers.get("authorization", "").partition(" ")
+        if scheme.lower() == "bearer" and token:
+            try:
+                subject = decode_token(token).get("sub")
+            except JWTError:
+                subject = None
+            if subject:
+                return f"user:{subject}"
+        return f"ip:{_client_ip(request)}"
+    if kind == BY_LOGIN_EMAIL:
+        # El formulario ya lo leyó FastAPI: request.form() devuelve el mismo
+        username = (await request.form()).get("username")
+        return f"email:{username.strip().lower()}" if isinstance(username, str) and username.strip() else None
+    raise ValueError(f"Clave de límite desconocida: {kind}")
+
+
+def rate_limit_headers(policy: RateLimitPolicy, decision: RateLimitDecision) -> Dict[str, str]:
+    """Cabeceras ``RateLimit-*`` (borrador IETF) de una decisión."""
+    return {
+        "RateLimit-Limit": str(decision.limit),
+        "RateLimit-Remaining": str(decision.remaining),
+        "RateLimit-Reset": str(decision.reset_seconds),
+        "RateLimit-Policy": f"{policy.limit};w={policy.period:g}",
+    }
+
+
+async def enforce_rate_limits(request: Request) -> None:
+    """
+    Dependencia global que aplica las políticas de la ruta.
+
+    Es una dependencia y no un middleware porque la ruta solo se conoce
+    después del enrutado y el email del login está en el formulario. Las
+    cabeceras de las respuestas admitidas las añade ``RateLimitHeadersMiddleware``.
+
+    Raises:
+        HTTPException 429: Con ``Retry-After`` si alguna política está agotada
+    """
+    store = rate_limit_store
+    if store is None:
+        return
+    tightest: Optional[Tuple[RateLimitPolicy, RateLimitDecision]] = None
+    for policy in policies_for(request.method, route_template(request.scope), rate_limit_policies):
+        key = await client_key(policy.key, request)
+        if key is None:
+            continue
+        bucket = f"{policy.name}:{key}"
+        if store.blocking:
+            decision = await run_in_threadpool(store.hit, bucket, policy.limit, policy.period)
+        else:
+            decision = store.hit(bucket, policy.limit, policy.period)
+        if not decision.allowed:
+            rejections_total.inc((policy.name,))
+            raise HTTPException(
+                status_code=429,
+                detail="Demasiadas peticiones, reintenta más tarde",
+                headers={**rate_limit_headers(policy, decision), "Retry-After": str(decision.retry_after)},
+            )
+        if tightest is None or decision.remaining < tightest[1].remaining:
+            tightest = (policy, decision)
+    if tightest is not None:
+        request.scope[_SCOPE_HEADERS] = rate_limit_headers(*tightest)
+
+
+class RateLimitHeadersMiddleware:
+    """
+    Añade las cabeceras ``RateLimit-*`` de la política más ajustada a las
+    respuestas de las rutas limitadas.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        async def send_with_headers(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                headers = scope.get(_SCOPE_HEADERS)
+                if headers:
+                    response_headers = MutableHeaders(scope=message)
+                    for name, value in headers.items():
+                        if name not in response_headers:
+                            response_headers.append(name, value)
+            await send(message)
+
+        await self.app(scope, receive, send_with_headers)
@@ -0,0 +1,44 @@
+"""
+Entrega al cliente el token que le fija a la base de datos primaria tras
+una escritura confirmada (lee sus propios cambios aunque las réplicas vayan
+con retraso).
+
+El token se envía como cookie ``db_sticky`` y en la cabecera ``X-DB-Sticky``
+para los clientes sin cookies, que deben devolverla en sus siguientes
+peticiones.
+"""
+import math
+
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.infrastructure.database.replicas import STICKY_TOKEN
+from app.infrastructure.database.session import STICKY_COOKIE, STICKY_HEADER
+
+
+class ReadYourWritesMiddleware:
+    """Añade el token de la última escritura de la petición a su respuesta."""
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        async def send_with_token(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                issued = scope.get(STICKY_TOKEN)
+                if issued:
+                    token, seconds = issued
+                    headers = MutableHeaders(scope=message)
+                    headers.append(STICKY_HEADER, token)
+                    max_age = math.ceil(seconds)
+                    headers.append(
+                        "Set-Cookie",
+                        f"{STICKY_COOKIE}={token}; Max-Age={max_age}; Path=/; HttpOnly; SameSite=Lax",
+                    )
+            await send(message)
+
+        await self.app(scope, receive, send_with_token)
@@ -0,0 +1,76 @@
+"""Métricas RED por ruta: peticiones, errores (clase de estado) y duración."""
+import time
+from typing import AsyncIterator
+
+from fastapi import Request
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.infrastructure.monitoring.metrics import metrics
+
+requests_total = metrics.counter(
+    "http_requests_total", "Peticiones HTTP atendidas", ("method", "route", "status_class")
+)
+request_duration = metrics.histogram(
+    "http_request_duration_seconds", "Duración de las peticiones HTTP", ("method", "route")
+)
+requests_in_flight = metrics.gauge(
+    "http_requests_in_flight", "Peticiones HTTP en curso", ("method", "route")
+)
+
+# Etiqueta de las peticiones que no corresponden a ninguna ruta (evita una
+# serie por cada URL inexistente)
+UNMATCHED_ROUTE = "unmatched"
+
+
+def route_template(scope: Scope) -> str:
+    """
+    Plantilla de la ruta que atendió la petición (``/items/{item_id}``, no
+    ``/items/42``). El router la deja en ``scope["route"]`` al resolverla.
+    """
+    return getattr(scope.get("route"), "path", UNMATCHED_ROUTE)
+
+
+async def track_in_flight(request: Request) -> AsyncIterator[None]:
+    """
+    Dependencia global que mantiene ``http_requests_in_flight``.
+
+    Es una dependencia y no parte del middleware porque la ruta solo se
+    conoce después del enrutado.
+    """
+    labels = (request.method, route_template(request.scope))
+    requests_in_flight.inc(labels)
+    try:
+        yield
+    finally:
+        requests_in_flight.dec(labels)
+
+
+class RequestMetricsMiddleware:
+    """
+    Registra cada petición HTTP en ``http_requests_total`` y
+    ``http_request_duration_seconds``, etiquetadas por método y plantilla
+    de ruta.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        status = [500]
+
+        async def send_with_status(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                status[0] = message["status"]
+            await send(message)
+
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            labels = (scope["method"], route_template(scope))
+            request_duration.observe(labels, time.perf_counter() - started)
+            requests_total.inc((*labels, f"{status[0] // 100}xx"))
+            metrics.maybe_flush()
@@ -0,0 +1,20 @@
+"""Respuestas JSON serializadas con orjson."""
+from typing import Any
+
+import orjson
+from fastapi.responses import JSONResponse
+
+
+class FastJSONResponse(JSONResponse):
+    """
+    ``JSONResponse`` que serializa con orjson.
+
+    Las rutas que la devuelven directamente entregan diccionarios ya
+    construidos a partir de datos de confianza (entidades de dominio), de
+    modo que FastAPI no vuelve a validarlos contra ``response_model``; este
+    se mantiene solo para documentar el esquema en OpenAPI. Las fechas sin
+    zona se emiten en ISO 8601 igual que con Pydantic.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content)
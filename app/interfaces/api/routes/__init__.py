@@ -1,4 +1,13 @@
 """Rutas de la API."""
-from . import auth, items
+from . import admin, auth, items, items_async, items_bulk, items_export, items_search, metrics
 
-__all__ = ["auth", "items"]
+__all__ = [
+    "admin",
+    "auth",
+    "items",
+    "items_async",
+    "items_bulk",
+    "items_export",
+    "items_search",
+    "metrics",
+]
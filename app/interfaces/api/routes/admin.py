@@ -0,0 +1,106 @@
+"""Rutas de administración y diagnóstico."""
+from dataclasses import asdict
+
+from fastapi import APIRouter, Depends, HTTPException
+from fastapi.responses import FileResponse
+
+from app.domain.entities.user import User
+from app.infrastructure.database.async_session import get_async_engine_if_created
+from app.infrastructure.database.pool_metrics import pool_status
+from app.infrastructure.database.session import get_engine, get_replica_engines, session_router
+from app.infrastructure.monitoring.profiler import profile_store
+from app.infrastructure.monitoring.startup import startup_report
+from app.infrastructure.repositories.cached_item_repository import item_read_cache
+from app.infrastructure.security.hashing_pool import hashing_pool
+from app.interfaces.api.dependencies import require_role
+
+router = APIRouter(prefix="/admin", tags=["admin"])
+
+
+@router.get("/password-hashing")
+def password_hashing_stats(current_user: User = Depends(require_role(["admin"]))):
+    """
+    Estado del pool de hashing de contraseñas: cola, rechazos y esperas.
+    
+    **Requiere rol: admin.**
+    """
+    return hashing_pool.stats()
+
+
+@router.get("/db-pool")
+def db_pool_stats(current_user: User = Depends(require_role(["admin"]))):
+    """
+    Estado de los pools de conexiones: conexiones en uso, overflow,
+    timeouts e histograma de espera al obtener conexión.
+    
+    **Requiere rol: admin.**
+    """
+    pools = [pool_status("primary", get_engine())]
+    pools.extend(pool_status(f"replica-{index}", replica) for index, replica in enumerate(get_replica_engines()))
+    async_engine = get_async_engine_if_created()
+    if async_engine is not None:
+        pools.append(pool_status("async", async_engine.sync_engine))
+    return pools
+
+
+@router.get("/db-replicas")
+def db_replica_stats(current_user: User = Depends(require_role(["admin"]))):
+    """
+    Enrutado de lecturas a réplicas: réplicas configuradas, lecturas
+    servidas por ellas y lecturas fijadas a la primaria tras una escritura.
+    
+    **Requiere rol: admin.**
+    """
+    return session_router.stats()
+
+
+@router.get("/item-cache")
+def item_cache_stats(current_user: User = Depends(require_role(["admin"]))):
+    """
+    Estado de la caché de lecturas de items: backend, aciertos, fallos y
+    desalojos (`enabled: false` con `ITEM_CACHE_BACKEND=none`).
+    
+    **Requiere rol: admin.**
+    """
+    if item_read_cache is None:
+        return {"enabled": False}
+    return {"enabled": True, **item_read_cache.stats()}
+
+
+@router.get("/startup")
+def startup_stats(current_user: User = Depends(require_role(["admin"]))):
+    """
+    Tiempo de arranque del proceso: duración de cada fase (importación,
+    preparación de la base de datos, precalentamiento) y tiempo total hasta
+    aceptar tráfico.
+    
+    **Requiere rol: admin.**
+    """
+    return startup_report.as_dict()
+
+
+@router.get("/profiles")
+def list_profiles(current_user: User = Depends(require_role(["admin"]))):
+    """
+    Perfiles de peticiones guardados (del más reciente al más antiguo).
+    
+    Se generan con `PROFILER_SAMPLE_RATE` o, si `PROFILER_ALLOW_HEADER`
+    está activo, con la cabecera `X-Profile` en una petición de un admin.
+    
+    **Requiere rol: admin.**
+    """
+    return [asdict(profile) for profile in profile_store.list()]
+
+
+@router.get("/profiles/{name}")
+def download_profile(name: str, current_user: User = Depends(require_role(["admin"]))):
+    """
+    Descarga un perfil en formato de pilas colapsadas (flamegraph.pl,
+    speedscope, inferno).
+    
+    **Requiere rol: admin.**
+    """
+    path = profile_store.path(name)
+    if path is None:
+        raise HTTPException(status_code=404, detail="Perfil no encontrado")
+    return FileResponse(path, media_type="text/plain", filename=name)
@@ -1,16 +1,22 @@
 """Rutas de autenticación."""
 from datetime import timedelta
 from fastapi import APIRouter, Depends, HTTPException
+from fastapi.concurrency import run_in_threadpool
 from fastapi.security import OAuth2PasswordRequestForm
 from sqlalchemy.orm import Session
 
 from app.infrastructure.database.session import get_db
 from app.domain.entities.user import User
-from app.interfaces.api.converters import domain_user_to_schema
+from app.interfaces.api.converters import domain_user_to_dict
+from app.interfaces.api.responses import FastJSONResponse
 from app.domain.repositories.user_repository import UserRepository
-from app.application.services.auth_service import AuthService
-from app.application.use_cases.auth.register_user import RegisterUserUseCase
-from app.application.use_cases.auth.login_user import LoginUserUseCase
+from app.domain.repositories.async_user_repository import AsyncUserRepository
+from app.application.services.auth_service import AsyncAuthService
+from app.application.use_cases.auth.register_user import AsyncRegisterUserUseCase
+from app.application.use_cases.auth.login_user import AsyncLoginUserUseCase
+from app.infrastructure.monitoring.metrics import metrics
+from app.infrastructure.repositories.threaded_user_repository import ThreadedUserRepository
+from app.infrastructure.security.hashing_pool import HashingPoolSaturated
 from app.interfaces.schemas import User as UserSchema, UserCreate, Token
 from app.interfaces.api.dependencies import (
     get_current_active_user,
@@ -19,18 +25,42 @@ from app.interfaces.api.dependencies import (
 
 router = APIRouter(prefix="/auth", tags=["auth"])
 
+logins_total = metrics.counter("auth_logins_total", "Intentos de login por resultado", ("result",))
 
-def get_auth_service(user_repo: UserRepository = Depends(get_user_repository)) -> AuthService:
+
+def get_threaded_user_repository(
+    user_repo: UserRepository = Depends(get_user_repository),
+) -> AsyncUserRepository:
+    """
+    Repositorio de usuarios de la sesión síncrona cuyas llamadas van a un
+    hilo: las rutas asíncronas de autenticación no bloquean el bucle de
+    eventos y conservan los eventos de la sesión síncrona.
+    """
+    return ThreadedUserRepository(user_repo)
+
+
+def get_auth_service(
+    user_repo: AsyncUserRepository = Depends(get_threaded_user_repository),
+) -> AsyncAuthService:
     """Dependencia para obtener el servicio de autenticación."""
-    return AuthService(user_repo)
+    return AsyncAuthService(user_repo)
+
+
+def _hashing_busy_exception(error: HashingPoolSaturated) -> HTTPException:
+    """Error 503 con Retry-After cuando el pool de bcrypt está saturado."""
+    return HTTPException(
+        status_code=503,
+        detail=str(error),
+        headers={"Retry-After": str(error.retry_after)},
+    )
 
 
 @router.post("/register", response_model=UserSchema, status_code=201)
-def register(
+async def register(
     user: UserCreate,
     db: Session = Depends(get_db),
-    user_repo: UserRepository = Depends(get_user_repository),
-    auth_service: AuthService = Depends(get_auth_service)
+    user_repo: AsyncUserRepository = Depends(get_threaded_user_repository),
+    auth_service: AsyncAuthService = Depends(get_auth_service)
 ):
     """
     Registra un nuevo usuario.
@@ -40,14 +70,16 @@ def register(
     - **full_name**: Nombre completo (opcional)
     """
     try:
-        use_case = RegisterUserUseCase(user_repo, auth_service)
-        domain_user = use_case.execute(user)
-        return domain_user_to_schema(domain_user)
+        use_case = AsyncRegisterUserUseCase(user_repo, auth_service)
+        domain_user = await use_case.execute(user)
+        return FastJSONResponse(domain_user_to_dict(domain_user), status_code=201)
+    except HashingPoolSaturated as e:
+        raise _hashing_busy_exception(e)
     except ValueError as e:
         # Capturar errores de validación de contraseña o email duplicado
         raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
-        db.rollback()
+        await run_in_threadpool(db.rollback)
         raise HTTPException(
             status_code=500,
             detail=f"Error al registrar usuario: {str(e)}"
@@ -55,10 +87,9 @@ def register(
 
 
 @router.post("/login", response_model=Token)
-def login(
+async def login(
     form_data: OAuth2PasswordRequestForm = Depends(),
-    user_repo: UserRepository = Depends(get_user_repository),
-    auth_service: AuthService = Depends(get_auth_service)
+    auth_service: AsyncAuthService = Depends(get_auth_service)
 ):
     """
     Inicia sesión y obtiene un token JWT.
@@ -70,9 +101,15 @@ def login(
     Retorna un access_token para usar en el header Authorization.
     """
     try:
-        use_case = LoginUserUseCase(user_repo, auth_service)
-        return use_case.execute(form_data.username, form_data.password)
+        use_case = AsyncLoginUserUseCase(auth_service)
+        token = await use_case.execute(form_data.username, form_data.password)
+        logins_total.inc(("success",))
+        return FastJSONResponse({"access_token": token.access_token, "token_type": token.token_type})
+    except HashingPoolSaturated as e:
+        logins_total.inc(("busy",))
+        raise _hashing_busy_exception(e)
     except ValueError as e:
+        logins_total.inc(("failure",))
         raise HTTPException(
             status_code=401,
             detail=str(e),
@@ -83,5 +120,5 @@ def login(
 @router.get("/me", response_model=UserSchema)
 def get_me(current_user: User = Depends(get_current_active_user)):
     """Obtiene la información del usuario autenticado."""
-    return domain_user_to_schema(current_user)
+    return FastJSONResponse(domain_user_to_dict(current_user))
 
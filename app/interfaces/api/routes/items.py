@@ -1,28 +1,110 @@
 """Rutas de items/tickets."""
-from fastapi import APIRouter, Depends, HTTPException
+from datetime import datetime
+from typing import Any, Dict, Optional
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Request, Response
 from sqlalchemy.orm import Session
 
-from app.infrastructure.database.session import get_db
+from app.infrastructure.database.replicas import ROUTED_TO, STICKY
+from app.infrastructure.database.session import get_db, get_read_db
 from app.domain.entities.user import User
+from app.domain.entities.item import Item as DomainItem
+from app.domain.entities.item_filters import ItemFilters, ItemSort
 from app.domain.repositories.item_repository import ItemRepository
 from app.infrastructure.repositories.item_repository_impl import ItemRepositoryImpl
+from app.infrastructure.repositories.cached_item_repository import CachedItemRepository, item_read_cache
+from app.infrastructure.cache.status_catalog import status_catalog
 from app.application.use_cases.items.create_item import CreateItemUseCase
 from app.application.use_cases.items.get_item import GetItemUseCase
 from app.application.use_cases.items.list_items import ListItemsUseCase
-from app.application.use_cases.items.update_item import UpdateItemUseCase
+from app.application.use_cases.items.list_items_by_cursor import ListItemsByCursorUseCase
+from app.application.use_cases.items.update_item import ItemVersionConflict, UpdateItemUseCase
 from app.application.use_cases.items.update_item_status import UpdateItemStatusUseCase
 from app.application.use_cases.items.delete_item import DeleteItemUseCase
 from app.application.use_cases.items.get_statuses import GetStatusesUseCase
-from app.interfaces.schemas import Item, ItemCreate, ItemStatus
+from app.application.use_cases.items.get_item_stats import GetItemStatsUseCase
+from app.interfaces.schemas import Item, ItemCreate, ItemStats, ItemStatus
 from app.interfaces.api.dependencies import get_current_active_user, require_role
-from app.interfaces.api.converters import domain_item_to_schema, domain_item_status_to_schema
+from app.interfaces.api.responses import FastJSONResponse
+from app.interfaces.api.conditional import (
+    expected_version,
+    item_etag,
+    list_etag,
+    not_modified,
+    not_modified_response,
+    validator_headers,
+)
+from app.interfaces.api.converters import (
+    domain_item_to_dict,
+    domain_item_status_to_schema,
+    domain_item_stats_to_schema,
+)
 
 router = APIRouter(prefix="/items", tags=["items"])
 
 
 def get_item_repository(db: Session = Depends(get_db)) -> ItemRepository:
-    """Dependencia para obtener el repositorio de items."""
-    return ItemRepositoryImpl(db)
+    """Dependencia para obtener el repositorio de items (con caché de lecturas si está activa)."""
+    item_repo = ItemRepositoryImpl(db, status_catalog)
+    if item_read_cache is None:
+        return item_repo
+    return CachedItemRepository(item_repo, item_read_cache)
+
+
+def get_read_item_repository(db: Session = Depends(get_read_db)) -> ItemRepository:
+    """
+    Repositorio de items para las rutas de solo lectura (réplica si hay).
+    
+    Si el usuario escribió hace poco lee de la primaria y sin caché: una
+    entrada cacheada desde una réplica con retraso podría no incluir su cambio.
+    """
+    if db.info.get(ROUTED_TO) == STICKY:
+        return ItemRepositoryImpl(db, status_catalog)
+    return get_item_repository(db)
+
+
+def parse_item_sort(sort: Optional[str]) -> ItemSort:
+    """
+    Interpreta el parámetro ``sort`` de los listados.
+    
+    Raises:
+        HTTPException 400: Si el orden no es válido
+    """
+    try:
+        return ItemSort.parse(sort)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
+def build_item_filters(
+    item_repo: ItemRepository,
+    status: Optional[str] = None,
+    reported_user: Optional[str] = None,
+    created_from: Optional[datetime] = None,
+    created_to: Optional[datetime] = None
+) -> ItemFilters:
+    """
+    Construye los filtros de items resolviendo el nombre de estado.
+    
+    Raises:
+        HTTPException 400: Si el estado no existe
+    """
+    filters = ItemFilters(reported_user=reported_user, created_from=created_from, created_to=created_to)
+    if status is not None:
+        status_obj = item_repo.get_status_by_name(status)
+        if status_obj is None:
+            raise HTTPException(status_code=400, detail=f"Estado inválido: {status}")
+        filters.status_id = status_obj.id
+    return filters
+
+
+def item_to_response(domain_item: DomainItem) -> Dict[str, Any]:
+    """
+    Cuerpo JSON de un item con su estado ya cargado, listo para
+    ``FastJSONResponse`` (sin pasar por el schema ``Item``).
+    """
+    if domain_item.status is None:
+        raise HTTPException(status_code=500, detail="Estado no encontrado")
+    return domain_item_to_dict(domain_item)
 
 
 @router.post("/", response_model=Item, status_code=201)
@@ -38,75 +120,138 @@ def create_item(
     """
     use_case = CreateItemUseCase(item_repo)
     domain_item = use_case.execute(item)
-    status = item_repo.get_status_by_id(domain_item.status_id)
-    if not status:
-        raise HTTPException(status_code=500, detail="Estado no encontrado")
-    return domain_item_to_schema(domain_item, status)
+    return FastJSONResponse(item_to_response(domain_item), status_code=201)
 
 
 @router.get("/", response_model=list[Item])
 def read_items(
+    request: Request,
+    response: Response,
     skip: int = 0,
     limit: int = 100,
-    item_repo: ItemRepository = Depends(get_item_repository),
+    cursor: Optional[str] = None,
+    status: Optional[str] = None,
+    reported_user: Optional[str] = None,
+    created_from: Optional[datetime] = None,
+    created_to: Optional[datetime] = None,
+    sort: Optional[str] = None,
+    item_repo: ItemRepository = Depends(get_read_item_repository),
+    current_user: User = Depends(get_current_active_user)
+):
+    """
+    Lista todos los tickets con paginación, filtros y orden.
+    
+    - **skip/limit**: paginación por desplazamiento (compatibilidad)
+    - **cursor**: activa la paginación por cursor, ordenada por fecha de
+      creación e ID. Usa `cursor=` (vacío) para la primera página y el valor
+      de la cabecera `X-Next-Cursor` para las siguientes; si la cabecera no
+      aparece no hay más páginas. En este modo se ignora `skip`.
+    - **status**: nombre del estado (IN_PROGRESS, RESOLVED)
+    - **reported_user**: usuario que reportó el ticket
+    - **created_from / created_to**: rango de fecha de creación [desde, hasta)
+    - **sort**: `id`, `creation_date` o `name`; prefijo `-` para descendente
+      (p. ej. `-creation_date`). Con cursor solo se admite `creation_date`.
+    
+    Responde con la `ETag` de la página; con `If-None-Match` vigente
+    devuelve 304 sin cuerpo (los listados no usan `Last-Modified`, que no
+    refleja los items borrados).
+    
+    **Requiere autenticación.**
+    """
+    filters = build_item_filters(item_repo, status, reported_user, created_from, created_to)
+    item_sort = parse_item_sort(sort)
+    if cursor is not None:
+        use_case = ListItemsByCursorUseCase(item_repo)
+        try:
+            domain_items, next_cursor = use_case.execute(cursor, limit, filters, item_sort if sort else None)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        if next_cursor is not None:
+            response.headers["X-Next-Cursor"] = next_cursor
+    else:
+        use_case = ListItemsUseCase(item_repo)
+        domain_items = use_case.execute(skip, limit, filters, item_sort)
+    
+    etag = list_etag(domain_items)
+    if not_modified(request, etag):
+        return not_modified_response(etag, **response.headers)
+    response.headers.update(validator_headers(etag))
+    return FastJSONResponse([item_to_response(domain_item) for domain_item in domain_items], headers=response.headers)
+
+
+@router.get("/stats", response_model=ItemStats)
+def get_item_stats(
+    reporter_limit: int = Query(100, ge=1, le=1000),
+    item_repo: ItemRepository = Depends(get_read_item_repository),
     current_user: User = Depends(get_current_active_user)
 ):
     """
-    Lista todos los tickets con paginación.
+    Número de tickets por estado y por usuario reportante.
+    
+    Se sirve desde contadores mantenidos en cada escritura, sin recorrer los
+    tickets. `by_reporter` incluye los `reporter_limit` usuarios con más
+    tickets (`reported_user` nulo agrupa los tickets sin reportante).
     
     **Requiere autenticación.**
     """
-    use_case = ListItemsUseCase(item_repo)
-    domain_items = use_case.execute(skip, limit)
-    result = []
-    for domain_item in domain_items:
-        status = item_repo.get_status_by_id(domain_item.status_id)
-        if status:
-            result.append(domain_item_to_schema(domain_item, status))
-    return result
+    domain_stats = GetItemStatsUseCase(item_repo).execute(reporter_limit)
+    statuses = GetStatusesUseCase(item_repo).execute()
+    return domain_item_stats_to_schema(domain_stats, statuses)
 
 
 @router.get("/{item_id}", response_model=Item)
 def read_item(
     item_id: int,
-    item_repo: ItemRepository = Depends(get_item_repository),
+    request: Request,
+    response: Response,
+    item_repo: ItemRepository = Depends(get_read_item_repository),
     current_user: User = Depends(get_current_active_user)
 ):
     """
     Obtiene un ticket específico por ID.
     
+    Responde con `ETag` y `Last-Modified`; con `If-None-Match` o
+    `If-Modified-Since` vigentes devuelve 304 sin cuerpo.
+    
     **Requiere autenticación.**
     """
     use_case = GetItemUseCase(item_repo)
     domain_item = use_case.execute(item_id)
     if domain_item is None:
         raise HTTPException(status_code=404, detail="Item not found")
-    status = item_repo.get_status_by_id(domain_item.status_id)
-    if not status:
-        raise HTTPException(status_code=500, detail="Estado no encontrado")
-    return domain_item_to_schema(domain_item, status)
+    etag, modified = item_etag(domain_item), domain_item.updated_at
+    if not_modified(request, etag, modified):
+        return not_modified_response(etag, modified)
+    response.headers.update(validator_headers(etag, modified))
+    return FastJSONResponse(item_to_response(domain_item), headers=response.headers)
 
 
 @router.put("/{item_id}", response_model=Item)
 def update_item(
     item_id: int,
     item: ItemCreate,
+    response: Response,
+    if_match: Optional[str] = Header(None),
     item_repo: ItemRepository = Depends(get_item_repository),
     current_user: User = Depends(get_current_active_user)
 ):
     """
     Actualiza un ticket existente.
     
+    Con `If-Match` (ETag de `GET /items/{item_id}`) solo actualiza si el
+    ticket no ha cambiado desde entonces; si cambió responde 412.
+    
     **Requiere autenticación.**
     """
     use_case = UpdateItemUseCase(item_repo)
-    domain_item = use_case.execute(item_id, item)
+    try:
+        domain_item = use_case.execute(item_id, item, expected_version(if_match, item_id))
+    except ItemVersionConflict as e:
+        raise HTTPException(status_code=412, detail=str(e))
     if domain_item is None:
         raise HTTPException(status_code=404, detail="Item not found")
-    status = item_repo.get_status_by_id(domain_item.status_id)
-    if not status:
-        raise HTTPException(status_code=500, detail="Estado no encontrado")
-    return domain_item_to_schema(domain_item, status)
+    response.headers.update(validator_headers(item_etag(domain_item), domain_item.updated_at))
+    return FastJSONResponse(item_to_response(domain_item), headers=response.headers)
 
 
 @router.patch("/{item_id}/status", response_model=Item)
@@ -133,10 +278,7 @@ def update_item_status(
     domain_item = use_case.execute(item_id, status)
     if domain_item is None:
         raise HTTPException(status_code=404, detail="Item not found")
-    item_status = item_repo.get_status_by_id(domain_item.status_id)
-    if not item_status:
-        raise HTTPException(status_code=500, detail="Estado no encontrado")
-    return domain_item_to_schema(domain_item, item_status)
+    return FastJSONResponse(item_to_response(domain_item))
 
 
 @router.delete("/{item_id}", status_code=204)
@@ -159,7 +301,7 @@ def delete_item(
 
 @router.get("/statuses/", response_model=list[ItemStatus], tags=["statuses"])
 def get_statuses(
-    item_repo: ItemRepository = Depends(get_item_repository),
+    item_repo: ItemRepository = Depends(get_read_item_repository),
     current_user: User = Depends(get_current_active_user)
 ):
     """
@@ -0,0 +1,229 @@
+"""Rutas de items/tickets sobre el motor asíncrono (DB_MODE=async)."""
+from datetime import datetime
+from typing import Optional
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Request, Response
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.infrastructure.database.async_session import get_async_db
+from app.domain.entities.user import User
+from app.domain.entities.item_filters import ItemFilters
+from app.domain.repositories.async_item_repository import AsyncItemRepository
+from app.infrastructure.repositories.async_item_repository_impl import AsyncItemRepositoryImpl
+from app.infrastructure.cache.status_catalog import status_catalog
+from app.application.use_cases.items.create_item import AsyncCreateItemUseCase
+from app.application.use_cases.items.get_item import AsyncGetItemUseCase
+from app.application.use_cases.items.list_items import AsyncListItemsUseCase
+from app.application.use_cases.items.list_items_by_cursor import AsyncListItemsByCursorUseCase
+from app.application.use_cases.items.update_item import AsyncUpdateItemUseCase, ItemVersionConflict
+from app.application.use_cases.items.update_item_status import AsyncUpdateItemStatusUseCase
+from app.application.use_cases.items.delete_item import AsyncDeleteItemUseCase
+from app.application.use_cases.items.get_statuses import AsyncGetStatusesUseCase
+from app.application.use_cases.items.get_item_stats import AsyncGetItemStatsUseCase
+from app.interfaces.schemas import Item, ItemCreate, ItemStats, ItemStatus
+from app.interfaces.api.dependencies import get_current_active_user, require_role
+from app.interfaces.api.responses import FastJSONResponse
+from app.interfaces.api.conditional import (
+    expected_version,
+    item_etag,
+    list_etag,
+    not_modified,
+    not_modified_response,
+    validator_headers,
+)
+from app.interfaces.api.converters import domain_item_status_to_schema, domain_item_stats_to_schema
+from app.interfaces.api.routes.items import item_to_response, parse_item_sort
+
+router = APIRouter(prefix="/items", tags=["items"])
+
+
+def get_async_item_repository(db: AsyncSession = Depends(get_async_db)) -> AsyncItemRepository:
+    """Dependencia para obtener el repositorio asíncrono de items."""
+    return AsyncItemRepositoryImpl(db, status_catalog)
+
+
+@router.post("/", response_model=Item, status_code=201)
+async def create_item(
+    item: ItemCreate,
+    item_repo: AsyncItemRepository = Depends(get_async_item_repository),
+    current_user: User = Depends(get_current_active_user)
+):
+    """
+    Crea un nuevo ticket de soporte.
+    
+    **Requiere autenticación.**
+    """
+    use_case = AsyncCreateItemUseCase(item_repo)
+    domain_item = await use_case.execute(item)
+    return FastJSONResponse(item_to_response(domain_item), status_code=201)
+
+
+@router.get("/", response_model=list[Item])
+async def read_items(
+    request: Request,
+    response: Response,
+    skip: int = 0,
+    limit: int = 100,
+    cursor: Optional[str] = None,
+    status: Optional[str] = None,
+    reported_user: Optional[str] = None,
+    created_from: Optional[datetime] = None,
+    created_to: Optional[datetime] = None,
+    sort: Optional[str] = None,
+    item_repo: AsyncItemRepository = Depends(get_async_item_repository),
+    current_user: User = Depends(get_current_active_user)
+):
+    """
+    Lista todos los tickets con paginación (por desplazamiento o por cursor),
+    filtros y orden; mismos parámetros que la ruta síncrona.
+    
+    **Requiere autenticación.**
+    """
+    filters = ItemFilters(reported_user=reported_user, created_from=created_from, created_to=created_to)
+    if status is not None:
+        status_obj = await item_repo.get_status_by_name(status)
+        if status_obj is None:
+            raise HTTPException(status_code=400, detail=f"Estado inválido: {status}")
+        filters.status_id = status_obj.id
+    item_sort = parse_item_sort(sort)
+    if cursor is not None:
+        use_case = AsyncListItemsByCursorUseCase(item_repo)
+        try:
+            domain_items, next_cursor = await use_case.execute(cursor, limit, filters, item_sort if sort else None)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        if next_cursor is not None:
+            response.headers["X-Next-Cursor"] = next_cursor
+    else:
+        use_case = AsyncListItemsUseCase(item_repo)
+        domain_items = await use_case.execute(skip, limit, filters, item_sort)
+    
+    etag = list_etag(domain_items)
+    if not_modified(request, etag):
+        return not_modified_response(etag, **response.headers)
+    response.headers.update(validator_headers(etag))
+    return FastJSONResponse([item_to_response(domain_item) for domain_item in domain_items], headers=response.headers)
+
+
+@router.get("/stats", response_model=ItemStats)
+async def get_item_stats(
+    reporter_limit: int = Query(100, ge=1, le=1000),
+    item_repo: AsyncItemRepository = Depends(get_async_item_repository),
+    current_user: User = Depends(get_current_active_user)
+):
+    """
+    Número de tickets por estado y por usuario reportante (desde contadores).
+    
+    **Requiere autenticación.**
+    """
+    domain_stats = await AsyncGetItemStatsUseCase(item_repo).execute(reporter_limit)
+    statuses = await AsyncGetStatusesUseCase(item_repo).execute()
+    return domain_item_stats_to_schema(domain_stats, statuses)
+
+
+@router.get("/{item_id}", response_model=Item)
+async def read_item(
+    item_id: int,
+    request: Request,
+    response: Response,
+    item_repo: AsyncItemRepository = Depends(get_async_item_repository),
+    current_user: User = Depends(get_current_active_user)
+):
+    """
+    Obtiene un ticket específico por ID (con ETag/Last-Modified y 304).
+    
+    **Requiere autenticación.**
+    """
+    use_case = AsyncGetItemUseCase(item_repo)
+    domain_item = await use_case.execute(item_id)
+    if domain_item is None:
+        raise HTTPException(status_code=404, detail="Item not found")
+    etag, modified = item_etag(domain_item), domain_item.updated_at
+    if not_modified(request, etag, modified):
+        return not_modified_response(etag, modified)
+    response.headers.update(validator_headers(etag, modified))
+    return FastJSONResponse(item_to_response(domain_item), headers=response.headers)
+
+
+@router.put("/{item_id}", response_model=Item)
+async def update_item(
+    item_id: int,
+    item: ItemCreate,
+    response: Response,
+    if_match: Optional[str] = Header(None),
+    item_repo: AsyncItemRepository = Depends(get_async_item_repository),
+    current_user: User = Depends(get_current_active_user)
+):
+    """
+    Actualiza un ticket existente; con `If-Match` responde 412 si cambió.
+    
+    **Requiere autenticación.**
+    """
+    use_case = AsyncUpdateItemUseCase(item_repo)
+    try:
+        domain_item = await use_case.execute(item_id, item, expected_version(if_match, item_id))
+    except ItemVersionConflict as e:
+        raise HTTPException(status_code=412, detail=str(e))
+    if domain_item is None:
+        raise HTTPException(status_code=404, detail="Item not found")
+    response.headers.update(validator_headers(item_etag(domain_item), domain_item.updated_at))
+    return FastJSONResponse(item_to_response(domain_item), headers=response.headers)
+
+
+@router.patch("/{item_id}/status", response_model=Item)
+async def update_item_status(
+    item_id: int,
+    status: str,
+    item_repo: AsyncItemRepository = Depends(get_async_item_repository),
+    current_user: User = Depends(require_role(["admin", "agent"]))
+):
+    """
+    Cambia el estado de un ticket.
+    
+    **Requiere rol: admin o agent.**
+    
+    Estados válidos: IN_PROGRESS, RESOLVED
+    """
+    if status not in ["IN_PROGRESS", "RESOLVED"]:
+        raise HTTPException(
+            status_code=400,
+            detail="Estado inválido. Debe ser 'IN_PROGRESS' o 'RESOLVED'"
+        )
+    
+    use_case = AsyncUpdateItemStatusUseCase(item_repo)
+    domain_item = await use_case.execute(item_id, status)
+    if domain_item is None:
+        raise HTTPException(status_code=404, detail="Item not found")
+    return FastJSONResponse(item_to_response(domain_item))
+
+
+@router.delete("/{item_id}", status_code=204)
+async def delete_item(
+    item_id: int,
+    item_repo: AsyncItemRepository = Depends(get_async_item_repository),
+    current_user: User = Depends(require_role(["admin"]))
+):
+    """
+    Elimina un ticket.
+    
+    **Requiere rol: admin.**
+    """
+    use_case = AsyncDeleteItemUseCase(item_repo)
+    ok = await use_case.execute(item_id)
+    if not ok:
+        raise HTTPException(status_code=404, detail="Item not found")
+    return
+
+
+@router.get("/statuses/", response_model=list[ItemStatus], tags=["statuses"])
+async def get_statuses(
+    item_repo: AsyncItemRepository = Depends(get_async_item_repository),
+    current_user: User = Depends(get_current_active_user)
+):
+    """
+    Lista todos los estados disponibles para tickets.
+    
+    **Requiere autenticación.**
+    """
+    use_case = AsyncGetStatusesUseCase(item_repo)
+    domain_statuses = await use_case.execute()
+    return [domain_item_status_to_schema(status) for status in domain_statuses]
@@ -0,0 +1,150 @@
+"""Rutas de operaciones masivas sobre items/tickets."""
+import json
+import os
+from typing import AsyncIterator, List, Tuple
+
+from fastapi import APIRouter, Depends, HTTPException, Request
+from fastapi.concurrency import run_in_threadpool
+from pydantic import ValidationError
+
+from app.domain.entities.user import User
+from app.domain.repositories.item_repository import ItemRepository
+from app.application.use_cases.items.bulk_create_items import BulkCreateItemsUseCase
+from app.application.use_cases.items.bulk_update_item_status import BulkUpdateItemStatusUseCase
+from app.interfaces.schemas import (
+    ItemCreate,
+    BulkItemResult,
+    BulkItemsReport,
+    BulkStatusReport,
+    BulkStatusUpdate,
+)
+from app.interfaces.api.dependencies import get_current_active_user, require_role
+from app.interfaces.api.routes.items import build_item_filters, get_item_repository
+
+# Filas por transacción en la ingesta masiva
+ITEMS_BULK_CHUNK_SIZE = int(os.getenv("ITEMS_BULK_CHUNK_SIZE", "1000"))
+
+router = APIRouter(prefix="/items", tags=["items"])
+
+
+def _validation_message(error: ValidationError) -> str:
+    """Resume los errores de validación de una fila."""
+    return "; ".join(
+        f"{'.'.join(str(part) for part in err['loc']) or 'item'}: {err['msg']}"
+        for err in error.errors()
+    )
+
+
+async def _ndjson_rows(request: Request) -> AsyncIterator[bytes]:
+    """Itera las líneas no vacías de un cuerpo NDJSON según van llegando."""
+    buffer = b""
+    async for chunk in request.stream():
+        buffer += chunk
+        *lines, buffer = buffer.split(b"\n")
+        for line in lines:
+            if line.strip():
+                yield line
+    if buffer.strip():
+        yield buffer
+
+
+@router.post("/bulk", response_model=BulkItemsReport)
+async def bulk_create_items(
+    request: Request,
+    item_repo: ItemRepository = Depends(get_item_repository),
+    current_user: User = Depends(get_current_active_user)
+):
+    """
+    Crea tickets en lote.
+    
+    Acepta un array JSON (`application/json`) o un flujo NDJSON
+    (`application/x-ndjson`, un ticket por línea) que se procesa según
+    llega. Las filas válidas se insertan en transacciones de
+    `ITEMS_BULK_CHUNK_SIZE` filas; si un lote falla solo se marcan como
+    erróneas sus filas. Devuelve el resultado de cada fila por índice.
+    
+    **Requiere autenticación.**
+    """
+    use_case = BulkCreateItemsUseCase(item_repo)
+    results: List[BulkItemResult] = []
+    pending: List[Tuple[int, ItemCreate]] = []
+
+    async def flush() -> None:
+        if not pending:
+            return
+        batch = list(pending)
+        pending.clear()
+        try:
+            ids = await run_in_threadpool(use_case.execute, [item for _, item in batch])
+        except ValueError as e:
+            results.extend(BulkItemResult(index=index, ok=False, error=str(e)) for index, _ in batch)
+            return
+        results.extend(
+            BulkItemResult(index=index, ok=True, id=item_id)
+            for (index, _), item_id in zip(batch, ids)
+        )
+
+    async def add(index: int, raw) -> None:
+        try:
+            pending.append((index, ItemCreate.model_validate(raw)))
+        except ValidationError as e:
+            results.append(BulkItemResult(index=index, ok=False, error=_validation_message(e)))
+            return
+        if len(pending) >= ITEMS_BULK_CHUNK_SIZE:
+            await flush()
+
+    content_type = request.headers.get("content-type", "")
+    if "ndjson" in content_type or "jsonl" in content_type:
+        index = 0
+        async for line in _ndjson_rows(request):
+            try:
+                raw = json.loads(line)
+            except ValueError:
+                results.append(BulkItemResult(index=index, ok=False, error="JSON inválido"))
+            else:
+                await add(index, raw)
+            index += 1
+    else:
+        try:
+            payload = await request.json()
+        except ValueError:
+            raise HTTPException(status_code=400, detail="El cuerpo debe ser un array JSON o NDJSON")
+        if not isinstance(payload, list):
+            raise HTTPException(status_code=400, detail="El cuerpo debe ser un array JSON o NDJSON")
+        for index, raw in enumerate(payload):
+            await add(index, raw)
+    await flush()
+
+    results.sort(key=lambda result: result.index)
+    created = sum(1 for result in results if result.ok)
+    return BulkItemsReport(created=created, failed=len(results) - created, results=results)
+
+
+@router.patch("/bulk/status", response_model=BulkStatusReport)
+def bulk_update_item_status(
+    payload: BulkStatusUpdate,
+    item_repo: ItemRepository = Depends(get_item_repository),
+    current_user: User = Depends(require_role(["admin", "agent"]))
+):
+    """
+    Cambia el estado de muchos tickets en un único `UPDATE`.
+    
+    - **status**: estado destino (IN_PROGRESS, RESOLVED)
+    - **ids**: lista de IDs (máx. 10000); los inexistentes se devuelven en `not_found`
+    - **filter**: alternativa a `ids`; mismos criterios que `GET /items/`
+      (`status`, `reported_user`, `created_from`, `created_to`), al menos uno
+    
+    **Requiere rol: admin o agent.**
+    """
+    filters = None
+    if payload.filter is not None:
+        criteria = payload.filter
+        filters = build_item_filters(
+            item_repo, criteria.status, criteria.reported_user, criteria.created_from, criteria.created_to
+        )
+    use_case = BulkUpdateItemStatusUseCase(item_repo)
+    try:
+        updated, not_found = use_case.execute(payload.status, payload.ids, filters)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return BulkStatusReport(status=payload.status, updated=updated, not_found=not_found)
@@ -0,0 +1,115 @@
+"""Rutas de exportación de items/tickets."""
+import csv
+import io
+import json
+import zlib
+from datetime import datetime
+from typing import Any, Dict, Iterable, Iterator, Literal, Optional
+
+from fastapi import APIRouter, Depends
+from fastapi.responses import StreamingResponse
+
+from app.domain.entities.user import User
+from app.domain.repositories.item_repository import ItemRepository
+from app.application.use_cases.items.export_items import ExportItemsUseCase
+from app.interfaces.api.dependencies import get_current_active_user
+from app.interfaces.api.routes.items import build_item_filters, get_item_repository
+
+router = APIRouter(prefix="/items", tags=["items"])
+
+EXPORT_FIELDS = (
+    "id",
+    "name",
+    "description",
+    "ticket_url",
+    "publication_url",
+    "reported_user",
+    "creation_date",
+    "status_id",
+    "status",
+)
+
+# Bytes acumulados antes de enviar un fragmento de la respuesta
+_FLUSH_BYTES = 64 * 1024
+
+_MEDIA_TYPES = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv; charset=utf-8",
+}
+
+
+def _json_default(value: Any) -> str:
+    if isinstance(value, datetime):
+        return value.isoformat()
+    raise TypeError(f"Tipo no serializable: {type(value).__name__}")
+
+
+def _ndjson_lines(rows: Iterable[Dict[str, Any]]) -> Iterator[str]:
+    for row in rows:
+        yield json.dumps(row, default=_json_default, ensure_ascii=False) + "\n"
+
+
+def _csv_lines(rows: Iterable[Dict[str, Any]]) -> Iterator[str]:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(EXPORT_FIELDS)
+    for row in rows:
+        writer.writerow([
+            row[field].isoformat() if isinstance(row[field], datetime) else row[field]
+            for field in EXPORT_FIELDS
+        ])
+        yield buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
+    yield buffer.getvalue()
+
+
+def _chunked(lines: Iterable[str], compress: bool) -> Iterator[bytes]:
+    """Agrupa las líneas en fragmentos de ~64 KiB, opcionalmente comprimidos con gzip."""
+    compressor = zlib.compressobj(wbits=31) if compress else None
+    pending = []
+    size = 0
+    for line in lines:
+        data = line.encode("utf-8")
+        pending.append(data)
+        size += len(data)
+        if size >= _FLUSH_BYTES:
+            chunk = b"".join(pending)
+            pending, size = [], 0
+            yield compressor.compress(chunk) if compressor else chunk
+    chunk = b"".join(pending)
+    if compressor:
+        yield compressor.compress(chunk) + compressor.flush()
+    elif chunk:
+        yield chunk
+
+
+@router.get("/export")
+def export_items(
+    format: Literal["ndjson", "csv"] = "ndjson",
+    status: Optional[str] = None,
+    created_from: Optional[datetime] = None,
+    created_to: Optional[datetime] = None,
+    gzip: bool = False,
+    item_repo: ItemRepository = Depends(get_item_repository),
+    current_user: User = Depends(get_current_active_user)
+):
+    """
+    Exporta tickets en streaming como NDJSON o CSV.
+    
+    - **status**: nombre del estado (IN_PROGRESS, RESOLVED)
+    - **created_from / created_to**: rango de fecha de creación [desde, hasta)
+    - **gzip**: comprime la respuesta (`Content-Encoding: gzip`)
+    
+    Las filas se leen con un cursor de servidor y se escriben según llegan,
+    por lo que la memoria no crece con el número de tickets.
+    
+    **Requiere autenticación.**
+    """
+    filters = build_item_filters(item_repo, status, created_from=created_from, created_to=created_to)
+    rows = ExportItemsUseCase(item_repo).execute(filters)
+    lines = _ndjson_lines(rows) if format == "ndjson" else _csv_lines(rows)
+    headers = {"Content-Disposition": f'attachment; filename="items.{format}"'}
+    if gzip:
+        headers["Content-Encoding"] = "gzip"
+    return StreamingResponse(_chunked(lines, gzip), media_type=_MEDIA_TYPES[format], headers=headers)
@@ -0,0 +1,41 @@
+"""Rutas de búsqueda de items/tickets."""
+from typing import Optional
+from fastapi import APIRouter, Depends, HTTPException, Query
+
+from app.domain.entities.user import User
+from app.domain.repositories.item_repository import ItemRepository
+from app.application.use_cases.items.search_items import SearchItemsUseCase
+from app.interfaces.schemas import Item
+from app.interfaces.api.dependencies import get_current_active_user
+from app.interfaces.api.responses import FastJSONResponse
+from app.interfaces.api.routes.items import build_item_filters, get_item_repository, item_to_response
+
+router = APIRouter(prefix="/items", tags=["items"])
+
+
+@router.get("/search", response_model=list[Item])
+def search_items(
+    q: str = Query(..., min_length=1, max_length=256),
+    status: Optional[str] = None,
+    skip: int = 0,
+    limit: int = 100,
+    item_repo: ItemRepository = Depends(get_item_repository),
+    current_user: User = Depends(get_current_active_user)
+):
+    """
+    Busca tickets por texto en nombre y descripción.
+    
+    - **q**: texto a buscar (todas las palabras deben aparecer)
+    - **status**: filtra por nombre de estado (opcional)
+    
+    Resultados ordenados por relevancia.
+    
+    **Requiere autenticación.**
+    """
+    filters = build_item_filters(item_repo, status)
+    use_case = SearchItemsUseCase(item_repo)
+    try:
+        domain_items = use_case.execute(q, filters, skip, limit)
+    except ValueError as e:
+        raise HTTPException(status_code=501, detail=str(e))
+    return FastJSONResponse([item_to_response(domain_item) for domain_item in domain_items])
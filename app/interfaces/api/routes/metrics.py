@@ -0,0 +1,87 @@
+"""Rutas de métricas en formato Prometheus."""
+from typing import Any, Dict, List, Tuple
+
+from fastapi import APIRouter
+from fastapi.responses import PlainTextResponse
+
+from app.infrastructure.cache.principal_cache import principal_cache
+from app.infrastructure.database.async_session import get_async_engine_if_created
+from app.infrastructure.database.pool_metrics import pool_status
+from app.infrastructure.database.session import get_engine, get_replica_engines
+from app.infrastructure.monitoring.metrics import Snapshot, metrics
+from app.infrastructure.security.hashing_pool import hashing_pool
+
+router = APIRouter(tags=["monitoring"])
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# Estado de QueuePool que se publica como gauge: clave de pool_status -> métrica
+_POOL_GAUGES = {
+    "size": ("db_pool_size", "Conexiones permanentes del pool"),
+    "checked_out": ("db_pool_checked_out", "Conexiones del pool en uso"),
+    "checked_in": ("db_pool_checked_in", "Conexiones del pool libres"),
+    "overflow": ("db_pool_overflow", "Conexiones abiertas por encima del tamaño del pool"),
+}
+
+
+def _metric(kind: str, help: str, labels: Tuple[str, ...], samples: List[list]) -> Dict[str, Any]:
+    return {"type": kind, "help": help, "labels": list(labels), "samples": samples}
+
+
+def _db_pool_metrics() -> Snapshot:
+    """Estado de los pools de conexiones de cada motor."""
+    engines = [("primary", get_engine())]
+    engines.extend((f"replica-{index}", replica) for index, replica in enumerate(get_replica_engines()))
+    async_engine = get_async_engine_if_created()
+    if async_engine is not None:
+        engines.append(("async", async_engine.sync_engine))
+    statuses = [pool_status(name, pool_engine) for name, pool_engine in engines]
+
+    snapshot: Snapshot = {}
+    for key, (name, help) in _POOL_GAUGES.items():
+        samples = [[[status["engine"]], status[key]] for status in statuses if key in status]
+        snapshot[name] = _metric("gauge", help, ("engine",), samples)
+    snapshot["db_pool_timeouts_total"] = _metric(
+        "counter", "Esperas de conexión que agotaron DB_POOL_TIMEOUT", ("engine",),
+        [[[status["engine"]], status["timeouts"]] for status in statuses if "timeouts" in status],
+    )
+    snapshot["db_pool_checkout_wait_seconds"] = _metric(
+        "histogram", "Espera hasta obtener una conexión del pool", ("engine",),
+        [[[status["engine"]], status["checkout_wait_seconds"]] for status in statuses if "checkout_wait_seconds" in status],
+    )
+    return snapshot
+
+
+def _auth_metrics() -> Snapshot:
+    """Caché de principales y pool de hashing de contraseñas."""
+    cache = principal_cache.stats()
+    hashing = hashing_pool.stats()
+    return {
+        "auth_principal_cache_hits_total": _metric(
+            "counter", "Usuarios autenticados servidos desde la caché de principales", (), [[[], cache["hits"]]]
+        ),
+        "auth_principal_cache_misses_total": _metric(
+            "counter", "Verificaciones de usuario que consultaron la base de datos", (), [[[], cache["misses"]]]
+        ),
+        "password_hash_in_flight": _metric(
+            "gauge", "Operaciones bcrypt en curso o en cola", (), [[[], hashing["in_flight"]]]
+        ),
+        "password_hash_rejected_total": _metric(
+            "counter", "Operaciones bcrypt rechazadas por pool lleno", (), [[[], hashing["rejected"]]]
+        ),
+    }
+
+
+metrics.register_collector(_db_pool_metrics)
+metrics.register_collector(_auth_metrics)
+
+
+@router.get("/metrics", response_class=PlainTextResponse)
+def read_metrics():
+    """
+    Métricas en formato de texto de Prometheus (público, como `/health`;
+    restringir el acceso en el proxy o la red).
+
+    Con `METRICS_MULTIPROCESS_DIR` suma las métricas de todos los workers.
+    """
+    return PlainTextResponse(metrics.render(), media_type=PROMETHEUS_CONTENT_TYPE)
@@ -0,0 +1,56 @@
+"""Cabecera ``Server-Timing`` con el tiempo de base de datos de cada petición."""
+import logging
+import os
+import time
+
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.infrastructure.monitoring.query_stats import QueryStats, track_queries
+
+# Añade Server-Timing a las respuestas (expone a los clientes el tiempo en BD)
+SERVER_TIMING_ENABLED = os.getenv("SERVER_TIMING_ENABLED", "true").lower() in ("1", "true", "yes")
+
+logger = logging.getLogger(__name__)
+
+
+def server_timing_value(stats: QueryStats, total_seconds: float) -> str:
+    """``db`` (sentencias y tiempo en la base de datos) y ``app`` (petición completa), en ms."""
+    return (
+        f'db;dur={stats.total_seconds * 1000:.2f};desc="{stats.count} SQL", '
+        f"app;dur={total_seconds * 1000:.2f}"
+    )
+
+
+class ServerTimingMiddleware:
+    """
+    Mide las sentencias SQL de cada petición y las anuncia en ``Server-Timing``.
+
+    La cabecera se escribe al empezar la respuesta: en respuestas en
+    streaming no incluye las sentencias ejecutadas mientras se envía el
+    cuerpo, que sí se cuentan en el resumen de log (nivel DEBUG).
+    """
+
+    def __init__(self, app: ASGIApp, enabled: bool = SERVER_TIMING_ENABLED):
+        self.app = app
+        self.enabled = enabled
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        started = time.perf_counter()
+        with track_queries() as stats:
+            async def send_with_timing(message: Message) -> None:
+                if message["type"] == "http.response.start" and self.enabled:
+                    headers = MutableHeaders(scope=message)
+                    headers.append("Server-Timing", server_timing_value(stats, time.perf_counter() - started))
+                await send(message)
+
+            await self.app(scope, receive, send_with_timing)
+        if stats.count and logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "%s %s: %d sentencias SQL en %.1f ms; más lentas: %s",
+                scope["method"], scope["path"], stats.count, stats.total_seconds * 1000,
+                "; ".join(f"{seconds * 1000:.1f} ms {statement}" for seconds, statement in stats.slowest_first()),
+            )
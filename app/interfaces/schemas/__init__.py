@@ -1,6 +1,20 @@
 """Schemas Pydantic (DTOs)."""
 from .user_schemas import User, UserCreate, UserBase, Token, TokenData
-from .item_schemas import Item, ItemCreate, ItemBase, ItemStatus, ItemStatusBase
+from .item_schemas import (
+    Item,
+    ItemCreate,
+    ItemBase,
+    ItemStatus,
+    ItemStatusBase,
+    BulkItemResult,
+    BulkItemsReport,
+    StatusCount,
+    ReporterCount,
+    ItemStats,
+    BulkStatusFilter,
+    BulkStatusUpdate,
+    BulkStatusReport,
+)
 
 __all__ = [
     "User",
@@ -13,4 +27,12 @@ __all__ = [
     "ItemBase",
     "ItemStatus",
     "ItemStatusBase",
+    "BulkItemResult",
+    "BulkItemsReport",
+    "StatusCount",
+    "ReporterCount",
+    "ItemStats",
+    "BulkStatusFilter",
+    "BulkStatusUpdate",
+    "BulkStatusReport",
 ]
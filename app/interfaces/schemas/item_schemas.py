@@ -1,6 +1,6 @@
 """Schemas de items/tickets."""
-from pydantic import BaseModel
-from typing import Optional
+from pydantic import BaseModel, Field, model_validator
+from typing import List, Optional
 from datetime import datetime
 
 
@@ -24,15 +24,80 @@ class ItemBase(BaseModel):
 
 
 class ItemCreate(ItemBase):
-    pass
+    # Longitudes de las columnas de items: la BD rechazaría el valor (en un
+    # COPY de la carga masiva, el lote entero)
+    name: str = Field(max_length=128)
+    ticket_url: Optional[str] = Field(default=None, max_length=255)
+    publication_url: Optional[str] = Field(default=None, max_length=255)
+    reported_user: Optional[str] = Field(default=None, max_length=128)
 
 
 class Item(ItemBase):
     id: int
     creation_date: datetime
     status_id: int
+    updated_at: Optional[datetime] = None
+    version: int = 1
     status_rel: ItemStatus
 
     class Config:
         from_attributes = True
 
+
+
+class BulkItemResult(BaseModel):
+    index: int
+    ok: bool
+    id: Optional[int] = None
+    error: Optional[str] = None
+
+
+class BulkItemsReport(BaseModel):
+    created: int
+    failed: int
+    results: List[BulkItemResult]
+
+
+class StatusCount(BaseModel):
+    status_id: int
+    status: str
+    count: int
+
+
+class ReporterCount(BaseModel):
+    reported_user: Optional[str] = None
+    count: int
+
+
+class ItemStats(BaseModel):
+    total: int
+    by_status: List[StatusCount]
+    by_reporter: List[ReporterCount]
+
+
+class BulkStatusFilter(BaseModel):
+    status: Optional[str] = None
+    reported_user: Optional[str] = None
+    created_from: Optional[datetime] = None
+    created_to: Optional[datetime] = None
+
+
+class BulkStatusUpdate(BaseModel):
+    status: str
+    ids: Optional[List[int]] = Field(default=None, min_length=1, max_length=10000)
+    filter: Optional[BulkStatusFilter] = None
+
+    @model_validator(mode="after")
+    def validate_target(self) -> "BulkStatusUpdate":
+        """Exige exactamente uno de ``ids`` o ``filter``, y un filtro no vacío."""
+        if (self.ids is None) == (self.filter is None):
+            raise ValueError("Indica 'ids' o 'filter', pero no ambos")
+        if self.filter is not None and not self.filter.model_dump(exclude_none=True):
+            raise ValueError("El filtro debe tener al menos un criterio")
+        return self
+
+
+class BulkStatusReport(BaseModel):
+    status: str
+    updated: List[int]
+    not_found: List[int]
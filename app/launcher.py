@@ -0,0 +1,149 @@
+"""
+Arranque de producción con varios workers de uvicorn.
+
+Uso: ``python -m app.launcher [--workers N] [--host HOST] [--port PORT]``
+
+El proceso padre importa la aplicación antes de abrir el puerto (un error
+de código o de configuración detiene el arranque sin lanzar ningún worker),
+prepara la base de datos una sola vez si ``DB_PREPARE_ON_STARTUP`` y después
+lanza ``N`` workers que comparten el socket. Cada worker dimensiona su pool
+para que entre todos no superen ``DB_CONNECTION_BUDGET`` conexiones.
+
+Señales al proceso padre:
+
+- ``SIGHUP``: reinicio escalonado. Cada worker se sustituye por uno nuevo
+  que debe completar su arranque (``lifespan`` y precalentamiento) antes de
+  que se pare el antiguo, que termina sus peticiones en curso.
+- ``SIGTERM``/``SIGINT``: parada ordenada de todos los workers.
+
+Para cambiar el número de workers hay que reiniciar el lanzador: los
+workers añadidos con ``SIGTTIN`` no recalculan el presupuesto de conexiones.
+"""
+import argparse
+import glob
+import logging
+import os
+import tempfile
+from importlib import import_module
+from typing import List, Optional
+
+import uvicorn
+from dotenv import load_dotenv
+from uvicorn.supervisors import Multiprocess
+
+# Antes de importar cualquier módulo que lea la configuración del entorno
+# (los workers cargan .env por su cuenta al importar app.main)
+load_dotenv()
+
+from app.infrastructure.database.readiness import DB_PREPARE_ON_STARTUP, prepare_database  # noqa: E402
+from app.infrastructure.database.session import DB_CONNECTION_BUDGET, get_engine, worker_pool_sizes  # noqa: E402
+
+logger = logging.getLogger(__name__)
+
+# Segundos que un worker tiene para terminar sus peticiones al pararse
+WORKER_GRACEFUL_TIMEOUT = int(os.getenv("WORKER_GRACEFUL_TIMEOUT", "30"))
+# Segundos que un worker nuevo tiene para arrancar y, en marcha, para
+# responder al proceso padre antes de darse por colgado
+WORKER_READY_TIMEOUT = int(os.getenv("WORKER_READY_TIMEOUT", "30"))
+
+CGROUP_CPU_MAX = "/sys/fs/cgroup/cpu.max"
+
+APP_MODULE = "app.main"
+
+
+def available_cpus(cpu_max_path: str = CGROUP_CPU_MAX) -> int:
+    """
+    CPUs que puede usar el proceso: las de su afinidad, limitadas por la
+    cuota de CPU del contenedor (cgroup v2) si la hay.
+    """
+    try:
+        cpus = len(os.sched_getaffinity(0))
+    except AttributeError:
+        cpus = os.cpu_count() or 1
+    try:
+        with open(cpu_max_path) as handle:
+            quota, period = handle.read().split()[:2]
+    except (OSError, ValueError):
+        return cpus
+    if quota == "max":
+        return cpus
+    return max(min(cpus, int(quota) // int(period)), 1)
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Servidor de producción con varios workers")
+    parser.add_argument(
+        "--workers", type=int, default=int(os.getenv("WEB_CONCURRENCY") or "0") or available_cpus(),
+        help="Número de workers (por defecto WEB_CONCURRENCY o las CPUs disponibles)",
+    )
+    parser.add_argument("--host", default=os.getenv("HOST", "0.0.0.0"))
+    parser.add_argument("--port", type=int, default=int(os.getenv("PORT", "8000")))
+    return parser.parse_args(argv)
+
+
+def prepare_metrics_dir() -> str:
+    """
+    Directorio compartido de métricas de los workers: ``METRICS_MULTIPROCESS_DIR``
+    (se vacía de volcados anteriores) o uno temporal nuevo.
+    """
+    directory = os.getenv("METRICS_MULTIPROCESS_DIR") or tempfile.mkdtemp(prefix="ticketing-metrics-")
+    os.makedirs(directory, exist_ok=True)
+    for stale in glob.glob(os.path.join(directory, "*.json")):
+        os.remove(stale)
+    return directory
+
+
+def preload_app() -> None:
+    """
+    Importa la aplicación en el proceso padre para que un error de código o
+    de configuración detenga el arranque antes de abrir el puerto.
+
+    Raises:
+        SystemExit: Si la aplicación no se puede importar
+    """
+    try:
+        import_module(APP_MODULE)
+    except Exception as e:
+        logger.exception("No se pudo importar la aplicación")
+        raise SystemExit(f"No se pudo importar la aplicación: {e}") from e
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """Prepara la base de datos y sirve la aplicación con varios workers."""
+    args = parse_args(argv)
+    logging.basicConfig(level=logging.INFO)
+    if args.workers < 1:
+        raise SystemExit("--workers debe ser al menos 1")
+
+    # ValueError si el presupuesto no alcanza: mejor fallar aquí que en cada worker
+    pool_size, max_overflow = worker_pool_sizes(args.workers)
+    logger.info(
+        "%d workers; pool por worker: %d + %d de overflow (presupuesto: %s)",
+        args.workers, pool_size, max_overflow, DB_CONNECTION_BUDGET or "sin límite",
+    )
+
+    if DB_PREPARE_ON_STARTUP:
+        engine = get_engine()
+        prepare_database(engine)
+        engine.dispose()
+
+    # Los workers son procesos nuevos que leen su configuración del entorno
+    os.environ["WEB_CONCURRENCY"] = str(args.workers)
+    os.environ["DB_PREPARE_ON_STARTUP"] = "false"
+    os.environ["METRICS_MULTIPROCESS_DIR"] = prepare_metrics_dir()
+    # Con la misma configuración que verán los workers
+    preload_app()
+
+    config = uvicorn.Config(
+        f"{APP_MODULE}:app",
+        host=args.host,
+        port=args.port,
+        workers=args.workers,
+        timeout_graceful_shutdown=WORKER_GRACEFUL_TIMEOUT,
+        timeout_worker_healthcheck=WORKER_READY_TIMEOUT,
+    )
+    Multiprocess(config, sockets=[config.bind_socket()]).run()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,4 +1,18 @@
-"""Punto de entrada principal de la aplicación."""
-from .interfaces.api.main import app
+"""
+Punto de entrada ASGI de la aplicación (``app.main:app``).
+
+Carga ``.env`` antes de importar cualquier módulo que lea la configuración
+del entorno; el paquete ``app`` no lo hace para que importar un submódulo
+(los procesos del pool de hashing, Alembic, los tests) no arrastre la
+aplicación entera.
+"""
+# Lo primero: inicia el reloj del informe de arranque
+from .infrastructure.monitoring.startup import startup_report
+
+from dotenv import load_dotenv
+
+with startup_report.phase("import"):
+    load_dotenv()
+    from .interfaces.api.main import app
 
 __all__ = ["app"]
@@ -0,0 +1 @@
+"""Micro-benchmarks de rutas calientes de la API."""
@@ -0,0 +1,278 @@
+"""
+Latencia p50/p99 y número de sentencias SQL de las rutas de items y auth.
+
+Siembra usuarios y tickets en una base de datos local, ejecuta cada ruta
+de ``routes/items.py`` y ``routes/auth.py`` con la aplicación completa
+(``TestClient``, autenticación real) y compara con la línea base guardada
+en ``benchmarks/baselines/endpoints.json``.
+
+Uso::
+
+    python -m benchmarks.bench_endpoints [--users 50] [--items 5000] [--requests 200]
+    python -m benchmarks.bench_endpoints --check              # falla si hay regresiones
+    python -m benchmarks.bench_endpoints --update-baseline    # guarda la nueva línea base
+
+Con ``--check`` termina con código 1 si una ruta ejecuta más sentencias
+que en la línea base o si su p50/p99 empeora más de ``--latency-tolerance``
+(y más de ``--latency-floor-ms``, para no fallar por ruido en rutas de
+décimas de milisegundo). Las latencias solo son comparables en la misma
+máquina; el número de sentencias lo es siempre para la misma configuración.
+
+La configuración se fija antes de importar la aplicación: caché de items
+desactivada y verificación de usuarios estricta, para que el número de
+sentencias refleje la ruta y no el estado de las cachés, y bcrypt con
+coste 4 para que login y registro no midan solo el hash. Los límites de
+peticiones se desactivan: el banco repite login y listados desde un único
+cliente. Cada variable
+puede sobrescribirse en el entorno.
+"""
+import argparse
+import json
+import math
+import os
+import sys
+import tempfile
+import time
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+BASELINE_PATH = Path(__file__).parent / "baselines" / "endpoints.json"
+
+BENCHMARK_ENV = {
+    "ITEM_CACHE_BACKEND": "none",
+    "AUTH_VERIFICATION_MODE": "strict",
+    "BCRYPT_ROUNDS": "4",
+    "DB_MODE": "sync",
+    "RATE_LIMIT_ENABLED": "false",
+}
+
+PASSWORD = "benchmark-password"
+
+
+@dataclass
+class Case:
+    """Petición medida: ``request(i)`` devuelve método, ruta y argumentos de la iteración ``i``."""
+    name: str
+    request: Callable[[int], Tuple[str, str, Dict[str, Any]]]
+    expected_status: int = 200
+
+
+@dataclass
+class Measurement:
+    name: str
+    p50_ms: float
+    p99_ms: float
+    queries: int
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {"p50_ms": round(self.p50_ms, 3), "p99_ms": round(self.p99_ms, 3), "queries": self.queries}
+
+
+def percentile(samples: List[float], fraction: float) -> float:
+    """Percentil por rango más cercano."""
+    ordered = sorted(samples)
+    return ordered[max(math.ceil(fraction * len(ordered)) - 1, 0)]
+
+
+def seed(engine, users: int, items: int) -> Dict[str, Any]:
+    """
+    Crea el esquema y siembra ``users`` usuarios (el primero admin) y
+    ``items`` tickets repartidos entre estados, reportantes y fechas.
+
+    Raises:
+        SystemExit: Si la base de datos ya tiene tickets
+    """
+    from sqlalchemy import func, insert, select
+
+    from app.infrastructure.database.base import Base
+    from app.infrastructure.database.models import Item, ItemStatus, User
+    from app.infrastructure.repositories.item_counters import rebuild_statements
+    from app.infrastructure.security.password_handler import get_pwd_context
+
+    Base.metadata.create_all(bind=engine)
+    with engine.begin() as conn:
+        if conn.execute(select(func.count()).select_from(Item)).scalar_one():
+            sys.exit("La base de datos de benchmark debe estar vacía")
+        if not conn.execute(select(func.count()).select_from(ItemStatus)).scalar_one():
+            conn.execute(insert(ItemStatus), [{"status": "IN_PROGRESS"}, {"status": "RESOLVED"}])
+        hashed = get_pwd_context().hash(PASSWORD)
+        emails = [f"user{index}@bench.example.com" for index in range(users)]
+        conn.execute(insert(User), [
+            {"email": email, "hashed_password": hashed, "role": "admin" if index == 0 else "user", "is_active": True}
+            for index, email in enumerate(emails)
+        ])
+        start = datetime(2026, 1, 1)
+        rows = [
+            {
+                "name": f"Ticket {index}",
+                "description": f"Incidencia de prueba número {index}",
+                "reported_user": emails[index % users],
+                "status_id": 1 + index % 2,
+                "creation_date": start + timedelta(minutes=index),
+                "updated_at": start + timedelta(minutes=index),
+                "version": 1,
+            }
+            for index in range(items)
+        ]
+        for offset in range(0, len(rows), 1000):
+            conn.execute(insert(Item), rows[offset:offset + 1000])
+        for statement in rebuild_statements():
+            conn.execute(statement)
+        item_ids = conn.execute(select(Item.id).order_by(Item.id)).scalars().all()
+    return {"admin": emails[0], "user": emails[-1], "item_ids": item_ids}
+
+
+def build_cases(seeded: Dict[str, Any], headers: Dict[str, str], requests: int) -> List[Case]:
+    """Rutas medidas. Las que modifican o borran usan un ticket distinto en cada iteración."""
+    item_ids = seeded["item_ids"]
+    # Los últimos tickets se reservan para DELETE
+    deletable, item_ids = item_ids[-requests:], item_ids[:-requests]
+
+    def item_id(i: int) -> int:
+        return item_ids[(i * 7919) % len(item_ids)]
+
+    def get(path: str, **params: Any) -> Callable[[int], Tuple[str, str, Dict[str, Any]]]:
+        return lambda i: ("GET", path, {"params": params, "headers": headers})
+
+    return [
+        Case("POST /items/", lambda i: ("POST", "/items/", {
+            "json": {"name": f"Nuevo {i}", "reported_user": seeded["user"]}, "headers": headers,
+        }), 201),
+        Case("GET /items/", get("/items/", limit=100)),
+        Case("GET /items/ (filtros)", get("/items/", status="IN_PROGRESS", reported_user=seeded["user"],
+                                           sort="-creation_date", limit=100)),
+        Case("GET /items/ (cursor)", get("/items/", cursor="", limit=100)),
+        Case("GET /items/stats", get("/items/stats")),
+        Case("GET /items/{id}", lambda i: ("GET", f"/items/{item_id(i)}", {"headers": headers})),
+        Case("PUT /items/{id}", lambda i: ("PUT", f"/items/{item_id(i)}", {
+            "json": {"name": f"Editado {i}", "reported_user": seeded["user"]}, "headers": headers,
+        })),
+        Case("PATCH /items/{id}/status", lambda i: ("PATCH", f"/items/{item_id(i)}/status", {
+            "params": {"status": "RESOLVED" if i % 2 else "IN_PROGRESS"}, "headers": headers,
+        })),
+        Case("DELETE /items/{id}", lambda i: ("DELETE", f"/items/{deletable[i % len(deletable)]}", {
+            "headers": headers,
+        }), 204),
+        Case("GET /items/statuses/", get("/items/statuses/")),
+        Case("POST /auth/register", lambda i: ("POST", "/auth/register", {
+            "json": {"email": f"new{i}-{time.time_ns()}@bench.example.com", "password": PASSWORD},
+        }), 201),
+        Case("POST /auth/login", lambda i: ("POST", "/auth/login", {
+            "data": {"username": seeded["user"], "password": PASSWORD},
+        })),
+        Case("GET /auth/me", get("/auth/me")),
+    ]
+
+
+def run_case(client, case: Case, requests: int, warmup: int) -> Measurement:
+    """Ejecuta ``warmup`` + ``requests`` peticiones y mide latencia y sentencias por petición."""
+    from app.infrastructure.monitoring.query_stats import observe_queries
+
+    latencies: List[float] = []
+    max_statements = 0
+    for i in range(warmup + requests):
+        method, path, kwargs = case.request(i)
+        with observe_queries(keep_statements=False) as stats:
+            started = time.perf_counter()
+            response = client.request(method, path, **kwargs)
+            elapsed = time.perf_counter() - started
+        if response.status_code != case.expected_status:
+            raise RuntimeError(f"{case.name}: {response.status_code} {response.text[:200]}")
+        if i >= warmup:
+            latencies.append(elapsed * 1000)
+            max_statements = max(max_statements, stats.count)
+    return Measurement(case.name, percentile(latencies, 0.5), percentile(latencies, 0.99), max_statements)
+
+
+def find_regressions(
+    results: List[Measurement],
+    baseline: Dict[str, Any],
+    latency_tolerance: float,
+    latency_floor_ms: float,
+    query_tolerance: int = 0
+) -> List[str]:
+    """Descripción de cada métrica que empeora respecto a la línea base."""
+    regressions = []
+    routes = baseline.get("routes", {})
+    for result in results:
+        base = routes.get(result.name)
+        if base is None:
+            continue
+        if result.queries > base["queries"] + query_tolerance:
+            regressions.append(f"{result.name}: {result.queries} sentencias SQL (base {base['queries']})")
+        for metric in ("p50_ms", "p99_ms"):
+            value, reference = getattr(result, metric), base[metric]
+            if value > reference * (1 + latency_tolerance) and value - reference > latency_floor_ms:
+                regressions.append(f"{result.name}: {metric} {value:.2f} ms (base {reference:.2f} ms)")
+    return regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--users", type=int, default=50)
+    parser.add_argument("--items", type=int, default=5000)
+    parser.add_argument("--requests", type=int, default=200, help="peticiones medidas por ruta")
+    parser.add_argument("--warmup", type=int, default=10)
+    parser.add_argument("--database-url", help="base de datos vacía (por defecto, SQLite en un directorio temporal)")
+    parser.add_argument("--only", action="append", default=[], help="medir solo las rutas que contengan este texto")
+    parser.add_argument("--baseline", type=Path, default=BASELINE_PATH)
+    parser.add_argument("--check", action="store_true", help="termina con código 1 si hay regresiones")
+    parser.add_argument("--update-baseline", action="store_true")
+    parser.add_argument("--latency-tolerance", type=float, default=0.5, help="empeoramiento relativo admitido")
+    parser.add_argument("--latency-floor-ms", type=float, default=1.0, help="empeoramiento absoluto ignorado")
+    args = parser.parse_args()
+    if args.items <= 2 * (args.warmup + args.requests):
+        parser.error("--items debe superar el doble de --warmup + --requests")
+
+    for name, value in BENCHMARK_ENV.items():
+        os.environ.setdefault(name, value)
+    os.environ["DATABASE_URL"] = args.database_url or f"sqlite:///{tempfile.mkdtemp()}/bench.db"
+
+    from fastapi.testclient import TestClient
+
+    from app.infrastructure.database.session import get_engine
+    from app.interfaces.api.main import app
+
+    engine = get_engine()
+    seeded = seed(engine, args.users, args.items)
+    config = {"users": args.users, "items": args.items, "backend": engine.dialect.name,
+              **{name: os.environ[name] for name in BENCHMARK_ENV}}
+
+    with TestClient(app) as client:
+        login = client.post("/auth/login", data={"username": seeded["admin"], "password": PASSWORD})
+        headers = {"Authorization": f"Bearer {login.json()['access_token']}"}
+        cases = build_cases(seeded, headers, args.warmup + args.requests)
+        if args.only:
+            cases = [case for case in cases if any(text in case.name for text in args.only)]
+        results = []
+        print(f"{'ruta':<28} {'p50 ms':>8} {'p99 ms':>8} {'SQL':>4}")
+        for case in cases:
+            result = run_case(client, case, args.requests, args.warmup)
+            results.append(result)
+            print(f"{result.name:<28} {result.p50_ms:8.2f} {result.p99_ms:8.2f} {result.queries:4d}")
+
+    if args.update_baseline:
+        args.baseline.parent.mkdir(parents=True, exist_ok=True)
+        previous = json.loads(args.baseline.read_text()) if args.baseline.exists() else {}
+        routes = {**previous.get("routes", {}), **{result.name: result.as_dict() for result in results}}
+        args.baseline.write_text(json.dumps({"config": config, "routes": routes}, indent=2, ensure_ascii=False) + "\n")
+        print(f"Línea base guardada en {args.baseline}")
+
+    if args.check:
+        if not args.baseline.exists():
+            sys.exit(f"No existe la línea base {args.baseline}")
+        baseline = json.loads(args.baseline.read_text())
+        if baseline.get("config") != config:
+            print(f"Aviso: configuración distinta de la línea base {baseline.get('config')}")
+        regressions = find_regressions(results, baseline, args.latency_tolerance, args.latency_floor_ms)
+        for regression in regressions:
+            print(f"REGRESIÓN {regression}")
+        if regressions:
+            sys.exit(1)
+        print("Sin regresiones respecto a la línea base")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""
+Coste por item de serializar una página de items.
+
+Compara la ruta anterior (schema Pydantic validado en el conversor y
+revalidado por FastAPI contra ``response_model``) con la actual
+(diccionario construido desde el dominio + orjson).
+
+Uso: ``python -m benchmarks.bench_item_serialization [--items 100] [--repeat 200]``
+"""
+import argparse
+import timeit
+from datetime import datetime
+
+import orjson
+from pydantic import TypeAdapter
+
+from app.domain.entities.item import Item as DomainItem
+from app.domain.entities.item_status import ItemStatus as DomainItemStatus
+from app.interfaces.api.converters import domain_item_to_dict
+from app.interfaces.schemas.item_schemas import Item as ItemSchema, ItemStatus as ItemStatusSchema
+
+
+def make_items(count: int):
+    """Página de items de dominio con su estado cargado."""
+    status = DomainItemStatus(id=1, status="IN_PROGRESS")
+    now = datetime(2026, 10, 18, 12, 0, 0, 123456)
+    return [
+        DomainItem(
+            id=i,
+            name=f"Ticket {i}",
+            description="Descripción del ticket " * 4,
+            ticket_url=f"https://tickets.example.com/{i}",
+            publication_url=None,
+            reported_user=f"user{i % 50}",
+            creation_date=now,
+            status_id=1,
+            updated_at=now,
+            version=3,
+            status=status,
+        )
+        for i in range(count)
+    ]
+
+
+def validated_schema(domain_item: DomainItem) -> ItemSchema:
+    """Conversor anterior: construye el schema validando cada campo."""
+    return ItemSchema(
+        id=domain_item.id,
+        name=domain_item.name,
+        description=domain_item.description,
+        ticket_url=domain_item.ticket_url,
+        publication_url=domain_item.publication_url,
+        reported_user=domain_item.reported_user,
+        creation_date=domain_item.creation_date,
+        status_id=domain_item.status_id,
+        updated_at=domain_item.updated_at,
+        version=domain_item.version,
+        status_rel=ItemStatusSchema(id=domain_item.status.id, status=domain_item.status.status),
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--items", type=int, default=100)
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+
+    items = make_items(args.items)
+    page_adapter = TypeAdapter(list[ItemSchema])
+
+    def before() -> bytes:
+        # FastAPI valida el valor devuelto contra response_model y lo vuelca a JSON
+        page = [validated_schema(item) for item in items]
+        return page_adapter.dump_json(page_adapter.validate_python(page, from_attributes=True))
+
+    def after() -> bytes:
+        return orjson.dumps([domain_item_to_dict(item) for item in items])
+
+    assert orjson.loads(before()) == orjson.loads(after()), "Las dos rutas deben producir el mismo JSON"
+
+    for name, func in (("antes", before), ("después", after)):
+        best = min(timeit.repeat(func, number=args.repeat, repeat=5))
+        per_item_us = best / args.repeat / args.items * 1e6
+        print(f"{name:>8}: {per_item_us:6.2f} µs/item ({args.items} items x {args.repeat})")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,23 +1,38 @@
 import os
 import sys
 import tempfile
+from contextlib import contextmanager
 
 import pytest
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
 
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
+from app.domain.entities.user import User
 from app.infrastructure.database.base import Base
+from app.infrastructure.database.models import ItemStatus
 from app.infrastructure.database.session import get_db
+from app.infrastructure.monitoring.query_stats import install_query_listeners, observe_queries
+from app.interfaces.api.dependencies import get_current_active_user
 from app.interfaces.api.main import app
 
 
 @pytest.fixture(scope='session')
 def engine():
-    # Use in-memory SQLite for tests
-    engine = create_engine('sqlite:///:memory:', connect_args={"check_same_thread": False})
+    # Use in-memory SQLite for tests; StaticPool shares the single connection
+    # between the test thread and the threadpool that runs sync routes.
+    engine = create_engine(
+        'sqlite:///:memory:',
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    install_query_listeners(engine)
     Base.metadata.create_all(bind=engine)
+    with sessionmaker(bind=engine)() as session:
+        session.add_all([ItemStatus(status='IN_PROGRESS'), ItemStatus(status='RESOLVED')])
+        session.commit()
     return engine
 
 
@@ -32,15 +47,61 @@ def db_session(engine):
 
 
 @pytest.fixture()
-def client(db_session, monkeypatch):
+def query_budget():
+    """
+    Falla si el bloque ejecuta más de ``max_queries`` sentencias SQL::
+
+        with query_budget(2):
+            client.get('/items/')
+    """
+    @contextmanager
+    def budget(max_queries):
+        with observe_queries() as stats:
+            yield stats
+        assert stats.count <= max_queries, (
+            f"{stats.count} sentencias SQL (presupuesto {max_queries}):\n" + "\n".join(stats.statements)
+        )
+    return budget
+
+
+@pytest.fixture()
+def current_user():
+    return User(id=1, email='admin@example.com', role='admin', is_active=True)
+
+
+@pytest.fixture()
+def client(db_session, current_user):
+    def override_get_db():
+        try:
+            yield db_session
+        finally:
+            pass
+
+    app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_current_active_user] = lambda: current_user
+    from fastapi.testclient import TestClient
+
+    try:
+        with TestClient(app) as c:
+            yield c
+    finally:
+        app.dependency_overrides.clear()
+
+
+@pytest.fixture()
+def auth_client(db_session):
+    # No current_user override: routes validate the real token
     def override_get_db():
         try:
             yield db_session
         finally:
             pass
 
-    monkeypatch.setattr('app.infrastructure.database.session.get_db', override_get_db)
+    app.dependency_overrides[get_db] = override_get_db
     from fastapi.testclient import TestClient
 
-    with TestClient(app) as c:
-        yield c
+    try:
+        with TestClient(app) as c:
+            yield c
+    finally:
+        app.dependency_overrides.clear()
@@ -0,0 +1,206 @@
+import pytest
+from sqlalchemy import create_engine, exc, text
+
+from app.infrastructure.database.pool_metrics import instrumented_pool_class, pool_status
+
+
+def test_db_pool_stats_endpoint(client):
+    resp = client.get('/admin/db-pool')
+    assert resp.status_code == 200
+    primary = resp.json()[0]
+    assert primary['engine'] == 'primary'
+    assert 'checkout_wait_seconds' in primary
+
+
+def test_instrumented_pool_records_waits_and_timeouts(tmp_path):
+    engine = create_engine(
+        f"sqlite:///{tmp_path / 'pool.db'}",
+        poolclass=instrumented_pool_class('test-pool'),
+        pool_size=1,
+        max_overflow=0,
+        pool_timeout=0.05,
+    )
+    with engine.connect() as conn:
+        conn.execute(text('SELECT 1'))
+        with pytest.raises(exc.TimeoutError):
+            engine.connect()
+        status = pool_status('test-pool', engine)
+        assert status['checked_out'] == 1
+        assert status['max_overflow'] == 0
+
+    # Pool.recreate() (dispose) keeps the configured overflow
+    engine.dispose()
+    assert pool_status('test-pool', engine)['max_overflow'] == 0
+
+    assert status['timeouts'] == 1
+    assert status['checkout_wait_seconds']['count'] == 2
+
+
+def test_metrics_endpoint_reports_red_metrics_by_route_template(client):
+    item_id = client.post('/items/', json={'name': 'Metrics'}).json()['id']
+    client.get(f'/items/{item_id}')
+    client.get('/items/999999')
+
+    resp = client.get('/metrics')
+    assert resp.status_code == 200
+    assert resp.headers['content-type'].startswith('text/plain; version=0.0.4')
+    body = resp.text
+    assert '# TYPE http_requests_total counter' in body
+    assert 'http_requests_total{method="GET",route="/items/{item_id}",status_class="2xx"}' in body
+    assert 'http_requests_total{method="GET",route="/items/{item_id}",status_class="4xx"}' in body
+    assert f'route="/items/{item_id}"' not in body
+    assert 'http_request_duration_seconds_bucket{method="POST",route="/items/",le="+Inf"}' in body
+    assert 'http_requests_in_flight{method="GET",route="/metrics"} 1' in body
+    assert '# TYPE db_pool_checked_out gauge' in body
+    assert '# TYPE auth_principal_cache_hits_total counter' in body
+
+
+def test_metrics_multiprocess_aggregation(tmp_path):
+    import json
+    from app.infrastructure.monitoring.metrics import MetricsRegistry
+
+    registry = MetricsRegistry(multiprocess_dir=str(tmp_path))
+    requests = registry.counter('requests_total', 'Peticiones', ('route',))
+    in_flight = registry.gauge('in_flight', 'En curso')
+    latency = registry.histogram('latency_seconds', 'Latencia', buckets=(0.1, 1.0))
+    requests.inc(('/items/',), 2)
+    in_flight.inc()
+    latency.observe((), 0.05)
+
+    # Otro worker ya terminado: cuentan sus contadores e histogramas, no sus gauges
+    other = MetricsRegistry()
+    other.counter('requests_total', 'Peticiones', ('route',)).inc(('/items/',), 3)
+    other.gauge('in_flight', 'En curso').inc((), 5)
+    other.histogram('latency_seconds', 'Latencia', buckets=(0.1, 1.0)).observe((), 0.5)
+    dead_pid = 2 ** 22 + 1
+    (tmp_path / f'{dead_pid}.json').write_text(json.dumps({'pid': dead_pid, 'metrics': other.snapshot()}))
+
+    body = registry.render()
+    assert 'requests_total{route="/items/"} 5' in body
+    assert 'in_flight 1' in body
+    assert 'latency_seconds_bucket{le="0.1"} 1' in body
+    assert 'latency_seconds_bucket{le="1.0"} 2' in body
+    assert 'latency_seconds_count 2' in body
+
+
+def test_profiled_requests_listed_and_downloaded(client, monkeypatch, tmp_path):
+    from fastapi.testclient import TestClient
+    from app.infrastructure.monitoring.profiler import ProfileStore
+    from app.infrastructure.security.jwt_handler import create_access_token
+    from app.interfaces.api.main import app
+    from app.interfaces.api.profiling import ProfilingMiddleware
+    from app.interfaces.api.routes import admin
+
+    store = ProfileStore(str(tmp_path), max_files=2)
+    monkeypatch.setattr(admin, 'profile_store', store)
+    profiled = TestClient(ProfilingMiddleware(app, sample_rate=0, allow_header=True, store=store))
+
+    user_token = create_access_token({'sub': 'user@example.com', 'role': 'user'})
+    resp = profiled.get('/items/', headers={'X-Profile': '1', 'Authorization': f'Bearer {user_token}'})
+    assert 'X-Profile-Id' not in resp.headers
+
+    admin_token = create_access_token({'sub': 'admin@example.com', 'role': 'admin'})
+    names = []
+    for _ in range(3):
+        resp = profiled.get('/items/', headers={'X-Profile': '1', 'Authorization': f'Bearer {admin_token}'})
+        assert resp.status_code == 200
+        names.append(resp.headers['X-Profile-Id'])
+
+    # Anillo de dos perfiles: el primero se ha borrado
+    listed = client.get('/admin/profiles').json()
+    assert [profile['name'] for profile in listed] == names[:0:-1]
+
+    download = client.get(f'/admin/profiles/{names[-1]}')
+    assert download.status_code == 200
+    for line in download.text.splitlines():
+        stack, count = line.rsplit(' ', 1)
+        assert int(count) > 0 and stack
+    assert client.get(f'/admin/profiles/{names[0]}').status_code == 404
+    assert client.get('/admin/profiles/..%2F..%2Fetc%2Fpasswd').status_code == 404
+
+
+def test_stack_sampler_records_app_frames():
+    import time
+    from app.infrastructure.monitoring.profiler import StackSampler
+    from app.interfaces.api.converters import domain_item_to_schema
+    from benchmarks.bench_item_serialization import make_items
+
+    # domain_item_to_schema runs pydantic loops, so the GIL can switch to the
+    # sampler while an app frame is on the stack (not only between calls)
+    items = make_items(200)
+    sampler = StackSampler(interval_seconds=0.001).start()
+    deadline = time.monotonic() + 0.2
+    while time.monotonic() < deadline:
+        for item in items:
+            domain_item_to_schema(item)
+    stacks = sampler.stop()
+
+    assert any('domain_item_to_schema (app/interfaces/api/converters.py' in stack for stack in stacks)
+
+
+def test_startup_report_lists_warm_up_phases(client):
+    resp = client.get('/admin/startup')
+    assert resp.status_code == 200
+    report = resp.json()
+    assert report['ready_ms'] > 0
+    for phase in ('engine', 'warm_up', 'password_hashing', 'status_catalog', 'jwt'):
+        assert phase in report['phases_ms']
+
+
+def test_prepare_database_waits_and_checks_schema(tmp_path):
+    from app.infrastructure.database.base import Base
+    from app.infrastructure.database.readiness import DatabaseNotReady, prepare_database, wait_for_database
+
+    with pytest.raises(DatabaseNotReady):
+        wait_for_database(create_engine(f"sqlite:///{tmp_path / 'missing' / 'db.sqlite'}"), timeout=0)
+
+    engine = create_engine(f"sqlite:///{tmp_path / 'ready.db'}")
+    with pytest.raises(DatabaseNotReady, match='alembic_version'):
+        prepare_database(engine, migrate=False)
+    Base.metadata.create_all(bind=engine)
+    with engine.begin() as conn:
+        conn.execute(text('CREATE TABLE alembic_version (version_num VARCHAR(32) NOT NULL)'))
+    prepare_database(engine, migrate=False)
+
+
+def test_connection_budget_splits_pools_across_workers():
+    from app.infrastructure.database.session import budgeted_pool_sizes
+
+    # Sin presupuesto se usan los valores configurados
+    assert budgeted_pool_sizes(0, 8, 1, 5, 10) == (5, 10)
+    # 90 conexiones / (8 workers + 1 de reinicio) = 10 por pool
+    assert budgeted_pool_sizes(90, 8, 1, 5, 10) == (5, 5)
+    # Con dos pools por worker: 5 por pool
+    assert budgeted_pool_sizes(90, 8, 2, 5, 10) == (5, 0)
+    assert budgeted_pool_sizes(20, 8, 2, 5, 10) == (1, 0)
+    with pytest.raises(ValueError):
+        budgeted_pool_sizes(10, 8, 2, 5, 10)
+
+
+def test_launcher_workers_follow_cgroup_cpu_quota(tmp_path):
+    from app.launcher import available_cpus
+
+    cpu_max = tmp_path / 'cpu.max'
+    cpu_max.write_text('max 100000\n')
+    unlimited = available_cpus(str(cpu_max))
+    assert unlimited >= 1
+    cpu_max.write_text('100000 100000\n')
+    assert available_cpus(str(cpu_max)) == 1
+    assert available_cpus(str(tmp_path / 'missing')) == unlimited
+
+
+def test_launcher_aborts_before_workers_if_app_import_fails(monkeypatch, tmp_path):
+    import app.launcher as launcher
+
+    spawned = []
+    monkeypatch.setattr(launcher, 'APP_MODULE', 'app.missing_module')
+    monkeypatch.setattr(launcher, 'DB_PREPARE_ON_STARTUP', False)
+    monkeypatch.setattr(launcher, 'Multiprocess', lambda *args, **kwargs: spawned.append(args))
+    # main() rewrites these for the workers; monkeypatch restores them afterwards
+    monkeypatch.setenv('WEB_CONCURRENCY', '1')
+    monkeypatch.setenv('DB_PREPARE_ON_STARTUP', 'false')
+    monkeypatch.setenv('METRICS_MULTIPROCESS_DIR', str(tmp_path))
+
+    with pytest.raises(SystemExit):
+        launcher.main(['--workers', '2', '--port', '0'])
+    assert spawned == []
@@ -0,0 +1,119 @@
+from app.infrastructure.cache.principal_cache import principal_cache
+from app.infrastructure.database.models import User as SQLAlchemyUser
+
+
+def _login(client, email, password='Aion__2025'):
+    resp = client.post('/auth/register', json={'email': email, 'password': password})
+    assert resp.status_code == 201
+    resp = client.post('/auth/login', data={'username': email, 'password': password})
+    assert resp.status_code == 200
+    return {'Authorization': f"Bearer {resp.json()['access_token']}"}
+
+
+def test_cached_principal_skips_users_table(auth_client, db_session, query_budget):
+    principal_cache.clear()
+    headers = _login(auth_client, 'cached@example.com')
+    assert auth_client.get('/auth/me', headers=headers).status_code == 200
+
+    with query_budget(0):
+        resp = auth_client.get('/auth/me', headers=headers)
+    assert resp.status_code == 200
+
+    # Deactivating the user through the ORM invalidates the cached principal
+    # once the transaction commits (a flush alone keeps it cached)
+    db_user = db_session.query(SQLAlchemyUser).filter_by(email='cached@example.com').one()
+    db_user.is_active = False
+    db_session.flush()
+    assert principal_cache.get('cached@example.com') is not None
+    db_session.commit()
+    assert auth_client.get('/auth/me', headers=headers).status_code == 400
+
+
+def test_login_rehashes_password_with_configured_cost(auth_client, db_session):
+    from passlib.context import CryptContext
+    from app.infrastructure.security.password_handler import BCRYPT_ROUNDS
+
+    email = 'rehash@example.com'
+    old_hash = CryptContext(schemes=['bcrypt'], bcrypt__rounds=4).hash('Aion__2025')
+    db_session.add(SQLAlchemyUser(email=email, hashed_password=old_hash, role='user', is_active=True))
+    db_session.commit()
+
+    resp = auth_client.post('/auth/login', data={'username': email, 'password': 'Aion__2025'})
+    assert resp.status_code == 200
+
+    db_session.expire_all()
+    new_hash = db_session.query(SQLAlchemyUser).filter_by(email=email).one().hashed_password
+    assert new_hash != old_hash
+    assert new_hash.startswith(f'$2b${BCRYPT_ROUNDS:02d}$')
+
+
+def test_hashing_pool_rejects_when_saturated():
+    import threading
+    import pytest
+    from app.infrastructure.security.hashing_pool import HashingPoolSaturated, PasswordHashingPool
+
+    pool = PasswordHashingPool(max_workers=0, queue_size=0, retry_after=3)
+    started, release = threading.Event(), threading.Event()
+
+    def busy():
+        started.set()
+        release.wait(5)
+
+    worker = threading.Thread(target=pool.run, args=(busy,))
+    worker.start()
+    started.wait(5)
+    try:
+        with pytest.raises(HashingPoolSaturated) as exc:
+            pool.run(len, 'x')
+        assert exc.value.retry_after == 3
+        assert pool.stats()['rejected'] == 1
+    finally:
+        release.set()
+        worker.join()
+    assert pool.run(len, 'x') == 1
+
+
+def test_login_rate_limited_per_email(auth_client, monkeypatch):
+    from app.infrastructure.security.rate_limit import MemoryRateLimitStore
+    from app.interfaces.api import rate_limiting
+
+    monkeypatch.setattr(rate_limiting, 'rate_limit_store', MemoryRateLimitStore())
+    monkeypatch.setattr(rate_limiting, 'rate_limit_policies', rate_limiting.build_policies([
+        ('login-email', 'POST', '/auth/login', rate_limiting.BY_LOGIN_EMAIL, '2/60'),
+    ]))
+
+    def attempt(email):
+        return auth_client.post('/auth/login', data={'username': email, 'password': 'wrong-password'})
+
+    first = attempt('Target@example.com')
+    assert first.status_code == 401
+    assert first.headers['RateLimit-Limit'] == '2'
+    assert first.headers['RateLimit-Remaining'] == '1'
+    assert first.headers['RateLimit-Policy'] == '2;w=60'
+    assert attempt('target@example.com').headers['RateLimit-Remaining'] == '0'
+
+    limited = attempt('target@example.com')
+    assert limited.status_code == 429
+    assert limited.headers['Retry-After'] == '30'
+    assert limited.headers['RateLimit-Remaining'] == '0'
+    # Other accounts and routes without a policy are not affected
+    assert attempt('other@example.com').status_code == 401
+    assert 'RateLimit-Limit' not in auth_client.get('/health').headers
+
+
+def test_token_bucket_refills_over_time():
+    from app.infrastructure.security.rate_limit import MemoryRateLimitStore
+
+    now = [0.0]
+    store = MemoryRateLimitStore(max_keys=2, clock=lambda: now[0])
+    assert [store.hit('a', 3, 30).allowed for _ in range(4)] == [True, True, True, False]
+    denied = store.hit('a', 3, 30)
+    assert (denied.remaining, denied.retry_after, denied.reset_seconds) == (0, 10, 30)
+
+    now[0] = 10.0
+    refilled = store.hit('a', 3, 30)
+    assert refilled.allowed and refilled.remaining == 0
+    # Least recently used buckets are dropped beyond max_keys
+    store.hit('b', 3, 30)
+    store.hit('c', 3, 30)
+    assert store.stats()['keys'] == 2
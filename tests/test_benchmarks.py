@@ -0,0 +1,29 @@
+from benchmarks.bench_endpoints import Measurement, find_regressions, percentile
+
+
+def test_percentile_nearest_rank():
+    samples = [float(value) for value in range(1, 101)]
+    assert percentile(samples, 0.5) == 50.0
+    assert percentile(samples, 0.99) == 99.0
+    assert percentile([3.0], 0.99) == 3.0
+
+
+def test_find_regressions_flags_queries_and_latency():
+    baseline = {'routes': {
+        'GET /items/': {'p50_ms': 10.0, 'p99_ms': 20.0, 'queries': 2},
+        'GET /auth/me': {'p50_ms': 0.2, 'p99_ms': 0.4, 'queries': 1},
+    }}
+    results = [
+        Measurement('GET /items/', p50_ms=11.0, p99_ms=35.0, queries=3),
+        # Empeora en proporción pero por debajo del umbral absoluto
+        Measurement('GET /auth/me', p50_ms=0.5, p99_ms=0.9, queries=1),
+        # Sin línea base: no se compara
+        Measurement('GET /items/stats', p50_ms=100.0, p99_ms=100.0, queries=9),
+    ]
+
+    regressions = find_regressions(results, baseline, latency_tolerance=0.5, latency_floor_ms=1.0)
+
+    assert regressions == [
+        'GET /items/: 3 sentencias SQL (base 2)',
+        'GET /items/: p99_ms 35.00 ms (base 20.00 ms)',
+    ]
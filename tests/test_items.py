@@ -1,3 +1,6 @@
+import pytest
+
+
 def test_create_read_update_delete_item(client):
     # Create
     resp = client.post('/items/', json={'name': 'Test', 'description': 'Desc'})
@@ -25,3 +28,508 @@ def test_create_read_update_delete_item(client):
     # Confirm deleted
     resp = client.get(f'/items/{item_id}')
     assert resp.status_code == 404
+
+
+def test_list_items_loads_statuses_in_single_query(client, query_budget):
+    for i in range(5):
+        assert client.post('/items/', json={'name': f'Bulk {i}'}).status_code == 201
+
+    with query_budget(1) as stats:
+        resp = client.get('/items/?limit=100')
+
+    assert resp.status_code == 200
+    assert len(resp.json()) >= 5
+    assert all(item['status_rel']['status'] == 'IN_PROGRESS' for item in resp.json())
+    assert stats.count == 1
+
+
+def test_statuses_served_from_catalog(client, query_budget):
+    from app.infrastructure.cache.status_catalog import status_catalog
+
+    status_catalog.invalidate()
+    assert [s['status'] for s in client.get('/items/statuses/').json()] == ['IN_PROGRESS', 'RESOLVED']
+    version = status_catalog.version
+
+    with query_budget(0):
+        resp = client.get('/items/statuses/')
+
+    assert resp.status_code == 200
+    assert status_catalog.version == version
+
+
+def test_status_catalog_miss_falls_back_to_database(client, db_session, query_budget, monkeypatch):
+    from sqlalchemy import text
+    from app.infrastructure.cache.status_catalog import status_catalog
+
+    client.get('/items/statuses/')
+    # Estado creado sin pasar por el ORM (p. ej. desde otro proceso)
+    db_session.execute(text("INSERT INTO items_status (status) VALUES ('ON_HOLD')"))
+    db_session.commit()
+    try:
+        assert not status_catalog.is_stale()
+        # Just loaded: within the interval a miss does not reload
+        with query_budget(0):
+            assert client.get('/items/', params={'status': 'ON_HOLD'}).status_code == 400
+
+        monkeypatch.setattr(status_catalog, 'miss_reload_seconds', 0)
+        with query_budget(2):
+            resp = client.get('/items/', params={'status': 'ON_HOLD'})
+        assert resp.status_code == 200
+        assert status_catalog.get_by_name('ON_HOLD') is not None
+
+        # Unknown statuses reload at most once per interval
+        monkeypatch.setattr(status_catalog, 'miss_reload_seconds', 60)
+        status_catalog.load(status_catalog.all())
+        for _ in range(3):
+            with query_budget(0):
+                assert client.get('/items/', params={'status': 'UNKNOWN'}).status_code == 400
+    finally:
+        db_session.execute(text("DELETE FROM items_status WHERE status = 'ON_HOLD'"))
+        db_session.commit()
+        status_catalog.invalidate()
+
+
+def test_list_items_cursor_pagination(client):
+    created = [client.post('/items/', json={'name': f'Cursor {i}'}).json()['id'] for i in range(3)]
+
+    seen = []
+    resp = client.get('/items/', params={'cursor': '', 'limit': 2})
+    while True:
+        assert resp.status_code == 200
+        seen.extend(item['id'] for item in resp.json())
+        next_cursor = resp.headers.get('X-Next-Cursor')
+        if next_cursor is None:
+            break
+        resp = client.get('/items/', params={'cursor': next_cursor, 'limit': 2})
+
+    assert len(seen) == len(set(seen))
+    assert set(created) <= set(seen)
+
+    assert client.get('/items/', params={'cursor': 'not-a-cursor'}).status_code == 400
+
+
+def test_bulk_create_items_json_and_ndjson(client):
+    resp = client.post('/items/bulk', json=[{'name': 'Bulk A'}, {'description': 'missing name'}, {'name': 'Bulk B'}])
+    assert resp.status_code == 200
+    report = resp.json()
+    assert (report['created'], report['failed']) == (2, 1)
+    assert [r['ok'] for r in report['results']] == [True, False, True]
+    assert client.get(f"/items/{report['results'][2]['id']}").json()['name'] == 'Bulk B'
+
+    body = '{"name": "Stream 1"}\nnot json\n{"name": "Stream 2"}\n'
+    resp = client.post('/items/bulk', content=body, headers={'Content-Type': 'application/x-ndjson'})
+    report = resp.json()
+    assert (report['created'], report['failed']) == (2, 1)
+    assert report['results'][1] == {'index': 1, 'ok': False, 'id': None, 'error': 'JSON inválido'}
+
+    # Rows the database would reject fail on their own, before the batch
+    resp = client.post('/items/bulk', json=[{'name': 'x' * 129}, {'name': 'Bulk C'}])
+    assert [r['ok'] for r in resp.json()['results']] == [False, True]
+
+
+def test_bulk_create_rejects_unknown_status(db_session):
+    from app.domain.entities.item import Item
+    from app.infrastructure.repositories.item_repository_impl import ItemRepositoryImpl
+
+    items = [Item(name='Known status', status_id=1), Item(name='Unknown status', status_id=999)]
+    with pytest.raises(ValueError, match=r'posiciones \[1\]'):
+        ItemRepositoryImpl(db_session).bulk_create(items)
+
+
+def test_export_items_streams_ndjson_and_csv(client):
+    import json
+
+    item_id = client.post('/items/', json={'name': 'Export me', 'description': 'a,b'}).json()['id']
+    client.patch(f'/items/{item_id}/status', params={'status': 'RESOLVED'})
+
+    resp = client.get('/items/export', params={'status': 'RESOLVED', 'gzip': True})
+    assert resp.status_code == 200
+    assert resp.headers['content-encoding'] == 'gzip'
+    rows = [json.loads(line) for line in resp.text.splitlines()]
+    assert item_id in [row['id'] for row in rows]
+    assert {row['status'] for row in rows} == {'RESOLVED'}
+
+    resp = client.get('/items/export', params={'format': 'csv'})
+    lines = resp.text.splitlines()
+    assert lines[0].startswith('id,name,description')
+    assert any('"a,b"' in line for line in lines[1:])
+
+
+def test_search_items_ranked_and_filtered(client):
+    a = client.post('/items/', json={'name': 'Printer jam', 'description': 'printer on floor 3 jams'}).json()['id']
+    b = client.post('/items/', json={'name': 'VPN down', 'description': 'cannot reach printer share'}).json()['id']
+    client.put(f'/items/{b}', json={'name': 'VPN down', 'description': 'cannot reach printer share'})
+
+    resp = client.get('/items/search', params={'q': 'printer'})
+    assert resp.status_code == 200
+    ids = [item['id'] for item in resp.json()]
+    assert ids.index(a) < ids.index(b)
+
+    client.patch(f'/items/{a}/status', params={'status': 'RESOLVED'})
+    resp = client.get('/items/search', params={'q': 'printer', 'status': 'IN_PROGRESS'})
+    ids = [item['id'] for item in resp.json()]
+    assert b in ids and a not in ids
+
+    assert client.get('/items/search', params={'q': 'printer "share'}).status_code == 200
+
+
+
+def test_search_needs_fts_table_created_by_migration_0005(tmp_path):
+    import importlib.util
+    from pathlib import Path
+    from alembic.migration import MigrationContext
+    from alembic.operations import Operations
+    from sqlalchemy import create_engine
+    from sqlalchemy.orm import Session
+    from app.domain.entities.item import Item
+    from app.domain.entities.item_filters import ItemFilters
+    from app.infrastructure.database.base import Base
+    from app.infrastructure.database.models import ItemStatus
+    from app.infrastructure.repositories.item_repository_impl import ItemRepositoryImpl
+
+    path = next((Path(__file__).parent.parent / 'alembic' / 'versions').glob('0005_*.py'))
+    spec = importlib.util.spec_from_file_location('migration_0005', path)
+    migration = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(migration)
+
+    engine = create_engine(f"sqlite:///{tmp_path / 'fts.db'}")
+    Base.metadata.create_all(engine)
+    with engine.begin() as conn:
+        # As if the schema came from migrations before 0005
+        with Operations.context(MigrationContext.configure(conn)):
+            migration.downgrade()
+    with Session(engine) as session:
+        session.add(ItemStatus(status='IN_PROGRESS'))
+        session.commit()
+        repo = ItemRepositoryImpl(session)
+        item_id = repo.create(Item(name='Printer jam', description='paper')).id
+
+        with pytest.raises(ValueError, match='items_fts'):
+            repo.search('printer', ItemFilters())
+
+        session.rollback()
+        with engine.begin() as conn:
+            with Operations.context(MigrationContext.configure(conn)):
+                migration.upgrade()
+        assert [item.id for item in repo.search('printer', ItemFilters())] == [item_id]
+    engine.dispose()
+
+def test_list_items_filters_and_sort(client):
+    ids = [
+        client.post('/items/', json={'name': f'Filter {i}', 'reported_user': 'filter-user'}).json()['id']
+        for i in range(3)
+    ]
+    client.patch(f'/items/{ids[0]}/status', params={'status': 'RESOLVED'})
+
+    resp = client.get('/items/', params={'reported_user': 'filter-user', 'status': 'IN_PROGRESS', 'sort': '-id'})
+    assert resp.status_code == 200
+    assert [item['id'] for item in resp.json()] == [ids[2], ids[1]]
+
+    resp = client.get('/items/', params={'reported_user': 'filter-user', 'cursor': '', 'sort': '-creation_date', 'limit': 1})
+    assert resp.json()[0]['id'] == ids[2]
+    resp = client.get('/items/', params={
+        'reported_user': 'filter-user', 'cursor': resp.headers['X-Next-Cursor'], 'sort': '-creation_date', 'limit': 5,
+    })
+    assert [item['id'] for item in resp.json()] == [ids[1], ids[0]]
+
+    assert client.get('/items/', params={'sort': 'description'}).status_code == 400
+    assert client.get('/items/', params={'cursor': '', 'sort': 'name'}).status_code == 400
+    assert client.get('/items/', params={'status': 'UNKNOWN'}).status_code == 400
+
+
+def test_item_stats_follow_writes_and_rebuild(client, db_session):
+    from sqlalchemy import func, select, update
+    from app.infrastructure.database.models import Item as ItemModel, ItemCounter
+    from app.infrastructure.repositories.item_repository_impl import ItemRepositoryImpl
+
+    def by_status():
+        return {row['status']: row['count'] for row in client.get('/items/stats').json()['by_status']}
+
+    def reporter_count(name):
+        rows = client.get('/items/stats', params={'reporter_limit': 1000}).json()['by_reporter']
+        return next((row['count'] for row in rows if row['reported_user'] == name), 0)
+
+    before = by_status()
+    ids = [client.post('/items/', json={'name': f'Stat {i}', 'reported_user': 'stats-user'}).json()['id'] for i in range(3)]
+    client.post('/items/bulk', json=[{'name': 'Stat bulk', 'reported_user': 'stats-user'}])
+    client.patch(f'/items/{ids[0]}/status', params={'status': 'RESOLVED'})
+    client.delete(f'/items/{ids[1]}')
+
+    after = by_status()
+    assert after['IN_PROGRESS'] == before['IN_PROGRESS'] + 2
+    assert after['RESOLVED'] == before['RESOLVED'] + 1
+    assert reporter_count('stats-user') == 4 - 1
+
+    # Desviación artificial que la reconstrucción corrige
+    db_session.execute(update(ItemCounter).values(item_count=0))
+    db_session.commit()
+    assert reporter_count('stats-user') == 0
+    stats = ItemRepositoryImpl(db_session).rebuild_stats()
+    assert stats.total == db_session.scalar(select(func.count()).select_from(ItemModel))
+    assert reporter_count('stats-user') == 3
+    assert by_status() == after
+
+
+def test_writes_use_returning_statements(client, query_budget):
+    item_id = client.post('/items/', json={'name': 'Returning'}).json()['id']
+    client.get('/items/statuses/')  # catálogo de estados cargado
+
+    with query_budget(2) as update:
+        resp = client.put(f'/items/{item_id}', json={'name': 'Returned', 'description': 'D'})
+    assert resp.json()['status_rel']['status'] == 'IN_PROGRESS'
+
+    resp = client.patch(f'/items/{item_id}/status', params={'status': 'RESOLVED'})
+    assert resp.json()['status_rel']['status'] == 'RESOLVED'
+
+    with query_budget(2) as delete:
+        assert client.delete(f'/items/{item_id}').status_code == 204
+
+    # SQLite lee los valores previos aparte; en PostgreSQL van en el UPDATE
+    # Sin cambios de estado ni reportante no se tocan los contadores
+    assert [s.split()[0] for s in update.statements] == ['SELECT', 'UPDATE']
+    assert 'RETURNING' in update.statements[1]
+    assert [s.split()[0] for s in delete.statements] == ['DELETE', 'INSERT']
+    assert client.put(f'/items/{item_id}', json={'name': 'Gone'}).status_code == 404
+    assert client.patch(f'/items/{item_id}/status', params={'status': 'RESOLVED'}).status_code == 404
+    assert client.delete(f'/items/{item_id}').status_code == 404
+
+
+def test_bulk_status_transition(client, current_user):
+    ids = [client.post('/items/', json={'name': f'Close {i}', 'reported_user': 'incident-7'}).json()['id'] for i in range(3)]
+    before = {row['status']: row['count'] for row in client.get('/items/stats').json()['by_status']}
+
+    resp = client.patch('/items/bulk/status', json={'status': 'RESOLVED', 'ids': [ids[0], ids[1], 999999]})
+    assert resp.status_code == 200
+    assert resp.json() == {'status': 'RESOLVED', 'updated': ids[:2], 'not_found': [999999]}
+
+    resp = client.patch('/items/bulk/status', json={
+        'status': 'RESOLVED', 'filter': {'reported_user': 'incident-7', 'status': 'IN_PROGRESS'},
+    })
+    assert resp.json()['updated'] == [ids[2]]
+    after = {row['status']: row['count'] for row in client.get('/items/stats').json()['by_status']}
+    assert after['RESOLVED'] == before['RESOLVED'] + 3
+    assert after['IN_PROGRESS'] == before['IN_PROGRESS'] - 3
+
+    assert client.patch('/items/bulk/status', json={'status': 'RESOLVED', 'filter': {}}).status_code == 422
+    assert client.patch('/items/bulk/status', json={'status': 'CLOSED', 'ids': [ids[0]]}).status_code == 400
+    current_user.role = 'user'
+    assert client.patch('/items/bulk/status', json={'status': 'RESOLVED', 'ids': ids}).status_code == 403
+
+
+def test_conditional_get_and_if_match(client):
+    item_id = client.post('/items/', json={'name': 'Conditional', 'reported_user': 'etag-user'}).json()['id']
+
+    resp = client.get(f'/items/{item_id}')
+    etag, modified = resp.headers['ETag'], resp.headers['Last-Modified']
+    assert etag == f'"{item_id}-1"'
+    assert client.get(f'/items/{item_id}', headers={'If-None-Match': etag}).status_code == 304
+    resp = client.get(f'/items/{item_id}', headers={'If-Modified-Since': modified})
+    assert resp.status_code == 304
+    assert resp.content == b''
+
+    page = client.get('/items/', params={'reported_user': 'etag-user'})
+    list_tag = page.headers['ETag']
+    assert 'Last-Modified' not in page.headers
+    assert client.get('/items/', params={'reported_user': 'etag-user'}, headers={'If-None-Match': list_tag}).status_code == 304
+    assert client.get('/items/', params={'reported_user': 'etag-user'}, headers={'If-Modified-Since': modified}).status_code == 200
+
+    # PUT con la ETag vigente actualiza; con una antigua responde 412
+    resp = client.put(f'/items/{item_id}', json={'name': 'Changed', 'reported_user': 'etag-user'}, headers={'If-Match': etag})
+    assert resp.status_code == 200
+    assert resp.json()['version'] == 2
+    assert resp.headers['ETag'] == f'"{item_id}-2"'
+    resp = client.put(f'/items/{item_id}', json={'name': 'Lost update', 'reported_user': 'etag-user'}, headers={'If-Match': etag})
+    assert resp.status_code == 412
+    assert client.put('/items/999999', json={'name': 'X'}, headers={'If-Match': '"999999-1"'}).status_code == 404
+
+    assert client.get(f'/items/{item_id}', headers={'If-None-Match': etag}).status_code == 200
+    assert client.get('/items/', params={'reported_user': 'etag-user'}, headers={'If-None-Match': list_tag}).status_code == 200
+
+
+def test_item_reads_served_from_cache_until_write(client, query_budget):
+    item_id = client.post('/items/', json={'name': 'Cached'}).json()['id']
+    client.get(f'/items/{item_id}')
+    client.get('/items/', params={'limit': 5})
+
+    with query_budget(0):
+        assert client.get(f'/items/{item_id}').json()['name'] == 'Cached'
+        assert client.get('/items/', params={'limit': 5}).status_code == 200
+
+    client.put(f'/items/{item_id}', json={'name': 'Cached v2'})
+    with query_budget(1) as stats:
+        assert client.get(f'/items/{item_id}').json()['name'] == 'Cached v2'
+    assert stats.count == 1
+
+    stats = client.get('/admin/item-cache').json()
+    assert stats['backend'] == 'memory'
+    assert stats['hits'] >= 2 and stats['misses'] >= 1
+
+
+def test_redis_read_cache_with_local_stand_in():
+    from datetime import datetime
+    from app.domain.entities.item import Item
+    from app.domain.entities.item_status import ItemStatus
+    from app.infrastructure.cache.read_cache import RedisReadCache
+    from app.infrastructure.repositories.cached_item_repository import decode_cached_value, encode_cached_value
+
+    class StandIn:
+        """Subconjunto de comandos Redis sobre un dict."""
+        def __init__(self):
+            self.data = {}
+
+        def get(self, key):
+            return self.data.get(key)
+
+        def mget(self, keys):
+            return [self.data.get(key) for key in keys]
+
+        def set(self, key, value, ex=None):
+            self.data[key] = str(value).encode()
+
+        def delete(self, key):
+            self.data.pop(key, None)
+
+        def incr(self, key):
+            self.data[key] = str(int(self.data.get(key, b'0')) + 1).encode()
+            return int(self.data[key])
+
+    cache = RedisReadCache(StandIn(), encode_cached_value, decode_cached_value)
+    item = Item(id=1, name='R', creation_date=datetime(2026, 1, 1), updated_at=datetime(2026, 1, 2),
+                status_id=1, status=ItemStatus(id=1, status='IN_PROGRESS'))
+    assert cache.generations(['item:1']) == (0,)
+    cache.put('page', ([item], 'next'))
+    assert cache.get('page') == ([item], 'next')
+    cache.bump('item:1')
+    assert cache.generations(['item:1', 'list']) == (1, 0)
+    assert cache.get('missing') is None
+    assert cache.stats()['hits'] == 1 and cache.stats()['misses'] == 1
+
+    # A value that no longer decodes (e.g. written by another release) is a miss
+    cache.client.data['cache:stale'] = b'{"not": "a cached value"'
+    assert cache.get('stale') is None
+    assert 'cache:stale' not in cache.client.data
+    assert cache.stats()['errors'] == 1
+
+
+def test_fast_item_payload_matches_schema():
+    from datetime import datetime
+    from app.domain.entities.item import Item as DomainItem
+    from app.domain.entities.item_status import ItemStatus as DomainItemStatus
+    from app.interfaces.api.converters import domain_item_to_dict, domain_item_to_schema
+    from app.interfaces.api.responses import FastJSONResponse
+
+    domain_item = DomainItem(id=7, name='Fast', creation_date=datetime(2026, 1, 2, 3, 4, 5, 6),
+                             updated_at=datetime(2026, 1, 2, 3, 4, 5), status_id=2, version=4,
+                             status=DomainItemStatus(id=2, status='RESOLVED'))
+    body = FastJSONResponse(domain_item_to_dict(domain_item)).body
+    assert body == domain_item_to_schema(domain_item).model_dump_json().encode()
+
+
+def _replica_router(monkeypatch, tmp_path):
+    """Primary and one replica on separate SQLite files, routed with a fake clock."""
+    from sqlalchemy import create_engine
+    from sqlalchemy.orm import sessionmaker
+    from app.infrastructure.database import session as session_module
+    from app.infrastructure.database.base import Base
+    from app.infrastructure.database.models import ItemStatus
+    from app.infrastructure.database.replicas import SessionRouter
+    from app.infrastructure.database.session import get_db
+    from app.interfaces.api.main import app
+
+    factories = []
+    for name in ('primary', 'replica'):
+        engine = create_engine(f'sqlite:///{tmp_path / name}.db', connect_args={'check_same_thread': False})
+        Base.metadata.create_all(bind=engine)
+        factory = sessionmaker(bind=engine)
+        with factory() as db:
+            db.add_all([ItemStatus(status='IN_PROGRESS'), ItemStatus(status='RESOLVED')])
+            db.commit()
+        factories.append(factory)
+    now = [1000.0]
+    router = SessionRouter(factories[0], factories[1:], stickiness_seconds=5, secret='test', clock=lambda: now[0])
+    monkeypatch.setattr(session_module, 'session_router', router)
+    app.dependency_overrides.pop(get_db)
+    return factories, router, now
+
+
+def _replicate(factories, item_id):
+    from app.infrastructure.database.models import Item as ItemModel
+
+    with factories[0]() as primary, factories[1]() as replica:
+        replica.merge(primary.get(ItemModel, item_id))
+        replica.commit()
+
+
+def test_reads_routed_to_replica_with_read_your_writes(client, monkeypatch, tmp_path):
+    from app.interfaces.api.routes import items as items_routes
+
+    factories, router, now = _replica_router(monkeypatch, tmp_path)
+    monkeypatch.setattr(items_routes, 'item_read_cache', None)
+
+    # La escritura devuelve el token firmado en cookie y cabecera
+    resp = client.post('/items/', json={'name': 'Primary only'})
+    item_id = resp.json()['id']
+    assert 'db_sticky=' in resp.headers['set-cookie']
+    writer = {'X-DB-Sticky': resp.headers['X-DB-Sticky']}
+    client.cookies.clear()
+
+    # El autor lee su escritura de la primaria (en cualquier worker); el resto, de la réplica
+    assert client.get(f'/items/{item_id}', headers=writer).json()['name'] == 'Primary only'
+    assert client.get(f'/items/{item_id}').status_code == 404
+    forged = {'X-DB-Sticky': writer['X-DB-Sticky'].rpartition('.')[0] + '.' + '0' * 64}
+    assert client.get(f'/items/{item_id}', headers=forged).status_code == 404
+    assert [status['status'] for status in client.get('/items/statuses/').json()] == ['IN_PROGRESS', 'RESOLVED']
+
+    now[0] += 6
+    assert client.get(f'/items/{item_id}', headers=writer).status_code == 404
+    _replicate(factories, item_id)
+    assert client.get('/items/', headers=writer).json()[0]['name'] == 'Primary only'
+
+    stats = router.stats()
+    assert stats['replicas'] == 1 and stats['sticky_reads'] == 1
+    assert stats['replica_reads'] == 5 and stats['sticky_tokens_issued'] == 1
+
+
+def test_replica_reads_with_item_cache_keep_read_your_writes(client, monkeypatch, tmp_path, query_budget):
+    from app.infrastructure.cache.read_cache import ITEM_CACHE_TTL_SECONDS, MemoryReadCache
+    from app.infrastructure.database import session as session_module
+    from app.interfaces.api.routes import items as items_routes
+
+    # Con caché, la ventana del autor cubre también el TTL de las entradas
+    assert session_module.session_router.stickiness_seconds == (
+        session_module.DB_REPLICA_STICKINESS_SECONDS + ITEM_CACHE_TTL_SECONDS
+    )
+    factories, router, now = _replica_router(monkeypatch, tmp_path)
+    monkeypatch.setattr(items_routes, 'item_read_cache', MemoryReadCache())
+
+    item_id = client.post('/items/', json={'name': 'v1'}).json()['id']
+    _replicate(factories, item_id)
+    resp = client.put(f'/items/{item_id}', json={'name': 'v2'})
+    writer = {'X-DB-Sticky': resp.headers['X-DB-Sticky']}
+    client.cookies.clear()
+
+    # Otro cliente lee de la réplica retrasada y cachea el valor antiguo...
+    assert client.get(f'/items/{item_id}').json()['name'] == 'v1'
+    with query_budget(0):
+        assert client.get(f'/items/{item_id}').json()['name'] == 'v1'
+
+    # ...que el autor no ve: lee de la primaria sin pasar por la caché
+    assert client.get(f'/items/{item_id}', headers=writer).json()['name'] == 'v2'
+    assert router.stats()['sticky_reads'] == 1
+
+
+def test_server_timing_and_query_budget(client, query_budget):
+    for index in range(3):
+        client.post('/items/', json={'name': f'Budget {index}'})
+
+    # Sin N+1: la página y sus estados en una sola consulta, sea cual sea su tamaño
+    with query_budget(1) as stats:
+        resp = client.get('/items/', params={'limit': 50, 'sort': '-id'})
+    assert resp.status_code == 200
+    server_timing = resp.headers['Server-Timing']
+    assert server_timing.startswith('db;dur=') and f'desc="{stats.count} SQL"' in server_timing
+    assert 'app;dur=' in server_timing
+
+    with pytest.raises(AssertionError, match='presupuesto 0'):
+        with query_budget(0):
+            client.get('/items/', params={'limit': 50})
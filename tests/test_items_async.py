@@ -0,0 +1,80 @@
+import asyncio
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.pool import NullPool
+
+from app.infrastructure.cache.status_catalog import status_catalog
+from app.infrastructure.database.async_session import get_async_db
+from app.infrastructure.database.base import Base
+from app.infrastructure.database.models import ItemStatus
+from app.interfaces.api.dependencies import get_current_active_user
+from app.interfaces.api.routes import items_async
+
+
+@pytest.fixture()
+def async_client(tmp_path, current_user):
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'async.db'}", poolclass=NullPool)
+    SessionTesting = async_sessionmaker(bind=engine, expire_on_commit=False)
+
+    async def setup():
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+        async with SessionTesting() as session:
+            session.add_all([ItemStatus(status='IN_PROGRESS'), ItemStatus(status='RESOLVED')])
+            await session.commit()
+
+    asyncio.run(setup())
+
+    async def override_get_async_db():
+        async with SessionTesting() as session:
+            yield session
+
+    app = FastAPI()
+    app.include_router(items_async.router)
+    app.dependency_overrides[get_async_db] = override_get_async_db
+    app.dependency_overrides[get_current_active_user] = lambda: current_user
+    status_catalog.invalidate()
+    with TestClient(app) as c:
+        yield c
+    status_catalog.invalidate()
+
+
+def test_async_create_read_update_delete_item(async_client):
+    resp = async_client.post('/items/', json={'name': 'Async', 'description': 'Desc'})
+    assert resp.status_code == 201
+    item_id = resp.json()['id']
+    assert resp.json()['status_rel']['status'] == 'IN_PROGRESS'
+
+    resp = async_client.patch(f'/items/{item_id}/status', params={'status': 'RESOLVED'})
+    assert resp.status_code == 200
+    assert resp.json()['status_rel']['status'] == 'RESOLVED'
+
+    resp = async_client.put(f'/items/{item_id}', json={'name': 'Updated'})
+    assert resp.json()['name'] == 'Updated'
+
+    resp = async_client.get('/items/', params={'cursor': ''})
+    assert [item['id'] for item in resp.json()] == [item_id]
+
+    assert async_client.delete(f'/items/{item_id}').status_code == 204
+    assert async_client.get(f'/items/{item_id}').status_code == 404
+
+
+def test_async_mode_warns_that_item_cache_is_sync_only(monkeypatch, caplog):
+    from app.interfaces.api import main
+
+    monkeypatch.setattr(main, 'is_async_db_enabled', lambda: True)
+    monkeypatch.setattr(main, 'ITEM_CACHE_BACKEND', 'redis')
+    monkeypatch.setenv('ITEM_CACHE_BACKEND', 'redis')
+    with caplog.at_level('WARNING', logger=main.logger.name):
+        main.warn_sync_only_settings()
+    assert 'ITEM_CACHE_BACKEND=redis' in caplog.text
+
+    # Without an explicit backend nothing is being ignored
+    caplog.clear()
+    monkeypatch.delenv('ITEM_CACHE_BACKEND')
+    with caplog.at_level('WARNING', logger=main.logger.name):
+        main.warn_sync_only_settings()
+    assert 'ITEM_CACHE_BACKEND' not in caplog.text